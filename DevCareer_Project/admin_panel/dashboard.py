@@ -7,15 +7,20 @@ import sys
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-import importlib
-import core_engine.prompts
-importlib.reload(core_engine.prompts)
-import core_engine.ai_logic
-importlib.reload(core_engine.ai_logic)
+# Production (default): modules load once per process and the engine is cached per API key.
+# Set DEVCAREER_ENV=development to hot-reload prompts/engine/doc builder on every rerun.
+DEV_MODE = os.getenv("DEVCAREER_ENV", "production").lower() == "development"
+
+if DEV_MODE:
+    import importlib
+    import core_engine.prompts
+    importlib.reload(core_engine.prompts)
+    import core_engine.ai_logic
+    importlib.reload(core_engine.ai_logic)
+    import file_factory.doc_builder
+    importlib.reload(file_factory.doc_builder)
+
 from core_engine.ai_logic import IntelligenceEngine
-from streamlit_quill import st_quill
-import file_factory.doc_builder
-importlib.reload(file_factory.doc_builder)
 from file_factory.doc_builder import create_resume_docx, generate_html_preview, create_resume_docx_from_html
 from file_factory.repo_bundler import create_project_bundle
 from admin_panel.tabs.resume_builder import render_resume_builder
@@ -45,12 +50,45 @@ if not api_key:
     st.warning("Please enter your Gemini API Key in the sidebar to proceed.")
     st.stop()
 
-# @st.cache_resource
-def get_engine(api_key):
+def _build_engine(api_key):
     return IntelligenceEngine(api_key)
 
+# One engine per API key per process (shares its response cache and lazily created model).
+# In development the engine is rebuilt so reloaded modules take effect.
+get_engine = _build_engine if DEV_MODE else st.cache_resource(show_spinner=False)(_build_engine)
+
 engine = get_engine(api_key)
 
+@st.cache_resource(show_spinner=False)
+def _warm_banner_backgrounds():
+    # Once per process, off the request path: load the fonts and (or draw) every banner template background
+    import threading
+    from core_engine.visual_factory import VisualFactory
+
+    def warm():
+        factory = VisualFactory()
+        factory.fonts.preload()
+        factory.warm_backgrounds()
+
+    threading.Thread(target=warm, name="banner-warmup", daemon=True).start()
+
+_warm_banner_backgrounds()
+
+# LLM latency/token metrics: Prometheus scrape endpoint (opt-in) + JSON snapshot in the sidebar
+from core_engine.llm_metrics import METRICS, start_metrics_server
+if os.getenv("DEVCAREER_METRICS_PORT"):
+    start_metrics_server(int(os.getenv("DEVCAREER_METRICS_PORT")))
+with st.sidebar.expander("⏱️ LLM Metrics", expanded=False):
+    st.json(METRICS.snapshot(), expanded=False)
+    st.caption("Identical concurrent calls (coalesced into one upstream call)")
+    st.json(engine.single_flight.get_stats(), expanded=False)
+    st.caption("Uploaded file text (parsed once per file)")
+    st.json(engine.extractor.get_stats(), expanded=False)
+    st.caption("Fonts (discovered and loaded once per process)")
+    from core_engine.font_registry import default_font_registry
+    st.json(default_font_registry().get_stats(), expanded=False)
+    st.download_button("Download (Prometheus)", METRICS.to_prometheus(), "devcareer_metrics.prom", "text/plain")
+
 # Tabs for different modules
 tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "📄 Resume Builder", 
@@ -109,10 +147,6 @@ with tab5:
             with st.spinner("Reading PDF..."):
                 sp_profile_final = engine.parse_pdf(sp_pdf)
         
-        # DEBUG
-        print(f"DEBUG: Project Details: '{sp_project}'")
-        print(f"DEBUG: Profile Final Length: {len(sp_profile_final)}")
-        
         if sp_project and sp_profile_final:
             with st.spinner("Analyzing Profile & Generating Proposal..."):
                 proposal_data = engine.generate_service_page_proposal(sp_project, sp_profile_final)
@@ -172,10 +206,15 @@ with tab4:
                 st.error(li_resume_text)
             else:
                 st.success("✅ File Analyzed Successfully")
+                # Register the resume once; every LinkedIn tool below references it instead of resending it
+                engine.start_resume_session(li_resume_text)
                 # Auto-Extract Logic
                 if 'extracted_file_wizard' not in st.session_state or st.session_state.get('extracted_file_wizard') != li_resume_file.name:
                     with st.spinner("🕵️ Auto-detecting Role & Location..."):
-                        extracted = engine.extract_role_and_stack(li_resume_text)
+                        # One call per uploaded file: role, location and banner copy come back together
+                        # and are reused by the Naukri and Resume Builder tabs for the same file
+                        extracted = engine.understand_resume(li_resume_text, li_resume_file.getvalue())
+                        banner_content = extracted
                         # Update Widget Keys Directly to Force UI Refresh
                         st.session_state['li_role_input'] = extracted.get('role', '')
                         st.session_state['li_stack_input'] = extracted.get('stack', '')
@@ -197,10 +236,6 @@ with tab4:
                                 st.session_state['li_market_select'] = "India"
                             st.session_state['li_region_input'] = loc
                         
-                        # Auto-extract banner content (hook, tagline, LinkedIn URL)
-                        target_role = extracted.get('role', 'Professional')
-                        banner_content = engine.extract_banner_content(li_resume_text, target_role)
-                        
                         # Update banner customization fields
                         if banner_content:
                             st.session_state['custom_hook_input'] = banner_content.get('custom_hook', '')
@@ -541,6 +576,40 @@ with tab4:
             else:
                 st.error("Please upload a Resume and define your Target Role in Step 1 & 2 above.")
 
+    # Side-by-side comparison: all selected templates render concurrently
+    with st.expander("🖼️ Compare Templates Side by Side", expanded=False):
+        compare_keys = st.multiselect(
+            "Templates to compare",
+            list(template_options),
+            default=list(template_options)[:4],
+            format_func=lambda x: template_options[x],
+            key="banner_compare_select"
+        )
+        if st.button("Render Comparison", key="banner_compare_btn") and compare_keys:
+            with st.spinner(f"Rendering {len(compare_keys)} banners..."):
+                from core_engine.visual_factory import VisualFactory
+                vf = VisualFactory()
+                
+                # Decoded straight from memory: no temp file to clean up
+                import io
+                photo = io.BytesIO(vf_profile_photo.getvalue()) if vf_profile_photo else None
+                
+                banners = vf.render_banner_variants(
+                    compare_keys,
+                    as_bytes=True,
+                    custom_hook=custom_hook if custom_hook else None,
+                    custom_tagline=custom_tagline if custom_tagline else None,
+                    profile_photo_path=photo,
+                    portfolio_url=portfolio_url_input,
+                    company_name=company_name_input if company_name_input else None
+                )
+            compare_cols = st.columns(2)
+            for i, (key, banner_png) in enumerate(zip(compare_keys, banners)):
+                with compare_cols[i % 2]:
+                    st.image(banner_png, caption=template_options[key], use_container_width=True)
+                    st.download_button("📥 Download", banner_png, f"LinkedIn_Banner_{key}.png", "image/png",
+                                       key=f"banner_compare_dl_{key}")
+
     st.divider()
     st.subheader("🤖 Algorithmic Dominance (Tech-First Features)")
     st.info("Use Data Science & AI to beat the LinkedIn Algorithm.")
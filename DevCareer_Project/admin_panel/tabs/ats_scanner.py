@@ -1,5 +1,6 @@
 import streamlit as st
 from utils.file_processor import extract_text_from_file
+from core_engine.async_engine import AsyncIntelligenceEngine, run_concurrently
 
 def render_ats_scanner(engine):
     st.header("📊 ATS Scanner & Scorer")
@@ -18,17 +19,13 @@ def render_ats_scanner(engine):
             audit_text = extract_text_from_file(audit_file.getvalue(), audit_file.type)
             
             if st.button("Run Universal Scan"):
-                print("DEBUG: Run Universal Scan button clicked")
                 with st.spinner("Simulating ATS Parsing..."):
-                    # 1. Parsing Simulation
-                    print("DEBUG: Calling simulate_ats_parsing...")
-                    parsed_data = engine.simulate_ats_parsing(audit_text)
-                    print(f"DEBUG: parsed_data result: {parsed_data}")
-                    
-                    # 2. Formatting Audit
-                    print("DEBUG: Calling audit_resume_formatting...")
-                    audit_report = engine.audit_resume_formatting(audit_text)
-                    print("DEBUG: audit_report received")
+                    # 1. Parsing Simulation + 2. Formatting Audit (independent, run concurrently)
+                    async_engine = AsyncIntelligenceEngine(engine)
+                    parsed_data, audit_report = run_concurrently(
+                        async_engine.simulate_ats_parsing(audit_text),
+                        async_engine.audit_resume_formatting(audit_text)
+                    )
                     
                     # Display Results
                     col_p1, col_p2 = st.columns(2)
@@ -56,6 +53,7 @@ def render_ats_scanner(engine):
                 if ats_resume_text.startswith("Error"):
                     st.error(ats_resume_text)
                 else:
+                    engine.start_resume_session(ats_resume_text)
                     # Auto-update text area
                     if 'ats_score_file' not in st.session_state or st.session_state.get('ats_score_file') != ats_resume_file.name:
                         st.session_state['ats_score_input'] = ats_resume_text
@@ -67,9 +65,16 @@ def render_ats_scanner(engine):
         with col2:
             jd_text = st.text_area("Paste Job Description", height=300)
             
-            if st.button("Calculate Match Score"):
+            if ats_resume_text and jd_text:
+                # Deterministic keyword score, recomputed locally on every edit
+                match_data = engine.match_keywords(ats_resume_text, jd_text)
+                st.metric("Keyword Match", f"{match_data['match_score']}/100")
+                st.markdown(f"✅ **Matching:** {', '.join(match_data['matching_keywords']) or '—'}")
+                st.markdown(f"❌ **Missing:** {', '.join(match_data['missing_keywords']) or '—'}")
+            
+            if st.button("Get AI Advice"):
                 if ats_resume_text and jd_text:
-                    with st.spinner("Analyzing against ATS filters..."):
+                    with st.spinner("Writing market-fit advice..."):
                         ats_result = engine.check_ats_score(ats_resume_text, jd_text, ats_market)
                         st.markdown(ats_result)
                 else:
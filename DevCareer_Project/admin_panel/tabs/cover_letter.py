@@ -40,6 +40,7 @@ def render_cover_letter_builder(engine):
                     resume_text = extract_text_from_file(uploaded_file.getvalue(), uploaded_file.type)
             
             st.session_state['cl_resume_text'] = resume_text
+            engine.start_resume_session(resume_text)
 
         with col2:
             st.subheader("Target Role")
@@ -58,13 +59,17 @@ def render_cover_letter_builder(engine):
         st.subheader("Drafting your narrative...")
         
         if 'cl_generated_content' not in st.session_state:
-            with st.spinner("AI is writing your cover letter..."):
-                content = engine.generate_cover_letter(
+            # Show the letter as it is written, then hand the full text to the editor
+            live_preview = st.empty()
+            with live_preview.container():
+                content = st.write_stream(engine.generate_cover_letter(
                     st.session_state['cl_resume_text'], 
                     st.session_state['cl_jd'], 
-                    st.session_state['cl_tone']
-                )
-                st.session_state['cl_generated_content'] = content
+                    st.session_state['cl_tone'],
+                    stream=True
+                ))
+            live_preview.empty()
+            st.session_state['cl_generated_content'] = content
         
         # Editable Preview
         edited_content = st.text_area("Refine Content", value=st.session_state['cl_generated_content'], height=400)
@@ -1,5 +1,186 @@
+import html
+import threading
+
 import streamlit as st
-from datetime import datetime
+
+from core_engine.jd_corpus import JDCorpus, manifest_version
+from core_engine.job_store import JobStore, job_matrix, DEFAULT_MATRIX_DIR
+from utils.file_processor import extract_text_from_file
+
+# --- Sample postings, shown (from memory only) until a real feed has been ingested ---
+JOBS = [
+    # UAE Jobs
+    {"title": "Senior Software Engineer", "company": "Delivery Hero", "location": "United Arab Emirates", "source": "Naukri Gulf", "logo": "🎒", "desc": "Senior Backend Engineer sought to join Growth team in Dubai. Microservices, Go, AWS.", "date": "Nov 21, 2025"},
+    {"title": "Senior Software Engineer", "company": "Property Finder", "location": "United Arab Emirates", "source": "Naukri Gulf", "logo": "🏠", "desc": "Seeking a talented Software Engineer to develop scalable full-stack applications.", "date": "Oct 17, 2025"},
+    {"title": "Senior Software Developer", "company": "Core42", "location": "United Arab Emirates", "source": "Monster.com", "logo": "💻", "desc": "Develop end-to-end web apps using ReactJS and .NET Core.", "date": "Nov 14, 2025"},
+    {"title": "Senior Fullstack Engineer", "company": "Parser Limited", "location": "United Arab Emirates", "source": "Naukri.com", "logo": "KP", "desc": "Design, build, and maintain scalable full-stack applications in Dubai.", "date": "Nov 19, 2025"},
+    {"title": "DevOps Engineer", "company": "Emirates Group", "location": "United Arab Emirates", "source": "Naukri Gulf", "logo": "✈️", "desc": "Manage CI/CD pipelines and cloud infrastructure for airline systems.", "date": "Nov 23, 2025"},
+    {"title": "Product Manager", "company": "Careem", "location": "United Arab Emirates", "source": "Naukri.com", "logo": "🚗", "desc": "Lead the super-app product vision and strategy.", "date": "Nov 20, 2025"},
+    
+    # India Jobs
+    {"title": "Lead Java Developer", "company": "Flipkart", "location": "India", "source": "Naukri.com", "logo": "🛒", "desc": "Leading e-commerce giant seeking Java experts for order processing systems.", "date": "Nov 22, 2025"},
+    {"title": "SDE-II (Backend)", "company": "Swiggy", "location": "India", "source": "Naukri.com", "logo": "🍱", "desc": "Optimize logistics algorithms using Go and Python.", "date": "Nov 20, 2025"},
+    {"title": "Data Scientist", "company": "Ola Electric", "location": "India", "source": "Monster.com", "logo": "🔋", "desc": "Analyze battery telemetry data to improve EV performance.", "date": "Nov 18, 2025"},
+    {"title": "Frontend Engineer", "company": "Razorpay", "location": "India", "source": "Naukri.com", "logo": "💳", "desc": "Build seamless payment checkout experiences using React.", "date": "Nov 15, 2025"},
+    {"title": "Cloud Architect", "company": "TCS", "location": "India", "source": "Monster.com", "logo": "☁️", "desc": "Architect enterprise cloud solutions on Azure and AWS.", "date": "Nov 24, 2025"},
+    {"title": "AI Researcher", "company": "Google India", "location": "India", "source": "Naukri.com", "logo": "🧠", "desc": "Research and develop next-gen LLM applications.", "date": "Nov 21, 2025"},
+    {"title": "Mobile Developer", "company": "Zomato", "location": "India", "source": "Naukri.com", "logo": "🍅", "desc": "Build the next generation of food delivery mobile apps.", "date": "Nov 19, 2025"},
+    
+    # Remote Jobs
+    {"title": "Senior Python Dev", "company": "Automattic", "location": "Remote", "source": "Monster.com", "logo": "W", "desc": "Work on WordPress.com backend systems from anywhere.", "date": "Nov 23, 2025"},
+    {"title": "Go Engineer", "company": "Doist", "location": "Remote", "source": "Naukri.com", "logo": "✅", "desc": "Build productivity tools for millions of users.", "date": "Nov 21, 2025"}
+]
+
+ITEMS_PER_PAGE = 5
+BEST_MATCHES = 10
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_store():
+    # One connection per process. Feeds are loaded with `python -m core_engine.job_store FEED SOURCE`.
+    return JobStore()
+
+
+@st.cache_resource(show_spinner=False)
+def _demo_job_store():
+    # The sample postings live in memory only, so they never end up next to real feeds on disk
+    store = JobStore(":memory:")
+    store.ingest(JOBS)
+    return store
+
+
+@st.cache_resource(show_spinner=False)
+def _demo_job_matrix():
+    ids = []
+    texts = (ids.append(job_id) or text for job_id, text in _demo_job_store().iter_texts())
+    return JDCorpus.build(texts, ids=ids)
+
+
+def _active_store():
+    """
+    (store, is_demo): the persistent store once any feed has been ingested, else the sample postings.
+    """
+    store = get_job_store()
+    if store.has_jobs():
+        return store, False
+    return _demo_job_store(), True
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_job_matrix(version):
+    # Keyed on the saved manifest's version so a finished rebuild is picked up; the arrays
+    # are memory-mapped, so all workers share one copy
+    return JDCorpus.load(DEFAULT_MATRIX_DIR)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _rebuild_job_matrix(stamp):
+    # Once per store stamp per process, off the request path (like the dashboard warm-up)
+    thread = threading.Thread(target=job_matrix, args=(get_job_store(),), name="job-matrix", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_job_matrix():
+    """
+    Newest saved job matrix, or None before the first build finishes. When the store has
+    new postings the matrix is rebuilt in the background and the previous one is served.
+    """
+    corpus = _load_job_matrix(manifest_version(DEFAULT_MATRIX_DIR))
+    stamp = get_job_store().stamp()
+    if corpus is None or corpus.stamp != stamp:
+        _rebuild_job_matrix(stamp)
+    return corpus
+
+
+def _facet_label(value, counts):
+    return f"{value} ({counts.get(value, 0)})"
+
+
+def _resume_input():
+    with st.expander("📄 Your Resume (for job matching)", expanded=not st.session_state.get("job_resume_text")):
+        resume_file = st.file_uploader("Upload Resume (PDF/DOCX)", type=["pdf", "docx"], key="job_resume_uploader")
+        if resume_file is not None and st.session_state.get("job_resume_file") != resume_file.name:
+            resume_text = extract_text_from_file(resume_file.getvalue(), resume_file.type)
+            if resume_text.startswith("Error"):
+                st.error(resume_text)
+            else:
+                st.session_state["job_resume_text"] = resume_text
+                st.session_state["job_resume_file"] = resume_file.name
+        st.text_area("Or Paste Resume Content", height=150, key="job_resume_text")
+    return st.session_state.get("job_resume_text", "")
+
+
+def _render_match(match):
+    score = match["match_score"]
+    st.metric("Resume Match", f"{score}/100")
+    if score < 70:
+        st.warning("Low Match")
+    else:
+        st.success("Good Match!")
+    st.markdown("**Matching Skills:** " + (", ".join(match["matching_skills"]) or "None"))
+    st.markdown("**Missing Skills:** " + (", ".join(match["missing_skills"]) or "None"))
+
+
+def _render_job_card(job, resume_text, match=None):
+    # Ingested feeds are untrusted text going into unsafe_allow_html
+    card = {key: html.escape(str(value)) for key, value in job.items()}
+    badge = f"<div style='color: #2E74B5; font-weight: bold; font-size: 13px;'>{match['match_score']}% match</div>" if match else ""
+    with st.container():
+        # Enhanced HTML Card
+        st.markdown(f"""<div class="job-card" style="border-left: 4px solid #2E74B5;">
+    <div style="display: flex; justify-content: space-between; align-items: start;">
+        <div style="flex: 1;">
+            <div class="job-title">{card['title']}</div>
+            <div class="company-name">
+                <span style="font-size: 18px; margin-right: 8px;">{card['logo'] or card['company'][:2].upper()}</span> 
+                <span style="color: #FFF;">{card['company']}</span> 
+                <span style="margin: 0 8px; color: #555;">|</span> 
+                {card['location']}
+            </div>
+        </div>
+        <div style="text-align: right;">
+            {badge}
+            <div style="background-color: #333; color: #AAA; padding: 2px 8px; border-radius: 4px; font-size: 11px; display: inline-block; margin-bottom: 5px;">
+                {card['source']}
+            </div>
+            <div style="color: #666; font-size: 12px;">{card['date']}</div>
+        </div>
+    </div>
+    
+    <div style="margin-top: 12px; padding: 10px; background-color: #252526; border-radius: 6px; border: 1px dashed #444;">
+        <div style="color: #DDD; font-size: 13px; line-height: 1.4;">
+            <span style="color: #2E74B5; font-weight: bold;">Role Overview:</span> {card['desc']}
+        </div>
+    </div>
+</div>""", unsafe_allow_html=True)
+        
+        # Action Buttons
+        c_act1, c_act2, c_act3, c_act4 = st.columns([6, 2, 0.5, 0.5])
+        with c_act2:
+            if st.button("TARGET RESUME", key=f"target_{job['id']}", use_container_width=True):
+                targeted = st.session_state.get("job_target") == job["id"]
+                st.session_state["job_target"] = None if targeted else job["id"]
+        with c_act3:
+            st.button("❤️", key=f"save_{job['id']}")
+        with c_act4:
+            st.button("...", key=f"more_{job['id']}")
+
+        if st.session_state.get("job_target") == job["id"]:
+            if not resume_text.strip():
+                st.info("Add your resume above to see how well it matches this job.")
+            else:
+                if match is None:
+                    corpus = get_job_matrix()
+                    row = corpus.rows.get(job["id"]) if corpus is not None else None
+                    if row is not None:
+                        match = corpus.match(resume_text, row)
+                if match is None:
+                    st.info("This job is still being added to the resume-matching index. Try again in a moment.")
+                else:
+                    _render_match(match)
+        
+        st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
 
 def render_job_search():
     st.header("💼 Intelligent Job Search")
@@ -58,121 +239,90 @@ def render_job_search():
     """, unsafe_allow_html=True)
 
     # --- Top Navigation Tabs ---
-    tabs = ["ALL JOBS", "SAVED (0)", "APPLIED (0)", "INTERVIEWING (0)", "REJECTED (0)"]
+    tabs = ["ALL JOBS", "BEST FOR MY RESUME", "SAVED (0)", "APPLIED (0)", "INTERVIEWING (0)", "REJECTED (0)"]
     selected_tab = st.radio("Navigation", tabs, horizontal=True, label_visibility="collapsed")
     
     st.markdown("---")
 
+    store, is_demo = _active_store()
+    if is_demo:
+        st.info("No job feeds loaded yet, so these are sample postings. "
+                "Load a feed with `python -m core_engine.job_store FEED SOURCE`.")
+    resume_text = _resume_input()
+
+    # --- Best Jobs for My Resume (one scoring pass over the whole job matrix) ---
+    if selected_tab == "BEST FOR MY RESUME":
+        if not resume_text.strip():
+            st.info("Upload or paste your resume above to rank every job against it.")
+            return
+        corpus = _demo_job_matrix() if is_demo else get_job_matrix()
+        if corpus is None:
+            st.info("The resume-matching index is being built in the background. Refresh in a moment.")
+            return
+        matches = {m["id"]: m for m in corpus.top_matches(resume_text, top_k=BEST_MATCHES)}
+        st.caption(f"Top {len(matches)} of {len(corpus)} jobs by keyword match")
+        for job in store.get_jobs(matches):
+            _render_job_card(job, resume_text, matches[job["id"]])
+        return
+
     # --- Search & Filter Bar ---
-    c1, c2, c3 = st.columns([3, 2, 1])
+    c1, c2, c3, c4 = st.columns([3, 2, 2, 2])
     with c1:
-        st.text_input("Role", placeholder="Senior Software Engineer", label_visibility="collapsed")
+        query = st.text_input("Role", placeholder="Senior Software Engineer", label_visibility="collapsed")
+    with c4:
+        posted_since = st.date_input("Posted since", value=None, label_visibility="collapsed", format="YYYY-MM-DD")
+    # Location and source are read from their widgets' state so that one search() serves both the
+    # page and the option counts (how many jobs match the query and date with that value selected)
+    locations = ["All Locations"] + store.facet_values("location")
+    sources = ["All Sources"] + store.facet_values("source")
+    if st.session_state.get("job_location") not in locations:
+        st.session_state["job_location"] = "All Locations"
+    if st.session_state.get("job_source") not in sources:
+        st.session_state["job_source"] = "All Sources"
+    selected_loc = st.session_state["job_location"]
+    selected_source = st.session_state["job_source"]
+
+    # --- Pagination Logic (keyset: a stack of cursors, one per page visited) ---
+    filters = {
+        "query": query,
+        "location": None if selected_loc == "All Locations" else selected_loc,
+        "source": None if selected_source == "All Sources" else selected_source,
+        "date_from": posted_since,
+    }
+    if st.session_state.get("job_filters") != filters:
+        st.session_state.job_filters = filters
+        st.session_state.job_cursors = [None]
+
+    cursors = st.session_state.job_cursors
+    result = store.search(limit=ITEMS_PER_PAGE, cursor=cursors[-1], **filters)
+    facet_counts = result["facets"]
     with c2:
-        locations = ["United Arab Emirates", "India", "Remote"]
-        selected_loc = st.selectbox("Location", locations, label_visibility="collapsed")
+        st.selectbox("Location", locations, key="job_location", label_visibility="collapsed",
+                     format_func=lambda v: v if v == "All Locations" else _facet_label(v, facet_counts["location"]))
     with c3:
         # Job Source Filter
-        sources = ["All Sources", "Naukri.com", "Monster.com", "Naukri Gulf"]
-        selected_source = st.selectbox("Source", sources, label_visibility="collapsed")
+        st.selectbox("Source", sources, key="job_source", label_visibility="collapsed",
+                     format_func=lambda v: v if v == "All Sources" else _facet_label(v, facet_counts["source"]))
 
     st.markdown("<br>", unsafe_allow_html=True)
 
-    # --- Extended Mock Job Data ---
-    all_jobs = [
-        # UAE Jobs
-        {"title": "Senior Software Engineer", "company": "Delivery Hero", "location": "United Arab Emirates", "source": "Naukri Gulf", "logo": "🎒", "desc": "Senior Backend Engineer sought to join Growth team in Dubai. Microservices, Go, AWS.", "date": "Nov 21, 2025"},
-        {"title": "Senior Software Engineer", "company": "Property Finder", "location": "United Arab Emirates", "source": "Naukri Gulf", "logo": "🏠", "desc": "Seeking a talented Software Engineer to develop scalable full-stack applications.", "date": "Oct 17, 2025"},
-        {"title": "Senior Software Developer", "company": "Core42", "location": "United Arab Emirates", "source": "Monster.com", "logo": "💻", "desc": "Develop end-to-end web apps using ReactJS and .NET Core.", "date": "Nov 14, 2025"},
-        {"title": "Senior Fullstack Engineer", "company": "Parser Limited", "location": "United Arab Emirates", "source": "Naukri.com", "logo": "KP", "desc": "Design, build, and maintain scalable full-stack applications in Dubai.", "date": "Nov 19, 2025"},
-        {"title": "DevOps Engineer", "company": "Emirates Group", "location": "United Arab Emirates", "source": "Naukri Gulf", "logo": "✈️", "desc": "Manage CI/CD pipelines and cloud infrastructure for airline systems.", "date": "Nov 23, 2025"},
-        {"title": "Product Manager", "company": "Careem", "location": "United Arab Emirates", "source": "Naukri.com", "logo": "🚗", "desc": "Lead the super-app product vision and strategy.", "date": "Nov 20, 2025"},
-        
-        # India Jobs
-        {"title": "Lead Java Developer", "company": "Flipkart", "location": "India", "source": "Naukri.com", "logo": "🛒", "desc": "Leading e-commerce giant seeking Java experts for order processing systems.", "date": "Nov 22, 2025"},
-        {"title": "SDE-II (Backend)", "company": "Swiggy", "location": "India", "source": "Naukri.com", "logo": "🍱", "desc": "Optimize logistics algorithms using Go and Python.", "date": "Nov 20, 2025"},
-        {"title": "Data Scientist", "company": "Ola Electric", "location": "India", "source": "Monster.com", "logo": "🔋", "desc": "Analyze battery telemetry data to improve EV performance.", "date": "Nov 18, 2025"},
-        {"title": "Frontend Engineer", "company": "Razorpay", "location": "India", "source": "Naukri.com", "logo": "💳", "desc": "Build seamless payment checkout experiences using React.", "date": "Nov 15, 2025"},
-        {"title": "Cloud Architect", "company": "TCS", "location": "India", "source": "Monster.com", "logo": "☁️", "desc": "Architect enterprise cloud solutions on Azure and AWS.", "date": "Nov 24, 2025"},
-        {"title": "AI Researcher", "company": "Google India", "location": "India", "source": "Naukri.com", "logo": "🧠", "desc": "Research and develop next-gen LLM applications.", "date": "Nov 21, 2025"},
-        {"title": "Mobile Developer", "company": "Zomato", "location": "India", "source": "Naukri.com", "logo": "🍅", "desc": "Build the next generation of food delivery mobile apps.", "date": "Nov 19, 2025"},
-        
-        # Remote Jobs
-        {"title": "Senior Python Dev", "company": "Automattic", "location": "Remote", "source": "Monster.com", "logo": "W", "desc": "Work on WordPress.com backend systems from anywhere.", "date": "Nov 23, 2025"},
-        {"title": "Go Engineer", "company": "Doist", "location": "Remote", "source": "Naukri.com", "logo": "✅", "desc": "Build productivity tools for millions of users.", "date": "Nov 21, 2025"}
-    ]
-    
-    # Filter Jobs
-    filtered_jobs = [j for j in all_jobs if j['location'] == selected_loc]
-    if selected_source != "All Sources":
-        filtered_jobs = [j for j in filtered_jobs if j['source'] == selected_source]
-
-    # --- Pagination Logic ---
-    items_per_page = 5
-    total_jobs = len(filtered_jobs)
-    total_pages = max(1, (total_jobs + items_per_page - 1) // items_per_page)
-    
-    if 'job_page' not in st.session_state:
-        st.session_state.job_page = 1
-        
-    # Reset page if filters change (simple check: if current page > total pages)
-    if st.session_state.job_page > total_pages:
-        st.session_state.job_page = 1
+    page_number = len(cursors)
+    total_jobs = result["total"]
+    total_pages = max(1, (total_jobs + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
 
     # Pagination Controls
     col_p1, col_p2, col_p3 = st.columns([2, 6, 2])
     with col_p1:
-        if st.button("⬅️ Previous", disabled=st.session_state.job_page == 1):
-            st.session_state.job_page -= 1
+        if st.button("⬅️ Previous", disabled=page_number == 1):
+            cursors.pop()
             st.rerun()
     with col_p2:
-        st.markdown(f"<div style='text-align: center; padding-top: 5px;'>Page <b>{st.session_state.job_page}</b> of <b>{total_pages}</b> ({total_jobs} Jobs)</div>", unsafe_allow_html=True)
+        st.markdown(f"<div style='text-align: center; padding-top: 5px;'>Page <b>{page_number}</b> of <b>{total_pages}</b> ({total_jobs} Jobs)</div>", unsafe_allow_html=True)
     with col_p3:
-        if st.button("Next ➡️", disabled=st.session_state.job_page == total_pages):
-            st.session_state.job_page += 1
+        if st.button("Next ➡️", disabled=result["next_cursor"] is None):
+            cursors.append(result["next_cursor"])
             st.rerun()
 
-    # Slice Data
-    start_idx = (st.session_state.job_page - 1) * items_per_page
-    end_idx = start_idx + items_per_page
-    jobs_to_show = filtered_jobs[start_idx:end_idx]
-
     # --- Job List Render ---
-    for i, job in enumerate(jobs_to_show):
-        with st.container():
-            # Enhanced HTML Card
-            st.markdown(f"""<div class="job-card" style="border-left: 4px solid #2E74B5;">
-    <div style="display: flex; justify-content: space-between; align-items: start;">
-        <div style="flex: 1;">
-            <div class="job-title">{job['title']}</div>
-            <div class="company-name">
-                <span style="font-size: 18px; margin-right: 8px;">{job['logo']}</span> 
-                <span style="color: #FFF;">{job['company']}</span> 
-                <span style="margin: 0 8px; color: #555;">|</span> 
-                {job['location']}
-            </div>
-        </div>
-        <div style="text-align: right;">
-            <div style="background-color: #333; color: #AAA; padding: 2px 8px; border-radius: 4px; font-size: 11px; display: inline-block; margin-bottom: 5px;">
-                {job['source']}
-            </div>
-            <div style="color: #666; font-size: 12px;">{job['date']}</div>
-        </div>
-    </div>
-    
-    <div style="margin-top: 12px; padding: 10px; background-color: #252526; border-radius: 6px; border: 1px dashed #444;">
-        <div style="color: #DDD; font-size: 13px; line-height: 1.4;">
-            <span style="color: #2E74B5; font-weight: bold;">Role Overview:</span> {job['desc']}
-        </div>
-    </div>
-</div>""", unsafe_allow_html=True)
-            
-            # Action Buttons
-            c_act1, c_act2, c_act3, c_act4 = st.columns([6, 2, 0.5, 0.5])
-            with c_act2:
-                st.button("TARGET RESUME", key=f"target_{start_idx + i}", use_container_width=True)
-            with c_act3:
-                st.button("❤️", key=f"save_{start_idx + i}")
-            with c_act4:
-                st.button("...", key=f"more_{start_idx + i}")
-            
-            st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
+    for job in result["jobs"]:
+        _render_job_card(job, resume_text)
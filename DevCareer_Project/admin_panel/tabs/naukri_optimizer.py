@@ -17,6 +17,7 @@ def render_naukri_optimizer(engine):
                 st.error(resume_text)
             else:
                 st.success("Resume Loaded!")
+                engine.start_resume_session(resume_text)
                 
                 # Auto-Extract Role if not already set or if new file
                 if 'naukri_extracted_file' not in st.session_state or st.session_state.get('naukri_extracted_file') != resume_file.name:
@@ -24,7 +25,7 @@ def render_naukri_optimizer(engine):
                     st.session_state['naukri_resume_text'] = resume_text
                     
                     with st.spinner("Auto-detecting Target Role..."):
-                        extracted = engine.extract_role_and_stack(resume_text)
+                        extracted = engine.understand_resume(resume_text, resume_file.getvalue())
                         st.session_state['naukri_role'] = extracted.get('role', '')
                         st.session_state['naukri_extracted_file'] = resume_file.name
                         st.rerun()
@@ -37,9 +38,12 @@ def render_naukri_optimizer(engine):
         
         if st.button("🚀 Optimize for Naukri"):
             if resume_input and target_role:
-                with st.spinner("Analyzing Naukri Algorithm..."):
-                    optimized_content = engine.optimize_naukri_profile(resume_input, target_role)
-                    st.session_state['naukri_result'] = optimized_content
+                # Stream the kit as it is written; the full text is rendered below once done
+                live_preview = st.empty()
+                with live_preview.container():
+                    optimized_content = st.write_stream(engine.optimize_naukri_profile(resume_input, target_role, stream=True))
+                live_preview.empty()
+                st.session_state['naukri_result'] = optimized_content
             else:
                 st.error("Please provide Resume and Target Role.")
 
@@ -2,6 +2,7 @@ import streamlit as st
 from streamlit_quill import st_quill
 from file_factory.doc_builder import generate_structured_html_preview, create_structured_resume_docx
 from admin_panel.tabs.template_gallery import get_all_templates
+from core_engine.resume_parser import parse_resume_local, low_confidence_fields
 
 def render_resume_builder(engine):
     # Initialize Structured Data
@@ -30,16 +31,15 @@ def render_resume_builder(engine):
         with col_jd2:
             st.markdown("### Match Score")
             if target_jd:
-                if st.button("Analyze Match"):
-                    # Construct resume text for analysis
-                    resume_text = f"{data.get('summary', '')} {data.get('skills', '')}"
-                    for exp in data.get('experience', []):
-                        resume_text += f" {exp.get('title', '')} {exp.get('description', '')}"
-                    
-                    with st.spinner("Analyzing keywords..."):
-                        match_data = engine.match_keywords(resume_text, target_jd)
-                        if match_data:
-                            st.session_state['rb_match_data'] = match_data
+                # Construct resume text for analysis
+                resume_text = f"{data.get('summary', '')} {data.get('skills', '')}"
+                for exp in data.get('experience', []):
+                    resume_text += f" {exp.get('title', '')} {exp.get('description', '')}"
+                
+                # Local keyword scoring takes milliseconds, so the score follows every edit
+                st.session_state['rb_match_data'] = engine.match_keywords(resume_text, target_jd)
+            else:
+                st.session_state.pop('rb_match_data', None)
             
             if 'rb_match_data' in st.session_state:
                 md = st.session_state['rb_match_data']
@@ -192,7 +192,14 @@ def render_resume_builder(engine):
                         if text.startswith("Error"):
                             st.error(text)
                         else:
-                            parsed_data = engine.parse_resume_json(text)
+                            # Reused only if another tab already analyzed this file; never a new call here
+                            understanding = engine.cached_resume_understanding(text, uploaded_resume.getvalue())
+                            parsed_data = understanding.get('resume') if understanding else None
+                            if not parsed_data and text.strip():
+                                # Local parse fills the editor right away; weak sections go to the model after rerun
+                                parsed_data, confidence = parse_resume_local(text)
+                                if auto_polish and low_confidence_fields(confidence):
+                                    st.session_state['resume_refine'] = {'text': text, 'confidence': confidence}
                             if parsed_data:
                                 st.session_state['resume_data'] = parsed_data
                                 
@@ -362,6 +369,17 @@ def render_resume_builder(engine):
             data['certifications'] = st.text_area("Certifications (One per line)", data.get('certifications', ''))
             data['languages'] = st.text_area("Languages (Comma separated)", data.get('languages', ''))
 
+    # Model pass for the sections the local parser was unsure about (the editor is already on screen)
+    refine = st.session_state.get('resume_refine')
+    if refine:
+        fields = low_confidence_fields(refine['confidence'])
+        with st.spinner(f"AI is completing: {', '.join(fields)}..."):
+            refined = engine.parse_resume_json(refine['text'], local_result=(dict(data), refine['confidence']))
+        st.session_state.pop('resume_refine', None)
+        for field in fields:
+            data[field] = refined.get(field, data.get(field))
+        st.rerun()
+
     with col_preview:
         st.subheader("👁️ Live Preview")
         
@@ -39,10 +39,6 @@ def render_service_proposal_tab(engine):
             with st.spinner("Reading PDF..."):
                 sp_profile_final = engine.parse_pdf(sp_pdf)
         
-        # DEBUG
-        print(f"DEBUG: Project Details: '{sp_project}'")
-        print(f"DEBUG: Profile Final Length: {len(sp_profile_final)}")
-        
         if sp_project and sp_profile_final:
             with st.spinner("Analyzing Profile & Generating Proposal..."):
                 proposal_data = engine.generate_service_page_proposal(sp_project, sp_profile_final)
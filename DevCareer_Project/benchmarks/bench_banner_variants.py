@@ -0,0 +1,63 @@
+# bench_banner_variants.py
+"""
+Banner variants: every BANNER_TEMPLATES entry rendered with the same content, serially
+(one template after another) vs. render_banner_variants on the shared thread pool.
+Both encode PNG bytes in memory, as the side-by-side comparison view does.
+
+    python benchmarks/bench_banner_variants.py [repeats]
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core_engine import visual_factory
+from core_engine.visual_factory import VisualFactory
+
+CONTENT = {
+    "custom_hook": "Building Payment Platforms That Scale",
+    "custom_tagline": "Go, Kafka and Kubernetes | 10+ years shipping fintech",
+    "portfolio_url": "https://linkedin.com/in/example",
+    "company_name": "Acme Payments",
+}
+
+
+def render_serial(vf, template_keys):
+    results = []
+    for template_key in template_keys:
+        img = vf._compose_banner(template_key, CONTENT["custom_hook"], CONTENT["custom_tagline"], None,
+                                 CONTENT["portfolio_url"], CONTENT["company_name"])
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        results.append(buffer.getvalue())
+    return results
+
+
+def median_ms(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def main(repeats=10):
+    vf = VisualFactory()
+    template_keys = list(vf.BANNER_TEMPLATES)
+    vf.warm_backgrounds()
+    # Same output either way
+    assert render_serial(vf, template_keys) == vf.render_banner_variants(template_keys, as_bytes=True, **CONTENT)
+
+    serial = median_ms(lambda: render_serial(vf, template_keys), repeats)
+    parallel = median_ms(lambda: vf.render_banner_variants(template_keys, as_bytes=True, **CONTENT), repeats)
+    print(f"{len(template_keys)} templates, {visual_factory._render_workers} workers")
+    print(f"serial:   median {serial:.1f} ms ({serial / len(template_keys):.1f} ms/banner)")
+    print(f"parallel: median {parallel:.1f} ms ({serial / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,65 @@
+# bench_batch_scoring.py
+"""
+Batch keyword scoring: one resume against a synthetic corpus of job descriptions.
+
+JDs are assembled from a pool of skills, role titles and boilerplate so term statistics look
+like a real feed (a few dozen scored terms per posting). Reports corpus build time, matrix
+size and the latency of scoring + top-k on one core.
+
+    python benchmarks/bench_batch_scoring.py [n_jds]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core_engine.jd_corpus import JDCorpus
+from core_engine.keyword_scoring import SKILLS
+
+TITLES = ["Backend Engineer", "Frontend Developer", "Data Engineer", "DevOps Engineer", "Data Scientist",
+          "Mobile Developer", "Full Stack Developer", "Site Reliability Engineer", "Security Analyst", "QA Engineer"]
+DOMAINS = ["payments", "logistics", "healthcare", "e-commerce", "fintech", "edtech", "gaming", "media"]
+RESUME = """Senior Backend Engineer. Built payment systems in Go and Python on PostgreSQL, Redis and Kafka.
+Deployed microservices with Docker on Kubernetes in AWS using Terraform and GitHub Actions CI/CD."""
+
+
+def make_jd(rng, skills):
+    title = rng.choice(TITLES)
+    domain = rng.choice(DOMAINS)
+    required = rng.sample(skills, rng.randint(5, 12))
+    return (
+        f"{title} - {domain}\n"
+        f"We are hiring a {title} to build {domain} platforms at scale.\n"
+        f"Requirements: {', '.join(required[:len(required) // 2])}.\n"
+        f"Nice to have: {', '.join(required[len(required) // 2:])}.\n"
+        f"You will own {domain} services end to end and mentor engineers. {title} experience preferred."
+    )
+
+
+def main(n_jds=100_000, repeats=20):
+    rng = random.Random(7)
+    skills = list(SKILLS)
+    jds = [make_jd(rng, skills) for _ in range(n_jds)]
+
+    start = time.perf_counter()
+    corpus = JDCorpus.build(jds)
+    build_s = time.perf_counter() - start
+    print(f"{n_jds} JDs: build {build_s:.1f}s, {len(corpus.terms)} terms, {len(corpus.data)} non-zeros")
+
+    corpus.top_matches(RESUME)  # warm-up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        top = corpus.top_matches(RESUME, top_k=10)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(f"score + top-10: median {timings[len(timings) // 2] * 1000:.1f} ms, max {timings[-1] * 1000:.1f} ms")
+    best = top[0]
+    print(f"best: #{best['index']} score {best['match_score']} "
+          f"matching {best['matching_skills'][:5]} missing {best['missing_skills'][:5]}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,90 @@
+# bench_job_search.py
+"""
+Job search latency on a synthetic store: what one rerun of the Job Search tab costs.
+
+Postings are assembled from pools of titles, companies, locations, skills and boilerplate,
+spread over 90 days and four sources. Each scenario is timed cold (first rerun for a new
+query, facet cross-tab computed) and warm (the same query re-run, e.g. paging or changing
+a location/source filter).
+
+    python benchmarks/bench_job_search.py [n_jobs]
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import datetime
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core_engine.job_store import JobStore
+from core_engine.keyword_scoring import SKILLS
+
+TITLES = ["Senior Software Engineer", "Backend Engineer", "Frontend Developer", "Data Engineer", "DevOps Engineer",
+          "Data Scientist", "Mobile Developer", "Full Stack Developer", "Site Reliability Engineer", "QA Engineer",
+          "Product Manager", "Cloud Architect", "Java Developer", "Python Developer", "Engineering Manager"]
+COMPANIES = [f"{prefix} {suffix}" for prefix in ("Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne",
+                                                  "Cyberdyne", "Soylent", "Tyrell", "Wonka", "Aperture")
+             for suffix in ("Labs", "Technologies", "Systems", "Digital", "Solutions")]
+LOCATIONS = ["Bengaluru, India", "Hyderabad, India", "Pune, India", "Chennai, India", "Gurugram, India", "Noida, India",
+             "Mumbai, India", "Dubai, United Arab Emirates", "Abu Dhabi, United Arab Emirates", "Remote"]
+SOURCES = ["Naukri.com", "Naukri Gulf", "Monster.com", "LinkedIn"]
+DOMAINS = ["payments", "logistics", "healthcare", "e-commerce", "fintech", "edtech", "gaming", "media"]
+QUERIES = ["senior software engineer", "python", "kubernetes aws", "react typescript", "data"]
+
+
+def make_job(rng, skills, today):
+    title = rng.choice(TITLES)
+    domain = rng.choice(DOMAINS)
+    required = rng.sample(skills, rng.randint(5, 12))
+    return {
+        "title": title,
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "source": rng.choice(SOURCES),
+        "desc": (f"We are hiring a {title} to build {domain} platforms at scale. "
+                 f"Requirements: {', '.join(required)}. You will own {domain} services end to end."),
+        "date": (today - datetime.timedelta(days=rng.randint(0, 90))).isoformat(),
+    }
+
+
+def timed(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000, timings[-1] * 1000
+
+
+def main(n_jobs=200_000, repeats=10):
+    rng = random.Random(7)
+    skills = list(SKILLS)
+    today = datetime.date(2025, 11, 24)
+    tmp = tempfile.mkdtemp()
+    try:
+        store = JobStore(os.path.join(tmp, "jobs.sqlite3"))
+        start = time.perf_counter()
+        store.ingest(make_job(rng, skills, today) for _ in range(n_jobs))
+        print(f"{len(store)} jobs ingested in {time.perf_counter() - start:.1f}s")
+
+        since = today - datetime.timedelta(days=30)
+        for query in [""] + QUERIES:
+            first = store.search(query, date_from=since, limit=5)
+            # Dropping the cached cross-tab makes each run pay for a query seen for the first time
+            cold = timed(lambda: (store._crosstab_cache.clear(), store.search(query, date_from=since, limit=5)),
+                         repeats)[0]
+            warm = timed(lambda: store.search(query, location=LOCATIONS[0], date_from=since, limit=5), repeats)
+            page = timed(lambda: store.search(query, date_from=since, limit=5, cursor=first["next_cursor"]), repeats)
+            print(f"{query or '(no query)':<26} {first['total']:>7} hits | cold {cold:6.1f} ms | "
+                  f"filtered {warm[0]:6.1f} ms (max {warm[1]:.1f}) | next page {page[0]:6.1f} ms (max {page[1]:.1f})")
+        store.close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,75 @@
+# bench_json_extract.py
+"""
+Micro-benchmark: legacy regex/json/literal_eval chain vs the single-pass extractor.
+
+Responses are shaped like recorded master-kit outputs (prose preamble, fenced JSON with
+long string fields, closing remarks) and scaled from 1 KB to 200 KB.
+
+    python benchmarks/bench_json_extract.py
+"""
+import os
+import sys
+import ast
+import json
+import re
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core_engine.json_extract import extract_json
+
+SIZES_KB = (1, 10, 50, 200)
+
+
+def legacy_extract(text):
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(0))
+        except json.JSONDecodeError:
+            pass
+    clean_text = text.replace("```json", "").replace("```", "").strip()
+    try:
+        return json.loads(clean_text)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return ast.literal_eval(match.group(0) if match else clean_text)
+    except (ValueError, SyntaxError):
+        return None
+
+
+def make_response(size_kb, python_style=False, prose_braces=True):
+    posts = []
+    body = {"headline": "Senior Backend Engineer | Go, Kafka, AWS", "about": "", "posts": posts}
+    while len(json.dumps(body)) < size_kb * 1024:
+        posts.append({
+            "title": f"Lesson {len(posts) + 1}: scaling {{tenant}} queues",
+            "body": "We cut p99 latency by 40% after moving to batched writes. " * 4,
+            "tags": ["backend", "kafka", "aws"],
+            "published": False
+        })
+    payload = repr(body) if python_style else json.dumps(body, indent=2)
+    if not prose_braces:
+        return "Sure! Here's the kit.\n```json\n" + payload + "\n```\nLet me know if you'd like changes."
+    return (
+        "Sure! Here's the kit for {your} profile.\n```json\n" + payload +
+        "\n```\nLet me know if you'd like changes to any {section}."
+    )
+
+
+def main():
+    print(f"{'size':>8} {'style':>7} {'legacy ms':>10} {'parsed':>7} {'single-pass ms':>15}")
+    for size_kb in SIZES_KB:
+        for style, python_style, prose_braces in (("json", False, False), ("braces", False, True), ("python", True, True)):
+            text = make_response(size_kb, python_style, prose_braces)
+            assert extract_json(text) is not None
+            runs = max(3, 200 // size_kb)
+            legacy = min(timeit.repeat(lambda: legacy_extract(text), number=runs, repeat=3)) / runs
+            single = min(timeit.repeat(lambda: extract_json(text), number=runs, repeat=3)) / runs
+            parsed = legacy_extract(text) is not None
+            print(f"{size_kb:>6}KB {style:>7} {legacy * 1000:>10.2f} {str(parsed):>7} {single * 1000:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
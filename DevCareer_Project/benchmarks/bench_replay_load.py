@@ -0,0 +1,100 @@
+# bench_replay_load.py
+"""
+Offline load test of the engine calls behind each tab, using the replay provider.
+
+Every model call sleeps a fixed synthetic latency, so anything above it is our own
+overhead (prompt building, caching, parsing, validation). Responses come from the
+fixture store recorded with DEVCAREER_LLM_PROVIDER=record (--fixtures, default
+DEVCAREER_FIXTURE_DIR); prompts without a recording get a schema-shaped placeholder
+unless --strict is given.
+
+    python benchmarks/bench_replay_load.py --sessions 8 --latency-ms 300 --error-rate 0.02
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_providers import FixtureStore, ReplayProvider
+from core_engine.output_schemas import empty_value
+
+RESUME = "\n".join(
+    ["JANE DOE | jane@example.com | linkedin.com/in/jane-doe", "SUMMARY", "Backend engineer, 8 years."] +
+    [f"- Built service {i} in Go and Kafka, cutting p99 latency by {i}%" for i in range(40)] +
+    ["SKILLS", "Go, Kafka, AWS, Kubernetes, PostgreSQL"]
+)
+JD = "Senior Backend Engineer. Go, Kafka, Kubernetes, AWS, gRPC, PostgreSQL, on-call ownership."
+
+
+def synthetic_response(prompt, generation_config):
+    if generation_config and "response_schema" in generation_config:
+        return json.dumps(empty_value(generation_config["response_schema"]))
+    return "Synthetic answer. " * 200
+
+
+# Tab -> engine call
+WORKLOAD = {
+    "linkedin_wizard": lambda e: e.understand_resume(RESUME),
+    "linkedin_master_kit": lambda e: e.generate_linkedin_master_kit("SRE", "Dubai", "Technology", RESUME),
+    "naukri": lambda e: e.optimize_naukri_profile(RESUME, "SRE"),
+    "cover_letter": lambda e: "".join(e.generate_cover_letter(RESUME, JD, stream=True)),
+    "ats_scanner": lambda e: e.check_ats_score(RESUME, JD, "India"),
+    "resume_builder_match": lambda e: e.match_keywords(RESUME, JD),
+    "service_proposal": lambda e: e.generate_service_page_proposal("Resume rewrite", RESUME),
+}
+
+
+def run_session(provider, rounds):
+    # One engine per session (as with one Streamlit session per API key); no response cache so
+    # every call reaches the provider
+    engine = IntelligenceEngine("replay", cache=False, provider=provider)
+    timings = {name: [] for name in WORKLOAD}
+    for _ in range(rounds):
+        for name, call in WORKLOAD.items():
+            start = time.perf_counter()
+            call(engine)
+            timings[name].append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fixtures", default=None, help="Fixture directory to replay")
+    parser.add_argument("--strict", action="store_true", help="Fail calls that have no recording")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures) if args.fixtures else FixtureStore()
+    provider = ReplayProvider(
+        store, latency_s=args.latency_ms / 1000, error_rate=args.error_rate,
+        fallback=None if args.strict else synthetic_response, seed=7
+    )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        results = list(pool.map(lambda _: run_session(provider, args.rounds), range(args.sessions)))
+    wall = time.perf_counter() - start
+
+    latency = args.latency_ms / 1000
+    print(f"{args.sessions} sessions x {args.rounds} rounds, synthetic latency {args.latency_ms:.0f} ms, "
+          f"error rate {args.error_rate:.0%}, wall {wall:.2f}s")
+    print(f"{'tab':<22} {'calls':>5} {'p50 ms':>8} {'p95 ms':>8} {'overhead p50 ms':>16}")
+    for name in WORKLOAD:
+        samples = sorted(t for result in results for t in result[name])
+        p50 = statistics.median(samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        overhead = max(0.0, p50 - latency)
+        print(f"{name:<22} {len(samples):>5} {p50 * 1000:>8.1f} {p95 * 1000:>8.1f} {overhead * 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
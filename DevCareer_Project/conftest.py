@@ -0,0 +1,14 @@
+# conftest.py
+import os
+import shutil
+import tempfile
+
+# Loaded before any test module imports core_engine: every default cache (LLM responses,
+# extracted text, banner layers, job store and matrix) goes to a throwaway directory, so
+# mocked responses never reach the real ~/.cache/devcareer.
+_CACHE_DIR = tempfile.mkdtemp(prefix="devcareer-test-cache-")
+os.environ["DEVCAREER_CACHE_DIR"] = _CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
@@ -1,16 +1,15 @@
 
 # ai_logic.py
 import os
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
-
-try:
-    from pypdf import PdfReader
-except ImportError:
-    PdfReader = None
-
+import json
+import time
+import inspect
+import functools
+import threading
+import contextvars
+from collections import OrderedDict
+
+from .lazy_imports import LazyImport
 from .prompts import (
     get_resume_prompt, get_github_architect_prompt, get_linkedin_optimizer_prompt, 
     get_ats_score_prompt, get_visual_content_prompt, get_keyword_injection_prompt,
@@ -23,52 +22,432 @@ from .prompts import (
     get_linkedin_visual_prompt, get_linkedin_master_prompt,
     get_resume_agent_prompt, get_logistics_prompt, get_tone_tuner_prompt,
     get_service_page_proposal_prompt, get_content_improver_prompt,
-    get_keyword_matcher_prompt, get_master_prompt
+    get_keyword_matcher_prompt, get_master_prompt, get_field_repair_prompt,
+    get_resume_understanding_prompt, get_resume_sections_prompt
 )
+from .response_cache import make_cache_key, default_response_cache
+from .batch_runner import run_batch
+from .resume_context import create_resume_context, ResumeContextStore, file_fingerprint, resume_fingerprint
+from .llm_metrics import METRICS
+from .json_extract import extract_json
+from .output_schemas import OUTPUT_SCHEMAS, json_generation_config, validate, subschema
+from .llm_providers import GeminiProvider, provider_from_env
+from .single_flight import default_single_flight
+from .pdf_extract import DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+from .text_extraction import default_extraction_service, PDF_TYPE
+from .resume_parser import parse_resume_local, low_confidence_fields, LOW_CONFIDENCE
+
+# Heavy SDKs are imported on first use so tabs that never call them start fast
+genai = LazyImport("google.generativeai")
+PdfReader = LazyImport("pypdf", "PdfReader")
+# The local keyword scorer pulls in numpy
+score_keywords = LazyImport(f"{__package__}.keyword_scoring", "score_keywords")
+
+# Name of the engine method currently driving a model call (for per-method cache policy and metrics)
+_current_method = contextvars.ContextVar("engine_method", default=None)
+
+
+def engine_method(func):
+    """
+    Marks a public engine method so generate_content knows which tool issued the call,
+    and records the method's wall time.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        token = _current_method.set(func.__name__)
+        start = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            _current_method.reset(token)
+        # Streams record their own total once the last chunk has been consumed
+        if not inspect.isgenerator(result):
+            METRICS.observe("devcareer_llm_method_seconds", func.__name__, time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+def record_usage(response, method):
+    """
+    Records prompt/output token counts from a Gemini response's usage metadata.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_token_count", None)
+    output_tokens = getattr(usage, "candidates_token_count", None)
+    if isinstance(prompt_tokens, int):
+        METRICS.observe("devcareer_llm_prompt_tokens", method, prompt_tokens)
+    if isinstance(output_tokens, int):
+        METRICS.observe("devcareer_llm_output_tokens", method, output_tokens)
 
 
 class IntelligenceEngine:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        if genai:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp') # Using a capable model
-        else:
-            print("Warning: google-generativeai not installed.")
+    MODEL_NAME = 'gemini-2.0-flash-exp'
+
+    # Methods whose output users expect to change on every click ("regenerate")
+    UNCACHED_METHODS = {"generate_bullets", "improve_content"}
+    MAX_RESUME_UNDERSTANDINGS = 64
 
-    def parse_pdf(self, file_path):
+    def __init__(self, api_key, cache=None, provider=None, single_flight=None, extractor=None):
         """
-        Extracts text from a PDF file.
+        cache: a ResponseCache, None for the default memory+disk cache, or False to disable caching.
+        provider: where model calls go (see llm_providers); defaults to DEVCAREER_LLM_PROVIDER, i.e. Gemini.
+        single_flight: SingleFlight that merges identical concurrent calls; defaults to the process-wide one.
+        extractor: TextExtractionService for uploaded files; defaults to the process-wide one.
+        """
+        self.api_key = api_key
+        self.provider = provider or provider_from_env(api_key)
+        self.single_flight = single_flight or default_single_flight()
+        self.extractor = extractor or default_extraction_service()
+        self.model_name = self.MODEL_NAME
+        self.generation_config = {}
+        self.uncached_methods = set(self.UNCACHED_METHODS)
+        self.cache = default_response_cache() if cache is None else (cache or None)
+        # Timings of the most recent model call: {"method", "ttft_s", "total_s", "streamed", "cached"}
+        self.last_call_timings = {}
+        self.resume_contexts = ResumeContextStore()
+        # understand_resume results by file hash as JSON, for tabs sharing this engine (LRU, backed by self.cache)
+        self.resume_understandings = OrderedDict()
+        self._understandings_lock = threading.Lock()
+        self._model = None
+
+    @property
+    def model(self):
+        """
+        The provider's model, created (and for Gemini the SDK imported) on first use.
+        """
+        if self._model is None:
+            self._model = self.provider.create_model(self.model_name) # Using a capable model
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._model = value
+
+    def parse_pdf(self, file_path, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+        """
+        Extracts text from a PDF file (path, bytes or upload), up to the page/character budget.
+        Served from the shared extraction cache when the same file was read before.
         """
         if not PdfReader:
             return "Error: pypdf library not installed."
         
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return self.extractor.extract(file_path, file_type=PDF_TYPE, max_pages=max_pages, max_chars=max_chars)
         except Exception as e:
             return f"Error reading PDF: {str(e)}"
 
-    def generate_content(self, prompt):
+    def _llm_ready(self):
+        return self._model is not None or self.provider.available
+
+    def start_resume_session(self, resume_text):
+        """
+        Registers a resume once so every later prompt built from the same text
+        references the session context instead of inlining the raw resume.
+        """
+        if not resume_text or str(resume_text).startswith("Error"):
+            return None
+        context = self.resume_contexts.get(resume_text)
+        if context is None or context.degraded:
+            # Provider-side context caching only exists on the live Gemini API
+            sdk = genai if isinstance(self.provider, GeminiProvider) else None
+            context = create_resume_context(resume_text, self.model_name, sdk)
+            self.resume_contexts.put(context)
+        return context
+
+    def _resume_ref(self, resume_text):
+        """
+        What prompt builders should receive for resume_text: the session reference if one exists.
+        """
+        context = self.resume_contexts.get(resume_text)
+        return context.reference if context else resume_text
+
+    def _model_for(self, prompt):
+        """
+        Returns (model, prompt) for a call. Prompts that reference a provider-cached resume run on
+        that context's model. If that cache has lapsed and could not be refreshed, the reference is
+        replaced with the local digest and the call runs on the default model.
+        """
+        context = self.resume_contexts.find_by_reference(prompt)
+        if context is None:
+            return self.model, prompt
+        if context.ensure_fresh():
+            return context.model, prompt
+        return self.model, prompt.replace(context.provider_reference, context.digest)
+
+    def _cache_key(self, prompt, image_bytes=None, generation_config=None):
+        """
+        Returns the response cache key for a call, or None if caching is off for it.
+        """
+        if self.cache is None or _current_method.get() in self.uncached_methods:
+            return None
+        settings = dict(self.generation_config, **(generation_config or {}))
+        return make_cache_key(self.model_name, settings, prompt, image_bytes)
+
+    def _cache_get(self, cache_key, method=None):
+        """
+        Cache lookup that also feeds the per-method hit/miss counters.
+        """
+        if not cache_key:
+            return None
+        value = self.cache.get(cache_key)
+        name = "devcareer_llm_cache_hits_total" if value is not None else "devcareer_llm_cache_misses_total"
+        METRICS.inc(name, method or _current_method.get())
+        return value
+
+    def _coalesced(self, prompt, fetch, cache_key=None, generation_config=None, method=None):
+        """
+        Runs fetch once for identical concurrent calls (same model, settings and prompt);
+        the other callers wait and share its result. With cross-process coalescing on,
+        a call another process just finished is picked up from the response cache.
+        """
+        settings = dict(self.generation_config, **(generation_config or {}))
+        flight_key = make_cache_key(self.model_name, settings, prompt)
+        lookup = (lambda: self.cache.get(cache_key)) if cache_key else None
+        result, shared = self.single_flight.do(flight_key, fetch, lookup)
+        if shared:
+            METRICS.inc("devcareer_llm_coalesced_total", method or _current_method.get())
+        return result
+
+    def cache_stats(self):
+        """
+        Hit/miss counters of the response cache.
+        """
+        return self.cache.get_stats() if self.cache else {}
+
+    def generate_content(self, prompt, use_cache=True):
         """
         Generates content using Gemini.
+        Identical prompts are served from the response cache unless use_cache is False.
         """
-        if not genai:
+        if not self._llm_ready():
             return "Error: google-generativeai library not installed."
-        
+
+        start = time.perf_counter()
+        cache_key = self._cache_key(prompt) if use_cache else None
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._record_timings(start, start, streamed=False, cached=True)
+            return cached
+
+        def _fetch():
+            text = self._call_model(prompt)
+            if cache_key and text:
+                self.cache.set(cache_key, text)
+            return text
+
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            text = self._coalesced(prompt, _fetch, cache_key)
         except Exception as e:
             return f"Error generating content: {str(e)}"
 
-    def rewrite_resume(self, resume_text, market="India"):
-        prompt = get_resume_prompt(market, resume_text)
+        self._record_timings(start, None, streamed=False, cached=False)
+        return text
+
+    def _call_model(self, prompt, method=None, generation_config=None):
+        """
+        Single upstream call. Unlike generate_content, errors are raised to the caller.
+        """
+        method = method or _current_method.get()
+        METRICS.inc("devcareer_llm_calls_total", method)
+        try:
+            model, prompt = self._model_for(prompt)
+            if generation_config:
+                response = model.generate_content(prompt, generation_config=generation_config)
+            else:
+                response = model.generate_content(prompt)
+            text = response.text
+        except Exception:
+            METRICS.inc("devcareer_llm_errors_total", method)
+            raise
+        record_usage(response, method)
+        return text
+
+    def batch_generate(self, prompts, max_concurrency=4, rpm=60, tpm=None, max_retries=4, use_cache=True):
+        """
+        Runs many prompts concurrently within the account's RPM/TPM quota.
+        Retryable errors (429, timeouts, 5xx) are retried with jittered backoff.
+
+        Returns one dict per prompt, in input order:
+            {"index", "status": "ok" | "error", "text", "error", "attempts", "latency_s", "cached"}
+        """
+        prompts = list(prompts)
+        if not self._llm_ready():
+            return [
+                {"index": i, "status": "error", "text": None, "error": "google-generativeai library not installed.",
+                 "attempts": 0, "latency_s": 0.0, "cached": False}
+                for i in range(len(prompts))
+            ]
+
+        results = [None] * len(prompts)
+        keys = [self._cache_key(p) if use_cache else None for p in prompts]
+        pending = []
+        for i, key in enumerate(keys):
+            cached = self._cache_get(key, "batch_generate")
+            if cached is not None:
+                results[i] = {"index": i, "status": "ok", "text": cached, "error": None,
+                              "attempts": 0, "latency_s": 0.0, "cached": True}
+            else:
+                pending.append(i)
+
+        def _call(prompt):
+            # Duplicate prompts within a batch (and across concurrent batches) share one call
+            fetch = functools.partial(self._call_model, prompt, method="batch_generate")
+            return self._coalesced(prompt, fetch, method="batch_generate")
+
+        outcomes = run_batch(
+            _call, [prompts[i] for i in pending],
+            max_concurrency=max_concurrency, rpm=rpm, tpm=tpm, max_retries=max_retries
+        )
+        for i, outcome in zip(pending, outcomes):
+            outcome["index"] = i
+            outcome["cached"] = False
+            METRICS.inc("devcareer_llm_retries_total", "batch_generate", outcome["attempts"] - 1)
+            if outcome["status"] == "ok" and keys[i] and outcome["text"]:
+                self.cache.set(keys[i], outcome["text"])
+            results[i] = outcome
+        return results
+
+    def generate_content_stream(self, prompt, use_cache=True):
+        """
+        Streaming variant of generate_content: returns a generator of text chunks.
+        A cache hit yields the whole cached answer as a single chunk.
+        """
+        # Resolve the cache key now: the calling engine method has returned by the time the generator runs
+        cache_key = self._cache_key(prompt) if use_cache else None
+        method = _current_method.get()
+        return self._stream_chunks(prompt, cache_key, method)
+
+    def _stream_chunks(self, prompt, cache_key, method):
+        if not self._llm_ready():
+            yield "Error: google-generativeai library not installed."
+            return
+
+        start = time.perf_counter()
+        cached = self._cache_get(cache_key, method)
+        if cached is not None:
+            self._record_timings(start, start, streamed=True, cached=True, method=method)
+            yield cached
+            return
+
+        first_chunk_at = None
+        chunks = []
+        last_chunk = None
+        METRICS.inc("devcareer_llm_calls_total", method)
+        try:
+            model, prompt = self._model_for(prompt)
+            response = model.generate_content(prompt, stream=True)
+            for chunk in response:
+                last_chunk = chunk
+                text = chunk.text
+                if not text:
+                    continue
+                if first_chunk_at is None:
+                    first_chunk_at = time.perf_counter()
+                chunks.append(text)
+                yield text
+        except Exception as e:
+            METRICS.inc("devcareer_llm_errors_total", method)
+            yield f"Error generating content: {str(e)}"
+            return
+
+        # The final chunk carries the usage metadata for the whole stream
+        record_usage(last_chunk, method)
+        self._record_timings(start, first_chunk_at, streamed=True, cached=False, method=method)
+        METRICS.observe("devcareer_llm_method_seconds", method, time.perf_counter() - start)
+        full_text = "".join(chunks)
+        if cache_key and full_text:
+            self.cache.set(cache_key, full_text)
+
+    def _record_timings(self, start, first_chunk_at, streamed, cached, method=None):
+        end = time.perf_counter()
+        # Without streaming the first token arrives with the full response
+        first = first_chunk_at if first_chunk_at is not None else end
+        method = method or _current_method.get()
+        self.last_call_timings = {
+            "method": method,
+            "ttft_s": round(first - start, 4),
+            "total_s": round(end - start, 4),
+            "streamed": streamed,
+            "cached": cached
+        }
+        METRICS.observe("devcareer_llm_ttfb_seconds", method, first - start)
+
+    def generate_json(self, prompt, schema, use_cache=True):
+        """
+        Schema-constrained call: the provider returns bare JSON matching schema.
+        Returns the validated dict, or None if no usable JSON came back.
+        """
+        if not self._llm_ready():
+            return None
+
+        start = time.perf_counter()
+        config = json_generation_config(schema)
+        cache_key = self._cache_key(prompt, generation_config=config) if use_cache else None
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._record_timings(start, start, streamed=False, cached=True)
+            return json.loads(cached)
+
+        def _fetch():
+            raw_text = self._call_model(prompt, generation_config=config)
+            data, complete = self._validate_structured(prompt, schema, raw_text)
+            payload = json.dumps(data) if data is not None else None
+            if cache_key and complete:
+                self.cache.set(cache_key, payload)
+            return payload
+
+        try:
+            payload = self._coalesced(prompt, _fetch, cache_key, config)
+        except Exception as e:
+            print(f"Error generating content: {str(e)}")
+            return None
+
+        self._record_timings(start, None, streamed=False, cached=False)
+        # Each caller gets its own copy: tabs edit the returned dicts in place
+        return json.loads(payload) if payload is not None else None
+
+    def _validate_structured(self, prompt, schema, raw_text):
+        """
+        Validates a structured response. Fields that are missing or invalid are
+        re-asked once, on their own, instead of repeating the whole call.
+        Returns (data or None, complete).
+        """
+        data, failing = validate(self._extract_json(raw_text), schema)
+        if failing:
+            METRICS.inc("devcareer_llm_schema_repairs_total", _current_method.get())
+            repair_schema = subschema(schema, failing)
+            try:
+                repair_text = self._call_model(
+                    get_field_repair_prompt(prompt, failing), generation_config=json_generation_config(repair_schema)
+                )
+                patch, still_failing = validate(self._extract_json(repair_text), repair_schema)
+            except Exception as e:
+                print(f"Error re-asking fields {failing}: {str(e)}")
+                patch, still_failing = {}, failing
+            if len(still_failing) == len(schema["properties"]):
+                return None, False
+            for name in failing:
+                if name not in still_failing:
+                    data[name] = patch[name]
+            failing = still_failing
+        return data, not failing
+
+    def _generate(self, prompt, stream=False):
+        """
+        Returns the collected string, or a chunk generator when stream=True.
+        """
+        if stream:
+            return self.generate_content_stream(prompt)
         return self.generate_content(prompt)
 
+    @engine_method
+    def rewrite_resume(self, resume_text, market="India", stream=False):
+        prompt = get_resume_prompt(market, self._resume_ref(resume_text))
+        return self._generate(prompt, stream)
+
+    @engine_method
     def architect_project(self, description, tech_stack=""):
         prompt = get_github_architect_prompt(description, tech_stack)
         raw_text = self.generate_content(prompt)
@@ -93,10 +472,12 @@ class IntelligenceEngine:
                 "structure": ""
             }
 
+    @engine_method
     def optimize_linkedin(self, resume_text, target_role="Software Engineer", tech_stack=""):
-        prompt = get_linkedin_optimizer_prompt(resume_text, target_role, tech_stack)
+        prompt = get_linkedin_optimizer_prompt(self._resume_ref(resume_text), target_role, tech_stack)
         return self.generate_content(prompt)
 
+    @engine_method
     def generate_bullets(self, role, company, description):
         """
         Generates high-impact bullet points for a specific job role.
@@ -116,15 +497,22 @@ class IntelligenceEngine:
         """
         return self.generate_content(prompt)
 
+    @engine_method
     def check_ats_score(self, resume_text, jd_text, market):
-        prompt = get_ats_score_prompt(resume_text, jd_text, market)
+        """
+        ATS report for a JD. The score and keyword lists come from the local scorer;
+        the model only writes the market-fit and improvement advice around them.
+        """
+        keyword_match = score_keywords(resume_text, jd_text)
+        prompt = get_ats_score_prompt(self._resume_ref(resume_text), jd_text, market, keyword_match)
         return self.generate_content(prompt)
 
+    @engine_method
     def extract_visual_content(self, resume_text, target_role):
         """
         Extracts structured data for visual assets.
         """
-        prompt = get_visual_content_prompt(resume_text, target_role)
+        prompt = get_visual_content_prompt(self._resume_ref(resume_text), target_role)
         raw_text = self.generate_content(prompt)
         
         # Clean up markdown code blocks if present
@@ -174,6 +562,7 @@ class IntelligenceEngine:
             
         return data
 
+    @engine_method
     def generate_keyword_injection(self, target_role, target_keywords):
         """
         Generates keyword-heavy project descriptions for SEO.
@@ -181,87 +570,137 @@ class IntelligenceEngine:
         prompt = get_keyword_injection_prompt(target_role, target_keywords)
         return self.generate_content(prompt)
 
+    @engine_method
     def simulate_recruiter_review(self, image_data, target_role):
         """
         Uses Gemini Vision to critique a LinkedIn profile screenshot.
         image_data: bytes of the image
         """
-        if not genai:
+        if not self._llm_ready():
             return "Error: google-generativeai library not installed."
             
         prompt = get_recruiter_simulator_prompt(target_role)
         
+        cache_key = self._cache_key(prompt, image_data)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Create the image part
             import PIL.Image
             import io
             image = PIL.Image.open(io.BytesIO(image_data))
             
+            METRICS.inc("devcareer_llm_calls_total", "simulate_recruiter_review")
             response = self.model.generate_content([prompt, image])
-            return response.text
+            text = response.text
         except Exception as e:
+            METRICS.inc("devcareer_llm_errors_total", "simulate_recruiter_review")
             return f"Error analyzing image: {str(e)}"
+        
+        record_usage(response, "simulate_recruiter_review")
+        
+        if cache_key and text:
+            self.cache.set(cache_key, text)
+        return text
 
+    @engine_method
     def generate_recommendations(self, role, key_achievement):
         prompt = get_recommendation_prompt(role, key_achievement)
         return self.generate_content(prompt)
 
+    @engine_method
     def generate_content_calendar(self, project_name, tech_stack):
         prompt = get_content_calendar_prompt(project_name, tech_stack)
         return self.generate_content(prompt)
 
+    @engine_method
     def analyze_competitor_gap(self, my_resume, competitor_text, target_role):
-        prompt = get_competitor_gap_prompt(my_resume, competitor_text, target_role)
+        prompt = get_competitor_gap_prompt(self._resume_ref(my_resume), competitor_text, target_role)
         return self.generate_content(prompt)
 
     def _extract_json(self, text):
         """
         Helper to robustly extract JSON from text.
         """
-        import json
-        import re
-        import ast
-        
-        try:
-            # 1. Try Regex + JSON
-            match = re.search(r"\{.*\}", text, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                try:
-                    return json.loads(json_str)
-                except json.JSONDecodeError:
-                    pass # Try other methods
-            
-            # 2. Try cleaning + JSON
-            clean_text = text.replace("```json", "").replace("```", "").strip()
-            try:
-                return json.loads(clean_text)
-            except json.JSONDecodeError:
-                pass
-
-            # 3. Try ast.literal_eval (for single quotes/trailing commas)
-            try:
-                if match:
-                    return ast.literal_eval(match.group(0))
-                return ast.literal_eval(clean_text)
-            except (ValueError, SyntaxError):
-                pass
-                
+        data = extract_json(text)
+        if data is None:
+            METRICS.inc("devcareer_llm_parse_failures_total", _current_method.get())
             print(f"Failed to parse JSON from: {text}")
-            return None
-        except Exception as e:
-            print(f"Unexpected error in _extract_json: {e}")
-            return None
+        return data
 
+    @engine_method
     def extract_role_and_stack(self, resume_text):
         """
         Extracts suggested role and stack from resume.
         """
-        prompt = get_role_and_stack_extraction_prompt(resume_text)
-        raw_text = self.generate_content(prompt)
-        
-        data = self._extract_json(raw_text)
-        
+        prompt = get_role_and_stack_extraction_prompt(self._resume_ref(resume_text))
+        data = self.generate_json(prompt, OUTPUT_SCHEMAS["extract_role_and_stack"])
+        return self._complete_role_and_stack(data, resume_text)
+
+    @engine_method
+    def understand_resume(self, resume_text, file_bytes=None):
+        """
+        One call that extracts everything the tabs need from an uploaded resume:
+        role, stack, location, industry, linkedin_url, custom_hook, custom_tagline
+        and the builder JSON under "resume" (absent if the model call failed).
+
+        Stored under the SHA-256 of the file bytes (or of the text when no bytes are given),
+        so every tab that sees the same upload reuses it.
+        """
+        fingerprint = self._understanding_fingerprint(resume_text, file_bytes)
+        store_key = self._understanding_key(fingerprint)
+        stored = self._stored_understanding(store_key)
+        if stored is not None:
+            METRICS.inc("devcareer_llm_cache_hits_total", "understand_resume")
+            # A fresh copy per caller: the builder edits its "resume" in place
+            return json.loads(stored)
+
+        prompt = get_resume_understanding_prompt(self._resume_ref(resume_text))
+        data = self.generate_json(prompt, OUTPUT_SCHEMAS["understand_resume"])
+        if not data:
+            # Regex LinkedIn URL and default industry, not stored: the next upload retries the model
+            return self._complete_role_and_stack(None, resume_text)
+        understanding = self._complete_role_and_stack(data, resume_text)
+        understanding["fingerprint"] = fingerprint
+        stored = json.dumps(understanding)
+        self._remember_understanding(store_key, stored)
+        if self.cache is not None:
+            self.cache.set(store_key, stored)
+        return json.loads(stored)
+
+    def cached_resume_understanding(self, resume_text, file_bytes=None):
+        """
+        understand_resume's stored result for this upload (a fresh copy), or None. Never calls the model.
+        """
+        stored = self._stored_understanding(self._understanding_key(self._understanding_fingerprint(resume_text, file_bytes)))
+        return json.loads(stored) if stored is not None else None
+
+    def _understanding_fingerprint(self, resume_text, file_bytes):
+        return file_fingerprint(file_bytes) if file_bytes else resume_fingerprint(resume_text)
+
+    def _understanding_key(self, fingerprint):
+        return f"resume-understanding:{self.model_name}:{fingerprint}"
+
+    def _stored_understanding(self, store_key):
+        with self._understandings_lock:
+            stored = self.resume_understandings.get(store_key)
+        if stored is None and self.cache is not None:
+            stored = self.cache.get(store_key)
+        if stored is not None:
+            self._remember_understanding(store_key, stored)
+        return stored
+
+    def _remember_understanding(self, store_key, stored):
+        with self._understandings_lock:
+            self.resume_understandings[store_key] = stored
+            self.resume_understandings.move_to_end(store_key)
+            while len(self.resume_understandings) > self.MAX_RESUME_UNDERSTANDINGS:
+                self.resume_understandings.popitem(last=False)
+
+    def _complete_role_and_stack(self, data, resume_text):
+
         # Regex Fallback for LinkedIn URL
         import re
         linkedin_pattern = r'(https?://)?(www\.)?linkedin\.com/in/[a-zA-Z0-9_-]+/?'
@@ -274,26 +713,28 @@ class IntelligenceEngine:
                 data['linkedin_url'] = extracted_url
             return data
         else:
-            print(f"Error parsing role/stack from: {raw_text}")
+            print("Error extracting role/stack from resume")
             # Return regex result even if AI failed JSON
             return {"role": "", "stack": "", "linkedin_url": extracted_url, "location": "", "industry": "Technology"}
 
-    def optimize_naukri_profile(self, resume_text, target_role):
+    @engine_method
+    def optimize_naukri_profile(self, resume_text, target_role, stream=False):
         """
         Generates Naukri.com optimization content.
         """
-        prompt = get_naukri_optimizer_prompt(resume_text, target_role)
-        return self.generate_content(prompt)
+        prompt = get_naukri_optimizer_prompt(self._resume_ref(resume_text), target_role)
+        return self._generate(prompt, stream)
 
+    @engine_method
     def simulate_ats_parsing(self, resume_text):
         """
         Simulates how an ATS parses the resume.
         """
         prompt = get_ats_simulation_prompt(resume_text)
-        print("DEBUG: Sending prompt to Gemini...")
         raw_text = self.generate_content(prompt)
-        print(f"DEBUG: Raw Gemini response: {raw_text}")
-        
+        return self._parse_ats_simulation(raw_text)
+
+    def _parse_ats_simulation(self, raw_text):
         data = self._extract_json(raw_text)
         if data:
             return data
@@ -304,6 +745,7 @@ class IntelligenceEngine:
                 "raw_output": raw_text
             }
 
+    @engine_method
     def audit_resume_formatting(self, resume_text):
         """
         Audits the resume for formatting issues based on extracted text.
@@ -311,32 +753,45 @@ class IntelligenceEngine:
         prompt = get_formatting_audit_prompt(resume_text)
         return self.generate_content(prompt)
 
-    def parse_resume_json(self, resume_text):
+    @engine_method
+    def parse_resume_json(self, resume_text, min_confidence=LOW_CONFIDENCE, local_result=None):
         """
         Parses resume text into structured JSON for the builder.
+
+        Sections the local parser reads with at least min_confidence are kept as-is;
+        only the rest are requested from the model. local_result is a previous
+        parse_resume_local (data, confidence) pair to reuse.
         """
-        prompt = get_resume_parsing_prompt(resume_text)
-        raw_text = self.generate_content(prompt)
-        
-        data = self._extract_json(raw_text)
-        if data:
+        data, confidence = local_result or parse_resume_local(resume_text)
+        fields = low_confidence_fields(confidence, min_confidence)
+        METRICS.inc("devcareer_resume_local_fields_total", "parse_resume_json", len(confidence) - len(fields))
+        if not fields:
             return data
+        schema = OUTPUT_SCHEMAS["parse_resume_json"]
+        if len(fields) == len(schema["properties"]):
+            prompt = get_resume_parsing_prompt(self._resume_ref(resume_text))
         else:
-            print(f"Error parsing resume JSON from: {raw_text}")
-            return None
+            prompt = get_resume_sections_prompt(self._resume_ref(resume_text), fields)
+            schema = subschema(schema, fields)
+        llm_data = self.generate_json(prompt, schema)
+        if llm_data:
+            data.update({field: llm_data[field] for field in fields if field in llm_data})
+        return data
 
-    def generate_cover_letter(self, resume_text, job_description, tone="Professional"):
+    @engine_method
+    def generate_cover_letter(self, resume_text, job_description, tone="Professional", stream=False):
         """
         Generates a tailored cover letter.
         """
-        prompt = get_cover_letter_prompt(resume_text, job_description, tone)
-        return self.generate_content(prompt)
+        prompt = get_cover_letter_prompt(self._resume_ref(resume_text), job_description, tone)
+        return self._generate(prompt, stream)
 
+    @engine_method
     def generate_linkedin_profile_kit(self, role, region, resume_text):
         """
         Generates a JSON-based LinkedIn Profile Kit.
         """
-        prompt = get_linkedin_profile_kit_prompt(role, region, resume_text)
+        prompt = get_linkedin_profile_kit_prompt(role, region, self._resume_ref(resume_text))
         raw_text = self.generate_content(prompt)
         
         data = self._extract_json(raw_text)
@@ -346,20 +801,15 @@ class IntelligenceEngine:
             print(f"Error parsing Profile Kit JSON from: {raw_text}")
             return None
 
+    @engine_method
     def generate_linkedin_seo_audit(self, role, region, resume_text):
         """
         Generates a JSON-based LinkedIn SEO Audit.
         """
-        prompt = get_linkedin_seo_prompt(role, region, resume_text)
-        raw_text = self.generate_content(prompt)
-        
-        data = self._extract_json(raw_text)
-        if data:
-            return data
-        else:
-            print(f"Error parsing SEO Audit JSON from: {raw_text}")
-            return None
+        prompt = get_linkedin_seo_prompt(role, region, self._resume_ref(resume_text))
+        return self.generate_json(prompt, OUTPUT_SCHEMAS["generate_linkedin_seo_audit"])
 
+    @engine_method
     def generate_linkedin_visual_audit(self, role, industry_vibe, visual_input):
         """
         Generates a JSON-based LinkedIn Visual Audit.
@@ -374,6 +824,7 @@ class IntelligenceEngine:
             print(f"Error parsing Visual Audit JSON from: {raw_text}")
             return None
 
+    @engine_method
     def generate_linkedin_master_kit(self, role, region, industry, resume_text, visual_context=None, linkedin_url=None):
         """
         Generates a JSON-based Master LinkedIn Optimization Kit.
@@ -384,25 +835,21 @@ class IntelligenceEngine:
         if not linkedin_url:
             linkedin_url = "Not provided"
 
-        prompt = get_linkedin_master_prompt(role, region, industry, resume_text, visual_context, linkedin_url)
-        raw_text = self.generate_content(prompt)
-        
-        data = self._extract_json(raw_text)
-        if data:
-            return data
-        else:
-            print(f"Error parsing Master Kit JSON from: {raw_text}")
-            return None
+        prompt = get_linkedin_master_prompt(role, region, industry, self._resume_ref(resume_text), visual_context, linkedin_url)
+        return self.generate_json(prompt, OUTPUT_SCHEMAS["generate_linkedin_master_kit"])
 
+    @engine_method
     def extract_banner_content(self, linkedin_text, target_role):
         """
         Extracts custom hook, tagline, and LinkedIn URL from LinkedIn profile text for banner generation.
         """
         from .prompts import get_linkedin_banner_content_extraction_prompt
         
-        prompt = get_linkedin_banner_content_extraction_prompt(linkedin_text, target_role)
+        prompt = get_linkedin_banner_content_extraction_prompt(self._resume_ref(linkedin_text), target_role)
         raw_text = self.generate_content(prompt)
-        
+        return self._parse_banner_content(raw_text)
+
+    def _parse_banner_content(self, raw_text):
         data = self._extract_json(raw_text)
         if data:
             return data
@@ -410,13 +857,15 @@ class IntelligenceEngine:
             print(f"Error parsing Banner Content from: {raw_text}")
             return {"linkedin_url": "", "custom_hook": "", "custom_tagline": ""}
 
+    @engine_method
     def chat_with_resume_agent(self, query, resume_context):
         """
         Interacts with the AI Resume Agent.
         """
-        prompt = get_resume_agent_prompt(query, resume_context)
+        prompt = get_resume_agent_prompt(query, self._resume_ref(resume_context))
         return self.generate_content(prompt)
 
+    @engine_method
     def generate_logistics_strategy(self, market, notice_period, visa_status, location):
         """
         Generates a strategic availability note.
@@ -424,6 +873,7 @@ class IntelligenceEngine:
         prompt = get_logistics_prompt(market, notice_period, visa_status, location)
         return self.generate_content(prompt)
 
+    @engine_method
     def tune_bio_tone(self, target_market, bio_text):
         """
         Refines the bio tone based on target market.
@@ -499,20 +949,15 @@ class IntelligenceEngine:
             print(f"Error fetching LinkedIn data: {e}")
             return None
 
+    @engine_method
     def generate_service_page_proposal(self, project_details, profile_data):
         """
         Generates a Service Page Proposal.
         """
-        prompt = get_service_page_proposal_prompt(project_details, profile_data)
-        raw_text = self.generate_content(prompt)
-        
-        data = self._extract_json(raw_text)
-        if data:
-            return data
-        else:
-            print(f"Error parsing Service Page Proposal JSON from: {raw_text}")
-            return None
+        prompt = get_service_page_proposal_prompt(project_details, self._resume_ref(profile_data))
+        return self.generate_json(prompt, OUTPUT_SCHEMAS["generate_service_page_proposal"])
 
+    @engine_method
     def improve_content(self, text, target_role="Professional"):
         """
         Rewrites text for better impact.
@@ -520,20 +965,32 @@ class IntelligenceEngine:
         prompt = get_content_improver_prompt(text, target_role)
         return self.generate_content(prompt)
 
-    def match_keywords(self, resume_text, jd_text):
+    @engine_method
+    def match_keywords_batch(self, resume_text, jd_corpus, top_k=10):
         """
-        Compares resume against JD for keywords.
+        Top-k job descriptions of a JDCorpus for this resume, with matched/missing skills.
+        One sparse matrix-vector product over the whole corpus; no model call.
         """
-        prompt = get_keyword_matcher_prompt(resume_text, jd_text)
-        raw_text = self.generate_content(prompt)
-        return self._extract_json(raw_text)
+        return jd_corpus.top_matches(resume_text, top_k=top_k)
 
-    def generate_master_optimization(self, target_market, target_job, profile_text):
+    @engine_method
+    def match_keywords(self, resume_text, jd_text, use_llm=False):
+        """
+        Compares resume against JD for keywords. Scored locally (deterministic, a few ms)
+        unless use_llm is set.
+        """
+        if not use_llm:
+            return score_keywords(resume_text, jd_text)
+        prompt = get_keyword_matcher_prompt(self._resume_ref(resume_text), jd_text)
+        return self.generate_json(prompt, OUTPUT_SCHEMAS["match_keywords"])
+
+    @engine_method
+    def generate_master_optimization(self, target_market, target_job, profile_text, stream=False):
         """
         Generates the Master LinkedIn Optimization using the new market-specific prompt.
         """
-        prompt = get_master_prompt(target_market, target_job, profile_text)
-        return self.generate_content(prompt)
+        prompt = get_master_prompt(target_market, target_job, self._resume_ref(profile_text))
+        return self._generate(prompt, stream)
 
 
 
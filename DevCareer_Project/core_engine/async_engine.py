@@ -0,0 +1,215 @@
+# async_engine.py
+import json
+import time
+import asyncio
+import functools
+import threading
+
+from .ai_logic import _current_method, record_usage
+from .llm_metrics import METRICS
+from .output_schemas import OUTPUT_SCHEMAS, json_generation_config
+from .prompts import (
+    get_role_and_stack_extraction_prompt, get_ats_simulation_prompt,
+    get_formatting_audit_prompt, get_linkedin_banner_content_extraction_prompt
+)
+
+
+class _BackgroundLoop:
+    """
+    One long-lived event loop in a daemon thread.
+    The Gemini async client binds to the loop it was first used on, so every
+    coroutine from the (synchronous) Streamlit script is submitted to this loop.
+    """
+    _lock = threading.Lock()
+    _loop = None
+
+    @classmethod
+    def get(cls):
+        with cls._lock:
+            if cls._loop is None or cls._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="devcareer-async-llm", daemon=True)
+                thread.start()
+                cls._loop = loop
+            return cls._loop
+
+
+async def gather_bounded(*aws, limit=4, return_exceptions=False):
+    """
+    Like asyncio.gather, but runs at most `limit` awaitables at a time.
+    Results come back in argument order.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+def run_concurrently(*aws, limit=4, return_exceptions=False):
+    """
+    Synchronous entry point for the tabs: runs independent engine calls
+    concurrently and blocks until the slowest one finishes.
+    """
+    loop = _BackgroundLoop.get()
+    future = asyncio.run_coroutine_threadsafe(
+        gather_bounded(*aws, limit=limit, return_exceptions=return_exceptions), loop
+    )
+    return future.result()
+
+
+def async_engine_method(func):
+    """
+    Async counterpart of ai_logic.engine_method (keeps per-method cache policy working).
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        token = _current_method.set(func.__name__)
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            _current_method.reset(token)
+            METRICS.observe("devcareer_llm_method_seconds", func.__name__, time.perf_counter() - start)
+    return wrapper
+
+
+class AsyncIntelligenceEngine:
+    """
+    Asyncio-native facade over an IntelligenceEngine.
+    Shares the engine's model, response cache, single-flight and parsing helpers.
+    Calls that the tabs fan out use the provider's async client; every other
+    engine method is available as a coroutine that runs the sync method in a
+    worker thread.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def generate_content(self, prompt, use_cache=True):
+        """
+        Generates content using Gemini's async client.
+        """
+        if not self.engine._llm_ready():
+            return "Error: google-generativeai library not installed."
+
+        engine = self.engine
+        method = _current_method.get()
+        start = time.perf_counter()
+        cache_key = engine._cache_key(prompt) if use_cache else None
+        cached = engine._cache_get(cache_key, method)
+        if cached is not None:
+            return cached
+
+        def _fetch():
+            text = self._run_on_loop(loop, self._call_model(prompt, method))
+            if cache_key and text:
+                engine.cache.set(cache_key, text)
+            return text
+
+        loop = asyncio.get_running_loop()
+        try:
+            text = await self._coalesced(prompt, _fetch, cache_key, None, method)
+        except Exception as e:
+            return f"Error generating content: {str(e)}"
+
+        METRICS.observe("devcareer_llm_ttfb_seconds", method, time.perf_counter() - start)
+        return text
+
+    async def generate_json(self, prompt, schema, use_cache=True):
+        """
+        Async counterpart of IntelligenceEngine.generate_json (same cache entries).
+        """
+        if not self.engine._llm_ready():
+            return None
+
+        engine = self.engine
+        method = _current_method.get()
+        start = time.perf_counter()
+        config = json_generation_config(schema)
+        cache_key = engine._cache_key(prompt, generation_config=config) if use_cache else None
+        cached = engine._cache_get(cache_key, method)
+        if cached is not None:
+            return json.loads(cached)
+
+        def _fetch():
+            raw_text = self._run_on_loop(loop, self._call_model(prompt, method, config))
+            # Already in a worker thread: the rare field re-ask uses the sync client here
+            data, complete = engine._validate_structured(prompt, schema, raw_text)
+            payload = json.dumps(data) if data is not None else None
+            if cache_key and complete:
+                engine.cache.set(cache_key, payload)
+            return payload
+
+        loop = asyncio.get_running_loop()
+        try:
+            payload = await self._coalesced(prompt, _fetch, cache_key, config, method)
+        except Exception as e:
+            print(f"Error generating content: {str(e)}")
+            return None
+
+        METRICS.observe("devcareer_llm_ttfb_seconds", method, time.perf_counter() - start)
+        # Each caller gets its own copy, as with the sync engine
+        return json.loads(payload) if payload is not None else None
+
+    async def _coalesced(self, prompt, fetch, cache_key, generation_config, method):
+        """
+        Runs fetch through the engine's SingleFlight in a worker thread, so identical calls from
+        coroutines and from sync tabs share one upstream request and count as coalesced.
+        """
+        return await asyncio.to_thread(self.engine._coalesced, prompt, fetch, cache_key, generation_config, method)
+
+    @staticmethod
+    def _run_on_loop(loop, coro):
+        # The leader's worker thread waits while the async client call runs on the event loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _call_model(self, prompt, method, generation_config=None):
+        METRICS.inc("devcareer_llm_calls_total", method)
+        try:
+            model, prompt = self.engine._model_for(prompt)
+            if generation_config:
+                response = await model.generate_content_async(prompt, generation_config=generation_config)
+            else:
+                response = await model.generate_content_async(prompt)
+            text = response.text
+        except Exception:
+            METRICS.inc("devcareer_llm_errors_total", method)
+            raise
+        record_usage(response, method)
+        return text
+
+    @async_engine_method
+    async def extract_role_and_stack(self, resume_text):
+        prompt = get_role_and_stack_extraction_prompt(self.engine._resume_ref(resume_text))
+        data = await self.generate_json(prompt, OUTPUT_SCHEMAS["extract_role_and_stack"])
+        return self.engine._complete_role_and_stack(data, resume_text)
+
+    @async_engine_method
+    async def extract_banner_content(self, linkedin_text, target_role):
+        prompt = get_linkedin_banner_content_extraction_prompt(self.engine._resume_ref(linkedin_text), target_role)
+        raw_text = await self.generate_content(prompt)
+        return self.engine._parse_banner_content(raw_text)
+
+    @async_engine_method
+    async def simulate_ats_parsing(self, resume_text):
+        prompt = get_ats_simulation_prompt(resume_text)
+        raw_text = await self.generate_content(prompt)
+        return self.engine._parse_ats_simulation(raw_text)
+
+    @async_engine_method
+    async def audit_resume_formatting(self, resume_text):
+        prompt = get_formatting_audit_prompt(resume_text)
+        return await self.generate_content(prompt)
+
+    def __getattr__(self, name):
+        attr = getattr(self.engine, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def _threaded(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+        return _threaded
@@ -0,0 +1,130 @@
+# banner_layers.py
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+from .lazy_imports import LazyImport
+from .response_cache import DEFAULT_CACHE_DIR
+
+Image = LazyImport("PIL.Image")
+
+# Bump when the background drawing code changes so stale disk layers are not served
+LAYER_VERSION = 1
+
+
+class BackgroundLayerCache:
+    """
+    Pre-rendered banner template backgrounds keyed on (template, width, height).
+
+    The static decoration of a template is drawn once and kept in a memory LRU, so a
+    banner only has to draw its dynamic layers on a copy. render(template_key, width,
+    height) produces a missing layer. With disk_dir set, layers are also written there
+    as raw RGB (~1.9 MB each); that only pays off where drawing is slower than reading
+    the file back, so it is off by default.
+    """
+
+    def __init__(self, disk_dir=None, max_items=32):
+        self.disk_dir = disk_dir
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "renders": 0}
+
+    def _disk_path(self, key, template):
+        # The template definition is part of the file name, so editing its colors invalidates it
+        digest = hashlib.sha256(json.dumps([LAYER_VERSION, template], sort_keys=True, default=str).encode("utf-8"))
+        template_key, width, height = key
+        return os.path.join(self.disk_dir, f"{template_key}-{width}x{height}-{digest.hexdigest()[:12]}.rgb")
+
+    def _load(self, path, size):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) != size[0] * size[1] * 3:
+            return None
+        return Image.frombytes("RGB", size, data)
+
+    def _save(self, path, image):
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(image.tobytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write banner layer cache ({e})")
+            return
+        self._prune(path)
+
+    def _prune(self, path):
+        # Older versions of this layer (another LAYER_VERSION or template definition) are never read again
+        name = os.path.basename(path)
+        stem = name[:name.rindex("-") + 1]
+        for other in os.listdir(self.disk_dir):
+            if other.startswith(stem) and other.endswith(".rgb") and other != name:
+                try:
+                    os.remove(os.path.join(self.disk_dir, other))
+                except OSError:
+                    pass
+
+    def get(self, template_key, width, height, template, render):
+        """
+        Returns a copy of the background for (template_key, width, height), ready to draw on.
+        """
+        key = (template_key, width, height)
+        with self._lock:
+            layer = self._memory.get(key)
+            if layer is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return layer.copy()
+
+        layer = None
+        path = self._disk_path(key, template) if self.disk_dir else None
+        if path:
+            layer = self._load(path, (width, height))
+            if layer is not None:
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+        if layer is None:
+            layer = render(template_key, width, height)
+            with self._lock:
+                self.stats["renders"] += 1
+            if path:
+                self._save(path, layer)
+
+        with self._lock:
+            self._memory[key] = layer
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+        return layer.copy()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, memory_items=len(self._memory))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_background_cache():
+    """
+    Process-wide, memory-only cache. Set DEVCAREER_BANNER_LAYER_DISK=1 to also keep the
+    layers under DEVCAREER_CACHE_DIR.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            disk_dir = os.path.join(DEFAULT_CACHE_DIR, "banner_layers") if os.getenv("DEVCAREER_BANNER_LAYER_DISK") else None
+            _default = BackgroundLayerCache(disk_dir=disk_dir)
+        return _default
@@ -0,0 +1,115 @@
+# batch_runner.py
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Exception names / message fragments that mean "try again later" on the Gemini API
+RETRYABLE_ERROR_NAMES = {
+    "ResourceExhausted", "TooManyRequests", "ServiceUnavailable",
+    "DeadlineExceeded", "InternalServerError", "Aborted", "Unavailable",
+    "TimeoutError", "ConnectionError"
+}
+RETRYABLE_ERROR_MARKERS = (
+    "429", "503", "504", "500 internal", "quota", "rate limit",
+    "deadline exceeded", "timed out", "temporarily unavailable"
+)
+
+
+def is_retryable_error(error):
+    """
+    True for rate limits, timeouts and transient server errors.
+    """
+    if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in RETRYABLE_ERROR_MARKERS)
+
+
+def estimate_tokens(text):
+    """
+    Rough token estimate (~4 characters per token) used for TPM budgeting.
+    """
+    return max(1, len(str(text)) // 4)
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=30.0):
+    """
+    Exponential backoff with full jitter for the given (1-based) retry attempt.
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate_per_minute`.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self, amount=1):
+        """
+        Blocks until `amount` tokens are available, then takes them.
+        Requests larger than the bucket are clamped so they can still run.
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate_per_second
+            time.sleep(min(wait, 1.0))
+
+
+def run_batch(call, prompts, max_concurrency=4, rpm=None, tpm=None, max_retries=4, base_delay=1.0, max_delay=30.0):
+    """
+    Runs call(prompt) for every prompt on a worker pool behind RPM/TPM token buckets.
+    Retryable errors are retried with jittered exponential backoff.
+
+    Returns one dict per prompt, in input order:
+        {"index", "status": "ok" | "error", "text", "error", "attempts", "latency_s"}
+    """
+    request_bucket = TokenBucket(rpm) if rpm else None
+    token_bucket = TokenBucket(tpm) if tpm else None
+
+    def _run_one(index, prompt):
+        start = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            if request_bucket:
+                request_bucket.acquire(1)
+            if token_bucket:
+                token_bucket.acquire(estimate_tokens(prompt))
+            try:
+                text = call(prompt)
+                return {
+                    "index": index, "status": "ok", "text": text, "error": None,
+                    "attempts": attempts, "latency_s": round(time.perf_counter() - start, 4)
+                }
+            except Exception as e:
+                if attempts > max_retries or not is_retryable_error(e):
+                    return {
+                        "index": index, "status": "error", "text": None, "error": str(e),
+                        "attempts": attempts, "latency_s": round(time.perf_counter() - start, 4)
+                    }
+                time.sleep(backoff_delay(attempts, base_delay, max_delay))
+
+    prompts = list(prompts)
+    if not prompts:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(prompts)))) as pool:
+        futures = [pool.submit(_run_one, i, p) for i, p in enumerate(prompts)]
+        return [f.result() for f in futures]
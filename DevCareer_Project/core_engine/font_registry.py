@@ -0,0 +1,176 @@
+# font_registry.py
+import os
+import re
+import time
+import threading
+
+from .lazy_imports import LazyImport
+from .llm_metrics import METRICS
+
+ImageFont = LazyImport("PIL.ImageFont")
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+# First file name found wins; Arial where it exists, then the metric-compatible Linux families
+FONT_PREFERENCES = {
+    "regular": ("arial.ttf", "liberationsans-regular.ttf", "dejavusans.ttf", "notosans-regular.ttf",
+                "freesans.ttf", "helvetica.ttc"),
+    "bold": ("arialbd.ttf", "liberationsans-bold.ttf", "dejavusans-bold.ttf", "notosans-bold.ttf",
+             "freesansbold.ttf", "helvetica.ttc"),
+}
+
+# Sizes the visual factory draws with, including the auto-fit ranges of the banner hook and tagline
+PRELOAD_SIZES = {
+    "regular": (16, 20, 21, 22, 23, 24, 25, 26, 27, 28, 40),
+    "bold": tuple(range(32, 49)) + (50, 60, 80),
+}
+
+FONTCONFIG_FILES = ("/etc/fonts/fonts.conf", "~/.config/fontconfig/fonts.conf")
+_DIR_PATTERN = re.compile(r"<dir(?P<attrs>[^>]*)>\s*(?P<path>[^<]+?)\s*</dir>")
+
+
+def fontconfig_dirs(config_files=None):
+    """
+    <dir> entries of the fontconfig configuration (FONTCONFIG_FILE overrides the system file).
+    """
+    if config_files is None:
+        config_files = [os.environ["FONTCONFIG_FILE"]] if os.getenv("FONTCONFIG_FILE") else FONTCONFIG_FILES
+    data_home = os.getenv("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    dirs = []
+    for config_file in config_files:
+        try:
+            with open(os.path.expanduser(config_file), encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            continue
+        for match in _DIR_PATTERN.finditer(text):
+            path = match.group("path")
+            if 'prefix="xdg"' in match.group("attrs"):
+                path = os.path.join(data_home, path)
+            dirs.append(os.path.expanduser(path))
+    return dirs
+
+
+def font_search_dirs():
+    """
+    DEVCAREER_FONT_DIRS (os.pathsep-separated) first, then fontconfig and the usual OS locations.
+    """
+    dirs = [d for d in os.getenv("DEVCAREER_FONT_DIRS", "").split(os.pathsep) if d]
+    dirs += fontconfig_dirs()
+    if os.name == "nt":
+        dirs.append(os.path.join(os.getenv("WINDIR", "C:\\Windows"), "Fonts"))
+    dirs += ["/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts"),
+             "/Library/Fonts", "/System/Library/Fonts"]
+    unique = []
+    for d in dirs:
+        if d not in unique:
+            unique.append(d)
+    return unique
+
+
+class FontRegistry:
+    """
+    Thread-safe, process-wide TrueType font cache keyed on (style, size).
+
+    Font files are discovered once by walking font_dirs; every VisualFactory shares the
+    loaded FreeTypeFont objects. Without a TrueType font Pillow's bundled default is used.
+    """
+
+    def __init__(self, font_dirs=None, preferences=FONT_PREFERENCES):
+        self.font_dirs = list(font_dirs) if font_dirs is not None else font_search_dirs()
+        self.preferences = preferences
+        self._paths = None
+        self._fonts = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "loads": 0, "fallbacks": 0, "discover_seconds": 0.0, "load_seconds": 0.0}
+
+    def _discover(self):
+        start = time.perf_counter()
+        found = {}
+        for font_dir in self.font_dirs:
+            for root, _, files in os.walk(font_dir):
+                for name in files:
+                    if name.lower().endswith(FONT_EXTENSIONS):
+                        found.setdefault(name.lower(), os.path.join(root, name))
+        paths = {}
+        for style, names in self.preferences.items():
+            paths[style] = next((found[name] for name in names if name in found), None)
+        elapsed = time.perf_counter() - start
+        self.stats["discover_seconds"] += elapsed
+        METRICS.observe("devcareer_font_load_seconds", "discover", elapsed)
+        return paths
+
+    def paths(self):
+        """
+        {style: font file path or None}, discovered on first use.
+        """
+        with self._lock:
+            if self._paths is None:
+                self._paths = self._discover()
+            return dict(self._paths)
+
+    @property
+    def has_truetype(self):
+        return all(self.paths().values())
+
+    def get(self, size, bold=False):
+        style = "bold" if bold else "regular"
+        key = (style, size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.stats["hits"] += 1
+                return font
+            if self._paths is None:
+                self._paths = self._discover()
+            # Loading under the lock keeps threads racing on a cold size from opening it twice
+            start = time.perf_counter()
+            font = self._load(self._paths.get(style), size)
+            self.stats["load_seconds"] += time.perf_counter() - start
+            self.stats["loads"] += 1
+            self._fonts[key] = font
+            return font
+
+    def _load(self, path, size):
+        if path:
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError as e:
+                print(f"Warning: could not load font {path} ({e})")
+        self.stats["fallbacks"] += 1
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            # Pillow < 10.1 has no scalable default font
+            return ImageFont.load_default()
+
+    def preload(self, sizes=PRELOAD_SIZES):
+        """
+        Loads every (style, size) the generators use, e.g. at startup. Returns the seconds spent.
+        """
+        start = time.perf_counter()
+        for style, style_sizes in sizes.items():
+            for size in style_sizes:
+                self.get(size, bold=style == "bold")
+        elapsed = time.perf_counter() - start
+        METRICS.observe("devcareer_font_load_seconds", "preload", elapsed)
+        return elapsed
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, fonts=len(self._fonts), paths=dict(self._paths or {}))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_font_registry():
+    """
+    Process-wide registry searching font_search_dirs().
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = FontRegistry()
+        return _default
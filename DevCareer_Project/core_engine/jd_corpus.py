@@ -0,0 +1,229 @@
+# jd_corpus.py
+import os
+import json
+import uuid
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: rebuilds are serialized in-process only
+    fcntl = None
+
+from .keyword_scoring import extract_terms, scored_jd_terms, term_weight, bm25_idf, BM25_K1
+
+# Terms of a large JD corpus are extracted once (uncached: the LRU is for live UI text)
+_extract_uncached = extract_terms.__wrapped__
+_ARRAYS = ("indptr", "indices", "data", "row_ids", "row_totals")
+_META_FILE = "jd_corpus.json"
+_LOCK_FILE = "jd_corpus.lock"
+_rebuild_thread_lock = threading.Lock()
+
+
+@contextmanager
+def rebuild_lock(directory):
+    """
+    Held while a corpus is rebuilt into directory: workers (processes via flock, threads in
+    this process) take turns, so none deletes files another is still writing.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with _rebuild_thread_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(directory, _LOCK_FILE), "a+") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def manifest_version(directory):
+    """
+    Changes whenever save() swaps in a new corpus (None if there is none); cheap to poll.
+    """
+    try:
+        return os.stat(os.path.join(directory, _META_FILE)).st_mtime_ns
+    except OSError:
+        return None
+
+
+class JDCorpus:
+    """
+    Many job descriptions vectorized once into a sparse JD x term weight matrix (CSR arrays),
+    so one resume is scored against all of them with a single sparse matrix-vector product.
+
+    Weights are the keyword scorer's (BM25-saturated tf x corpus IDF x term-kind boost) and a
+    JD's score is the share of its total weight the resume covers, as in match_keywords.
+    """
+
+    def __init__(self, terms, kinds, indptr, indices, data, ids=None, row_ids=None, row_totals=None, stamp=None):
+        self.terms = list(terms)
+        self.kinds = list(kinds)
+        self.vocab = {term: col for col, term in enumerate(self.terms)}
+        self.is_skill = np.asarray([kind == "skill" for kind in kinds], dtype=bool)
+        # asarray keeps memory-mapped arrays (see load) as they are instead of copying them
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.float32)
+        self.ids = list(ids) if ids is not None else list(range(len(self)))
+        self.stamp = stamp
+        if row_ids is None:
+            row_ids = np.repeat(np.arange(len(self), dtype=np.int32), np.diff(self.indptr))
+        self._row_ids = np.asarray(row_ids, dtype=np.int32)
+        if row_totals is None:
+            row_totals = np.bincount(self._row_ids, weights=self.data, minlength=len(self))
+        self._row_totals = np.asarray(row_totals, dtype=np.float64)
+        # id -> row, so a single posting is looked up without scanning ids
+        self.rows = {job_id: row for row, job_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @classmethod
+    def build(cls, jd_texts, ids=None, k1=BM25_K1):
+        """
+        Vectorizes an iterable of JD texts. IDF is learnt from the corpus itself.
+        """
+        vocab = {}
+        kinds = []
+        row_lengths = []
+        cols = []
+        counts = []
+        for text in jd_texts:
+            row = scored_jd_terms(_extract_uncached(text))
+            for term, kind, count in row:
+                col = vocab.get(term)
+                if col is None:
+                    col = vocab[term] = len(kinds)
+                    kinds.append(kind)
+                cols.append(col)
+                counts.append(count)
+            row_lengths.append(len(row))
+
+        indices = np.asarray(cols, dtype=np.int32)
+        doc_freq = np.bincount(indices, minlength=len(kinds))
+        n_docs = len(row_lengths)
+        # Per-column weight at tf=1 (idf x kind boost), then BM25 tf saturation per entry
+        unit = np.asarray([term_weight(kind, 1, bm25_idf(df, n_docs), k1) for kind, df in zip(kinds, doc_freq)])
+        tf = np.asarray(counts, dtype=np.float64)
+        data = (tf * (k1 + 1) / (tf + k1) * unit[indices]).astype(np.float32)
+        indptr = np.zeros(n_docs + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(row_lengths)
+        return cls(list(vocab), kinds, indptr, indices, data, ids)
+
+    def save(self, directory, stamp=None):
+        """
+        Writes the arrays as .npy files plus a JSON manifest, for load() to memory-map.
+        stamp tags the corpus version (e.g. the job store's) so readers can tell it is stale.
+        Concurrent writers should hold rebuild_lock(directory).
+        """
+        os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, _META_FILE)
+        try:
+            replaced_mtime = os.stat(meta_path).st_mtime
+        except OSError:
+            replaced_mtime = None
+        prefix = f"jd_corpus-{uuid.uuid4().hex[:12]}"
+        arrays = dict(zip(_ARRAYS, (self.indptr, self.indices, self.data, self._row_ids, self._row_totals)))
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, f"{prefix}.{name}.npy"), np.ascontiguousarray(array))
+        manifest = {"prefix": prefix, "stamp": stamp, "terms": self.terms, "kinds": self.kinds, "ids": self.ids}
+        tmp_path = os.path.join(directory, f"{prefix}.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        # The manifest is swapped in last, so readers only ever see a complete corpus
+        os.replace(tmp_path, meta_path)
+        if replaced_mtime is not None:
+            # Only files of the corpus just replaced (or older): newer ones may belong to a writer in progress
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if not name.startswith("jd_corpus-") or name.startswith(prefix):
+                    continue
+                try:
+                    if os.stat(path).st_mtime <= replaced_mtime:
+                        os.remove(path)
+                except OSError:
+                    pass  # already gone, or still mapped by another process (Windows); removed next time
+        self.stamp = stamp
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        """
+        Corpus saved by save(), or None if there is none. With mmap_mode the arrays are
+        memory-mapped, so every process serving the same corpus shares one page-cache copy.
+        """
+        try:
+            with open(os.path.join(directory, _META_FILE), encoding="utf-8") as f:
+                manifest = json.load(f)
+            arrays = {
+                name: np.load(os.path.join(directory, f"{manifest['prefix']}.{name}.npy"), mmap_mode=mmap_mode)
+                for name in _ARRAYS
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(manifest["terms"], manifest["kinds"], ids=manifest["ids"], stamp=manifest.get("stamp"), **arrays)
+
+    def resume_vector(self, resume_text):
+        """
+        0/1 presence of each corpus term in the resume.
+        """
+        x = np.zeros(len(self.terms), dtype=np.float32)
+        cols = [self.vocab[term] for term in extract_terms(resume_text) if term in self.vocab]
+        x[cols] = 1.0
+        return x
+
+    def scores(self, resume_text):
+        """
+        0-100 keyword match of the resume against every JD (float array, corpus order).
+        """
+        return self._scores(self.resume_vector(resume_text))
+
+    def _scores(self, x):
+        # Sparse matrix-vector product: each stored weight times the resume's presence bit, summed per row
+        covered = np.bincount(self._row_ids, weights=self.data * x[self.indices], minlength=len(self))
+        return 100.0 * covered / np.maximum(self._row_totals, 1e-9)
+
+    def top_matches(self, resume_text, top_k=10, max_skills=15):
+        """
+        Best-matching JDs, best first: [{"id", "index", "match_score", "matching_skills", "missing_skills"}].
+        Skill lists are ordered by their weight in that JD.
+        """
+        if not len(self):
+            return []
+        x = self.resume_vector(resume_text)
+        scores = self._scores(x)
+
+        k = min(top_k, len(self))
+        top = np.argpartition(-scores, k - 1)[:k]
+        # Ties are broken by corpus position so results are reproducible
+        top = top[np.lexsort((top, -scores[top]))]
+
+        return [self._describe(row, x, scores[row], max_skills) for row in top]
+
+    def match(self, resume_text, index, max_skills=15):
+        """
+        The top_matches entry for one JD (by corpus position), without scoring the rest.
+        """
+        x = self.resume_vector(resume_text)
+        start, stop = self.indptr[index], self.indptr[index + 1]
+        covered = float(np.dot(self.data[start:stop], x[self.indices[start:stop]]))
+        return self._describe(index, x, 100.0 * covered / max(self._row_totals[index], 1e-9), max_skills)
+
+    def _describe(self, row, x, score, max_skills):
+        start, stop = self.indptr[row], self.indptr[row + 1]
+        cols = self.indices[start:stop]
+        skills = self.is_skill[cols]
+        cols, weights = cols[skills], self.data[start:stop][skills]
+        cols = cols[np.argsort(-weights, kind="stable")]
+        present = x[cols] > 0
+        return {
+            "id": self.ids[row],
+            "index": int(row),
+            "match_score": int(round(float(score))),
+            "matching_skills": [self.terms[c] for c in cols[present][:max_skills]],
+            "missing_skills": [self.terms[c] for c in cols[~present][:max_skills]],
+        }
@@ -0,0 +1,500 @@
+# job_store.py
+import os
+import re
+import csv
+import sys
+import gzip
+import html
+import json
+import time
+import hashlib
+import sqlite3
+import datetime
+import threading
+from collections import OrderedDict
+
+from .response_cache import DEFAULT_CACHE_DIR
+from .keyword_scoring import tokenize
+from .jd_corpus import JDCorpus, rebuild_lock
+
+# Job feeds (Naukri / Monster / Naukri Gulf exports, JSONL or CSV) streamed into a SQLite FTS5 store.
+# Reposts are deduped by a content hash, so a daily feed only inserts (and indexes) postings
+# that are actually new.
+
+DEFAULT_STORE_PATH = os.path.join(DEFAULT_CACHE_DIR, "jobs.sqlite3")
+DEFAULT_MATRIX_DIR = os.path.join(DEFAULT_CACHE_DIR, "job_matrix")
+BATCH_SIZE = 2000
+# A query is ranked over at most this many of its matches (the most recently ingested ones)
+RANK_CANDIDATES = 5000
+# Facet cross-tabs kept per (query, date range); dropped whenever the database changes
+CROSSTAB_CACHE_SIZE = 64
+
+# BM25 column weights of the FTS index, and the fields offered as filters
+FIELD_WEIGHTS = {"title": 3.0, "company": 2.0, "desc": 1.0}
+FACETS = ("location", "source")
+_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d", "%d %b %Y", "%d/%m/%Y")
+
+# Feed column -> job record field; keys are compared lowercased with punctuation removed
+FIELD_ALIASES = {
+    "title": ("title", "jobtitle", "designation", "position", "role"),
+    "company": ("company", "companyname", "employer", "organization", "organisation"),
+    "location": ("location", "joblocation", "locations", "city", "placeholderslocation"),
+    "source": ("source", "jobsource", "portal", "site"),
+    "desc": ("desc", "description", "jobdescription", "summary", "snippet"),
+    "date": ("date", "posteddate", "postedon", "dateposted", "createddate", "createdat", "footerplaceholderlabel"),
+    "url": ("url", "joburl", "jdurl", "applyurl", "link"),
+    "logo": ("logo",),
+}
+_KEY_RE = re.compile(r"[^a-z0-9]")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    source TEXT NOT NULL,
+    description TEXT NOT NULL,
+    date TEXT NOT NULL,
+    date_ord INTEGER NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    logo TEXT NOT NULL DEFAULT '',
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_recent ON jobs(date_ord DESC, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location, date_ord DESC, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source, date_ord DESC, id);
+-- Covers the location x source facet counts without touching table rows
+CREATE INDEX IF NOT EXISTS idx_jobs_facets ON jobs(location, source, date_ord);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description, content='jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, description) VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, company, description ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, description) VALUES (new.id, new.title, new.company, new.description);
+END;
+"""
+
+# A repost refreshes the posting date (and last_seen) but leaves the indexed text alone
+_UPSERT = """
+INSERT INTO jobs (hash, title, company, location, source, description, date, date_ord, url, logo, first_seen, last_seen)
+VALUES (:hash, :title, :company, :location, :source, :desc, :date, :date_ord, :url, :logo, :seen, :seen)
+ON CONFLICT(hash) DO UPDATE SET
+    last_seen = excluded.last_seen,
+    date = CASE WHEN excluded.date_ord > jobs.date_ord THEN excluded.date ELSE jobs.date END,
+    date_ord = max(jobs.date_ord, excluded.date_ord)
+"""
+_COLUMNS = "j.id, j.title, j.company, j.location, j.source, j.description, j.date, j.url, j.logo"
+# bm25() is lower-is-better; negated so higher scores rank first and cursors compare naturally
+_RANK = "-bm25(jobs_fts, {title}, {company}, {desc})".format(**FIELD_WEIGHTS)
+
+
+def _clean(value):
+    if isinstance(value, (list, tuple)):
+        value = ", ".join(str(v) for v in value if v)
+    text = html.unescape(_TAG_RE.sub(" ", str(value or "")))
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def parse_job_date(value):
+    """
+    datetime.date for the date strings seen in feeds, else None.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    text = str(value or "").strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.date.fromisoformat(text[:10])
+    except ValueError:
+        return None
+
+
+def index_terms(text):
+    return [token for segment in tokenize(text) for token, _ in segment]
+
+
+def encode_cursor(score, doc_id):
+    return f"{float(score)!r}:{int(doc_id)}"
+
+
+def decode_cursor(cursor):
+    score, _, doc_id = cursor.rpartition(":")
+    return float(score), int(doc_id)
+
+
+def normalize_job(record, source=None):
+    """
+    Maps a raw feed record onto the job record shape
+    ({"title", "company", "location", "source", "desc", "date", "url", "logo"}), or None if unusable.
+    """
+    if not isinstance(record, dict):
+        return None
+    by_key = {_KEY_RE.sub("", str(key).lower()): value for key, value in record.items()}
+    job = {}
+    for field, aliases in FIELD_ALIASES.items():
+        job[field] = next((_clean(by_key[alias]) for alias in aliases if by_key.get(alias)), "")
+    if not job["title"]:
+        return None
+    job["source"] = job["source"] or source or ""
+    posted = parse_job_date(job["date"])
+    job["date"] = posted.strftime("%b %d, %Y") if posted else ""
+    return job
+
+
+def _date_ord(date_text):
+    posted = parse_job_date(date_text)
+    return posted.toordinal() if posted else 0
+
+
+def content_hash(job):
+    """
+    Identity of a posting: reposts (same title, company, location and text) share it,
+    whatever their date or the portal they came from.
+    """
+    parts = (job["title"], job["company"], job["location"], job["desc"])
+    return hashlib.sha256("\x1f".join(p.casefold() for p in parts).encode("utf-8")).hexdigest()
+
+
+def _open_text(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def iter_feed(path, fmt=None):
+    """
+    Streams raw records (dicts) from a JSONL or CSV feed (optionally .gz), one line at a time.
+    Unparseable JSON lines come through as None.
+    """
+    if fmt is None:
+        name = path[:-3] if path.endswith(".gz") else path
+        fmt = "csv" if name.lower().endswith(".csv") else "jsonl"
+    with _open_text(path) as handle:
+        if fmt == "csv":
+            # Descriptions can exceed the csv module's default 128 KB field limit
+            csv.field_size_limit(max(csv.field_size_limit(), 16 * 1024 * 1024))
+            yield from csv.DictReader(handle)
+            return
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
+
+
+def _job_record(row):
+    return {
+        "id": row["id"], "title": row["title"], "company": row["company"], "location": row["location"],
+        "source": row["source"], "desc": row["description"], "date": row["date"], "url": row["url"],
+        "logo": row["logo"],
+    }
+
+
+def _as_list(value):
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _fts_query(query):
+    terms = dict.fromkeys(index_terms(query))
+    # Each term quoted so punctuation (c++, node.js) is not read as FTS syntax; any term may match
+    return " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+class JobStore:
+    """
+    On-disk job postings with an FTS5 index on title/company/description.
+
+    ingest() writes in batched transactions and upserts on the content hash; triggers keep
+    the FTS index in step row by row, so updates never rebuild it. search() ranks by BM25
+    relevance (or newest first without a query), with facet counts and a keyset cursor.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._facet_cache = (None, {})
+        self._crosstab_version = None
+        self._crosstab_cache = OrderedDict()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def has_jobs(self):
+        with self._lock:
+            return bool(self._conn.execute("SELECT EXISTS(SELECT 1 FROM jobs)").fetchone()[0])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def ingest(self, records, source=None, batch_size=BATCH_SIZE):
+        """
+        Normalizes and upserts an iterable of raw records. Memory is bounded by batch_size.
+        Returns {"read", "inserted", "reposted", "skipped"}.
+        """
+        stats = {"read": 0, "inserted": 0, "reposted": 0, "skipped": 0}
+        batch = {}
+        for record in records:
+            stats["read"] += 1
+            job = normalize_job(record, source)
+            if job is None:
+                stats["skipped"] += 1
+                continue
+            key = content_hash(job)
+            if key in batch:
+                # Repost within the same batch: keep the newest date
+                stats["reposted"] += 1
+                batch[key]["date"] = max(batch[key]["date"], job["date"], key=_date_ord)
+                continue
+            batch[key] = job
+            if len(batch) >= batch_size:
+                self._write_batch(batch, stats)
+                batch = {}
+        if batch:
+            self._write_batch(batch, stats)
+        return stats
+
+    def ingest_feed(self, path, source=None, fmt=None, batch_size=BATCH_SIZE):
+        return self.ingest(iter_feed(path, fmt), source=source, batch_size=batch_size)
+
+    def _write_batch(self, batch, stats):
+        now = time.time()
+        keys = list(batch)
+        rows = [dict(batch[key], hash=key, date_ord=_date_ord(batch[key]["date"]), seen=now) for key in keys]
+        with self._lock, self._conn:
+            existing = 0
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                existing += self._conn.execute(
+                    f"SELECT COUNT(*) FROM jobs WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchone()[0]
+            self._conn.executemany(_UPSERT, rows)
+            # data_version only moves for other connections' commits, so this one's are reset here
+            self._facet_cache = (None, {})
+            self._crosstab_cache.clear()
+        stats["reposted"] += existing
+        stats["inserted"] += len(rows) - existing
+
+    def stamp(self):
+        """
+        Changes whenever postings are added, so derived data (the job matrix) can tell it is stale.
+        Reposts only touch dates, which the matrix does not use.
+        """
+        with self._lock:
+            count, max_id = self._conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM jobs").fetchone()
+        return f"{count}-{max_id}"
+
+    def iter_texts(self, batch_size=BATCH_SIZE):
+        """
+        (id, text) for every posting in id order, fetched a batch at a time.
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, title, description FROM jobs WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row["id"], f"{row['title']}\n{row['description']}"
+            last_id = rows[-1]["id"]
+
+    def get_jobs(self, ids):
+        """
+        Job records for the given ids, in that order (unknown ids are dropped).
+        """
+        ids = list(ids)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs j WHERE j.id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall() if ids else []
+        by_id = {row["id"]: _job_record(row) for row in rows}
+        return [by_id[job_id] for job_id in ids if job_id in by_id]
+
+    def facet_values(self, facet):
+        if facet not in FACETS:
+            raise ValueError(f"Unknown facet: {facet}")
+        with self._lock:
+            return self._facet_values_locked(facet)
+
+    def _facet_values_locked(self, facet):
+        # Cached until the database changes; data_version also moves when another process
+        # (e.g. a daily ingest run) commits to the same file
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        cached_version, values = self._facet_cache
+        if cached_version != version:
+            values = {}
+            self._facet_cache = (version, values)
+        if facet not in values:
+            values[facet] = [row[0] for row in self._conn.execute(f"SELECT DISTINCT {facet} FROM jobs ORDER BY {facet}")]
+        return values[facet]
+
+    def _crosstab_locked(self, from_sql, clauses, params):
+        # Same invalidation as the facet values: a new data_version (another process committed) drops it
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._crosstab_version:
+            self._crosstab_version = version
+            self._crosstab_cache.clear()
+        key = (from_sql, tuple(clauses), tuple(params))
+        crosstab = self._crosstab_cache.get(key)
+        if crosstab is None:
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            crosstab = self._conn.execute(
+                f"SELECT j.location, j.source, COUNT(*) FROM {from_sql}{where} GROUP BY j.location, j.source", params
+            ).fetchall()
+            self._crosstab_cache[key] = crosstab
+            while len(self._crosstab_cache) > CROSSTAB_CACHE_SIZE:
+                self._crosstab_cache.popitem(last=False)
+        else:
+            self._crosstab_cache.move_to_end(key)
+        return crosstab
+
+    def _filters(self, location=None, source=None, date_from=None, date_to=None):
+        clauses, params = [], []
+        for facet, value in (("location", location), ("source", source)):
+            if value is None:
+                continue
+            values = _as_list(value)
+            clauses.append(f"j.{facet} IN ({','.join('?' * len(values))})" if values else "0")
+            params.extend(values)
+        if date_from is not None:
+            clauses.append("j.date_ord >= ?")
+            params.append(parse_job_date(date_from).toordinal())
+        if date_to is not None:
+            clauses.append("j.date_ord <= ?")
+            params.append(parse_job_date(date_to).toordinal())
+        return clauses, params
+
+    def search(self, query="", location=None, source=None, date_from=None, date_to=None,
+               limit=10, cursor=None):
+        """
+        Returns {"jobs", "next_cursor", "total", "facets"}. location and source take a value or a list;
+        facets holds per-value counts for each of FACETS.
+
+        Totals and facet counts cover every match. Ranking is capped: a query is ranked over its
+        RANK_CANDIDATES most recently ingested matches, and the cursor pages through that ranking.
+        """
+        match = _fts_query(query) if query else ""
+        if match:
+            # CROSS JOIN makes the FTS match drive the join; otherwise the planner may walk a
+            # facet index and re-run the match for every row
+            from_sql, score_sql = "jobs_fts CROSS JOIN jobs j ON j.id = jobs_fts.rowid", _RANK
+            base_clauses, base_params = ["jobs_fts MATCH ?"], [match]
+            # FTS5 yields matches in rowid order, so this LIMIT ends the scan early and BM25
+            # is computed for at most RANK_CANDIDATES rows rather than every match
+            window_sql = f" ORDER BY jobs_fts.rowid DESC LIMIT {RANK_CANDIDATES}"
+        else:
+            from_sql, score_sql = "jobs j", "j.date_ord"
+            base_clauses, base_params = [], []
+            window_sql = ""
+
+        def where(clauses):
+            return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        date_clauses, date_params = self._filters(date_from=date_from, date_to=date_to)
+        clauses, params = self._filters(location, source, date_from, date_to)
+        with self._lock:
+            # One location x source cross-tab gives the total and both facets' counts. It depends only
+            # on the query and dates, so paging and facet changes reuse it.
+            crosstab = self._crosstab_locked(from_sql, base_clauses + date_clauses, base_params + date_params)
+            facets = {facet: dict.fromkeys(self._facet_values_locked(facet), 0) for facet in FACETS}
+
+            page_clauses, page_params = [], []
+            if cursor:
+                last_score, last_id = decode_cursor(cursor)
+                page_clauses.append("(score < ? OR (score = ? AND id > ?))")
+                page_params.extend([last_score, last_score, last_id])
+            rows = self._conn.execute(
+                f"SELECT * FROM (SELECT {_COLUMNS}, {score_sql} AS score FROM {from_sql}"
+                f"{where(base_clauses + clauses)}{window_sql}){where(page_clauses)} ORDER BY score DESC, id LIMIT ?",
+                base_params + params + page_params + [limit + 1]
+            ).fetchall()
+
+        # Each facet's counts ignore its own filter but apply the others
+        wanted_locations = None if location is None else set(_as_list(location))
+        wanted_sources = None if source is None else set(_as_list(source))
+        total = 0
+        for job_location, job_source, count in crosstab:
+            location_ok = wanted_locations is None or job_location in wanted_locations
+            source_ok = wanted_sources is None or job_source in wanted_sources
+            if source_ok:
+                facets["location"][job_location] += count
+            if location_ok:
+                facets["source"][job_source] += count
+            if location_ok and source_ok:
+                total += count
+
+        more = len(rows) > limit
+        rows = rows[:limit]
+        jobs = [_job_record(row) for row in rows]
+        next_cursor = encode_cursor(rows[-1]["score"], rows[-1]["id"]) if more else None
+        return {"jobs": jobs, "next_cursor": next_cursor, "total": total, "facets": facets}
+
+
+def job_matrix(store, directory=DEFAULT_MATRIX_DIR):
+    """
+    Keyword-weight matrix (JDCorpus) of every posting in the store, memory-mapped from
+    directory. Rebuilt (and re-saved) only when the store has new postings.
+    """
+    stamp = store.stamp()
+    corpus = JDCorpus.load(directory)
+    if corpus is None or corpus.stamp != stamp:
+        with rebuild_lock(directory):
+            # Another worker may have rebuilt it while this one waited for the lock
+            corpus = JDCorpus.load(directory)
+            if corpus is None or corpus.stamp != stamp:
+                # Texts are streamed into build(); ids fill up alongside and are complete once it returns
+                ids = []
+                texts = (ids.append(job_id) or text for job_id, text in store.iter_texts())
+                JDCorpus.build(texts, ids=ids).save(directory, stamp=stamp)
+                corpus = JDCorpus.load(directory)
+    return corpus
+
+
+if __name__ == "__main__":
+    # python -m core_engine.job_store FEED [SOURCE] [STORE]  (e.g. a daily Naukri export)
+    if len(sys.argv) < 2:
+        print("usage: python -m core_engine.job_store FEED.jsonl|FEED.csv[.gz] [SOURCE] [STORE]")
+        sys.exit(1)
+    store = JobStore(sys.argv[3] if len(sys.argv) > 3 else DEFAULT_STORE_PATH)
+    started = time.perf_counter()
+    result = store.ingest_feed(sys.argv[1], source=sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"{result} in {time.perf_counter() - started:.1f}s; {len(store)} jobs in {store.path}")
+    if result["inserted"]:
+        # Refresh the resume-matching matrix now rather than on the next page view
+        started = time.perf_counter()
+        job_matrix(store)
+        print(f"job matrix rebuilt in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,181 @@
+# json_extract.py
+import re
+import json
+
+_WHITESPACE = " \t\r\n"
+_VALUE_OPENERS = "{[:,"
+_VALUE_CLOSERS = ":,}]"
+_PAIRS = {"{": "}", "[": "]"}
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_STRUCTURAL = re.compile(r"\\.|[{}\[\]\"']", re.DOTALL)
+_REPAIR_TOKENS = re.compile(
+    r'"(?:[^"\\]|\\.)*"|\'|,(?=\s*[}\]])|```[A-Za-z]*|\b(?:True|False|None)\b', re.DOTALL
+)
+_SINGLE_QUOTED_ESCAPES = re.compile(r'\\.|"', re.DOTALL)
+_DECODER = json.JSONDecoder(strict=False)
+
+
+def _prev_significant(text, i, floor):
+    i -= 1
+    while i >= floor and text[i] in _WHITESPACE:
+        i -= 1
+    return text[i] if i >= floor else ""
+
+
+def _next_significant(text, i):
+    n = len(text)
+    while i < n and text[i] in _WHITESPACE:
+        i += 1
+    return text[i] if i < n else ""
+
+
+def _single_quote_opens(text, i, floor):
+    return _prev_significant(text, i, floor) in _VALUE_OPENERS
+
+
+def _single_quote_closes(text, i):
+    # A bare apostrophe inside a value ("don't") is content, not a delimiter
+    return _next_significant(text, i + 1) in _VALUE_CLOSERS
+
+
+def _iter_candidates(text, openers, single_quotes):
+    """
+    Yields (start, end, value) for each top-level container, in order, scanning text once.
+
+    value is the decoded object when the C decoder accepted the span outright, else None.
+    Quotes are only tracked inside a container, so apostrophes and braces in surrounding
+    prose or code fences never derail the scan. Containers closed inside a stray, never
+    closed opener are yielded at the end.
+    """
+    closers = {_PAIRS[o]: o for o in openers}
+    stack = []       # (opener, position)
+    nested = []      # closed spans inside an unclosed opener
+    quote = None
+    pos = 0
+    while True:
+        match = _STRUCTURAL.search(text, pos)
+        if match is None:
+            break
+        ch = match.group()
+        i = match.start()
+        pos = match.end()
+        if quote:
+            if ch == quote and (quote == '"' or _single_quote_closes(text, i)):
+                quote = None
+        elif len(ch) > 1:
+            continue  # escape sequence outside a string
+        elif stack and ch == '"':
+            quote = ch
+        elif stack and ch == "'":
+            if single_quotes and _single_quote_opens(text, i, stack[0][1]):
+                quote = ch
+        elif ch in openers:
+            if not stack:
+                # Well-formed JSON is handed to the C decoder and skipped in one step
+                try:
+                    value, end = _DECODER.raw_decode(text, i)
+                except ValueError:
+                    pass
+                else:
+                    yield i, end, value
+                    pos = end
+                    continue
+            stack.append((ch, i))
+        elif ch in closers:
+            # Unwind to the matching opener; unmatched closers are ignored
+            for depth in range(len(stack) - 1, -1, -1):
+                if stack[depth][0] == closers[ch]:
+                    start = stack[depth][1]
+                    del stack[depth:]
+                    if not stack:
+                        nested.clear()
+                        yield start, i + 1, None
+                    else:
+                        while nested and nested[-1][0] > start:
+                            nested.pop()
+                        nested.append((start, i + 1))
+                    break
+    for start, end in nested:
+        yield start, end, None
+
+
+def find_json_spans(text, openers="{", single_quotes=True):
+    """
+    (start, end) spans of the top-level JSON containers in text.
+    """
+    return [(start, end) for start, end, _ in _iter_candidates(text, openers, single_quotes)]
+
+
+def _single_quoted_end(text, pos):
+    j = pos
+    while True:
+        j = text.find("'", j)
+        if j == -1:
+            return len(text)
+        backslashes = 0
+        while j - 1 - backslashes >= pos and text[j - 1 - backslashes] == "\\":
+            backslashes += 1
+        if backslashes % 2 == 0 and _single_quote_closes(text, j):
+            return j
+        j += 1
+
+
+def _requote(match):
+    token = match.group()
+    if token == '"':
+        return '\\"'
+    if token == "\\'":
+        return "'"
+    return token
+
+
+def repair_json(fragment):
+    """
+    Rewrites common model mistakes: single-quoted strings, trailing commas,
+    Python literals (True/False/None) and code-fence markers outside strings.
+    """
+    out = []
+    pos = 0
+    while True:
+        match = _REPAIR_TOKENS.search(fragment, pos)
+        if match is None:
+            out.append(fragment[pos:])
+            break
+        out.append(fragment[pos:match.start()])
+        token = match.group()
+        pos = match.end()
+        if token[0] == '"':
+            out.append(token)
+        elif token == "'":
+            if not _single_quote_opens(fragment, match.start(), 0):
+                out.append(token)
+                continue
+            end = _single_quoted_end(fragment, pos)
+            out.append('"' + _SINGLE_QUOTED_ESCAPES.sub(_requote, fragment[pos:end]) + '"')
+            pos = end + 1
+        elif token in _PY_LITERALS:
+            out.append(_PY_LITERALS[token])
+        # trailing commas and code fences are dropped
+    return "".join(out)
+
+
+def extract_json(text, repair=True, openers="{"):
+    """
+    Returns the first JSON container in text that parses (optionally after repair), else None.
+    """
+    if not isinstance(text, str) or not text:
+        return None
+    for start, end, value in _iter_candidates(text, openers, repair):
+        if value is not None:
+            return value
+        fragment = text[start:end]
+        try:
+            return _DECODER.decode(fragment)
+        except ValueError:
+            if not repair:
+                continue
+        try:
+            return _DECODER.decode(repair_json(fragment))
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,238 @@
+# keyword_scoring.py
+import re
+import math
+import functools
+from collections import Counter
+
+import numpy as np
+
+# Deterministic resume-vs-JD keyword scoring. A JD becomes a weighted term vector
+# (BM25-saturated term frequency x IDF x term-kind boost), a resume becomes a presence
+# vector over the same terms, and the score is their normalized dot product.
+
+# Canonical skill -> spellings seen in resumes and JDs (matched as whole token sequences)
+SKILLS = {
+    "Python": ["python", "python3"], "Java": ["java"], "JavaScript": ["javascript", "js", "ecmascript"],
+    "TypeScript": ["typescript", "ts"], "Go": ["go", "golang"], "Rust": ["rust"], "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp"], "C": ["c"], "Ruby": ["ruby"], "PHP": ["php"], "Kotlin": ["kotlin"], "Swift": ["swift"],
+    "Scala": ["scala"], "R": ["r"], "Dart": ["dart"], "Bash": ["bash", "shell scripting"], "SQL": ["sql"],
+    "HTML": ["html", "html5"], "CSS": ["css", "css3"], "Sass": ["sass", "scss"],
+    "React": ["react", "react.js", "reactjs"], "Angular": ["angular", "angularjs"], "Vue.js": ["vue", "vue.js", "vuejs"],
+    "Next.js": ["next.js", "nextjs"], "Redux": ["redux"], "Node.js": ["node", "node.js", "nodejs"],
+    "Express": ["express", "express.js"], "Django": ["django"], "Flask": ["flask"], "FastAPI": ["fastapi"],
+    "Spring Boot": ["spring boot", "springboot"], "Spring": ["spring"], "Hibernate": ["hibernate"],
+    ".NET": [".net", "dotnet", "asp.net"], "Ruby on Rails": ["ruby on rails", "rails"], "Laravel": ["laravel"],
+    "GraphQL": ["graphql"], "REST APIs": ["rest", "restful", "rest api", "rest apis", "restful apis"],
+    "gRPC": ["grpc"], "Microservices": ["microservices", "microservice", "micro services"],
+    "Flutter": ["flutter"], "React Native": ["react native"], "Android": ["android"], "iOS": ["ios"],
+    "PostgreSQL": ["postgresql", "postgres"], "MySQL": ["mysql"], "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"], "Cassandra": ["cassandra"], "DynamoDB": ["dynamodb"], "Elasticsearch": ["elasticsearch", "elastic search"],
+    "Oracle": ["oracle"], "SQL Server": ["sql server", "mssql"], "SQLite": ["sqlite"], "Snowflake": ["snowflake"],
+    "BigQuery": ["bigquery"], "Kafka": ["kafka", "apache kafka"], "RabbitMQ": ["rabbitmq"], "Spark": ["spark", "pyspark", "apache spark"],
+    "Hadoop": ["hadoop"], "Airflow": ["airflow"], "dbt": ["dbt"], "ETL": ["etl", "elt"],
+    "AWS": ["aws", "amazon web services"], "Azure": ["azure", "microsoft azure"], "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Docker": ["docker"], "Kubernetes": ["kubernetes", "k8s"], "Terraform": ["terraform"], "Ansible": ["ansible"],
+    "Helm": ["helm"], "Jenkins": ["jenkins"], "GitHub Actions": ["github actions"], "GitLab CI": ["gitlab ci", "gitlab"],
+    "CI/CD": ["ci/cd", "cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "Git": ["git"], "Linux": ["linux", "unix"], "Nginx": ["nginx"], "Prometheus": ["prometheus"], "Grafana": ["grafana"],
+    "Datadog": ["datadog"], "Serverless": ["serverless", "lambda", "aws lambda"], "EC2": ["ec2"], "S3": ["s3"],
+    "Machine Learning": ["machine learning", "ml"], "Deep Learning": ["deep learning"], "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision"], "LLMs": ["llm", "llms", "large language models", "generative ai", "genai"],
+    "TensorFlow": ["tensorflow"], "PyTorch": ["pytorch"], "scikit-learn": ["scikit-learn", "sklearn"],
+    "Pandas": ["pandas"], "NumPy": ["numpy"], "Data Analysis": ["data analysis", "data analytics"],
+    "Data Engineering": ["data engineering"], "Tableau": ["tableau"], "Power BI": ["power bi", "powerbi"], "Excel": ["excel"],
+    "Statistics": ["statistics", "statistical analysis"], "MLOps": ["mlops"],
+    "System Design": ["system design", "distributed systems"], "Object-Oriented Programming": ["oop", "object oriented programming", "object-oriented programming"],
+    "Data Structures": ["data structures", "algorithms", "dsa"], "Unit Testing": ["unit testing", "unit tests", "tdd", "test driven development"],
+    "Selenium": ["selenium"], "Cypress": ["cypress"], "Jest": ["jest"], "PyTest": ["pytest"], "JUnit": ["junit"],
+    "Agile": ["agile", "scrum", "kanban"], "Jira": ["jira"], "Figma": ["figma"], "UI/UX": ["ui/ux", "ux", "user experience"],
+    "Cybersecurity": ["cybersecurity", "cyber security", "information security", "infosec"], "SIEM": ["siem"],
+    "Penetration Testing": ["penetration testing", "pentesting", "pen testing"], "OAuth": ["oauth", "oauth2"],
+    "Salesforce": ["salesforce"], "SAP": ["sap"], "Blockchain": ["blockchain"], "Solidity": ["solidity"],
+    "Project Management": ["project management"], "Stakeholder Management": ["stakeholder management"],
+    "Leadership": ["leadership", "team leadership", "people management"], "Communication": ["communication", "communication skills"],
+}
+# Short or common-word spellings that only count when capitalized ("Go", not "go")
+CASE_SENSITIVE = {"go", "c", "r", "rest", "spring", "swift", "express", "node", "ts", "ml", "lambda", "oracle", "excel", "rails"}
+
+STOPWORDS = set("""
+a about above across after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each etc e.g eg i.e ie few for from further had has
+have having he her here hers him his how i if in into is it its itself just like may me might more most must my
+no nor not now of off on once only or other our ours out over own per same she should so some such than that the
+their theirs them then there these they this those through to too under until up upon us very via was we were
+what when where which while who whom why will with within without would you your yours
+ability able across activities additional apply applicants benefits best bonus candidate candidates closely company
+competitive culture day degree desired develop developing development environment equivalent excellent experience
+experienced familiarity familiar field following good great help highly ideal including join key knowledge least
+level looking make minimum new nice opportunity plus position preferred proficiency proficient proven related
+required requirement requirements responsibilities responsible role salary skills strong successful team teams
+understanding using work working world year years yrs etc strong solid hands hands-on deep good building build
+ensure across within based well various multiple own
+""".split())
+
+_TOKEN = re.compile(r"\.net\b|[A-Za-z0-9][A-Za-z0-9+#]*(?:[./-][A-Za-z0-9+#]+)*")
+_SEGMENT_BREAK = re.compile(r"[,;:()\[\]\n•|!?]|\.(?:\s|$)")
+
+_KIND_BOOST = {"skill": 2.0, "bigram": 1.3, "word": 1.0}
+BM25_K1 = 1.2
+
+
+def _build_skill_lookup():
+    lookup = {}
+    for canonical, spellings in SKILLS.items():
+        for spelling in spellings + [canonical.lower()]:
+            tokens = tuple(t.lower() for t in _TOKEN.findall(spelling))
+            if tokens:
+                lookup[tokens] = canonical
+    return lookup
+
+
+_SKILL_LOOKUP = _build_skill_lookup()
+_MAX_SKILL_TOKENS = max(len(key) for key in _SKILL_LOOKUP)
+
+
+def tokenize(text):
+    """
+    (lowercase, original) token pairs per text segment; segments break at punctuation
+    so n-grams never span list items or sentences.
+    """
+    segments = []
+    for segment in _SEGMENT_BREAK.split(str(text)):
+        tokens = [(t.lower(), t) for t in _TOKEN.findall(segment)]
+        if tokens:
+            segments.append(tokens)
+    return segments
+
+
+def _skill_at(tokens, i):
+    for n in range(min(_MAX_SKILL_TOKENS, len(tokens) - i), 0, -1):
+        key = tuple(t[0] for t in tokens[i:i + n])
+        canonical = _SKILL_LOOKUP.get(key)
+        if canonical is None:
+            continue
+        if n == 1 and key[0] in CASE_SENSITIVE and not tokens[i][1][:1].isupper():
+            continue
+        return canonical, n
+    return None, 0
+
+
+@functools.lru_cache(maxsize=512)
+def extract_terms(text):
+    """
+    {term: (kind, count)} for skills (canonical names), content words and bigrams of
+    adjacent content words. Cached: callers must not mutate the result.
+    """
+    counts = Counter()
+    kinds = {}
+    for tokens in tokenize(text):
+        previous = None
+        i = 0
+        while i < len(tokens):
+            skill, n = _skill_at(tokens, i)
+            if skill:
+                counts[skill] += 1
+                kinds[skill] = "skill"
+                previous = None
+                i += n
+                continue
+            word = tokens[i][0].strip(".")
+            i += 1
+            if len(word) < 3 or word in STOPWORDS or not any(ch.isalpha() for ch in word):
+                previous = None
+                continue
+            counts[word] += 1
+            kinds.setdefault(word, "word")
+            if previous:
+                bigram = f"{previous} {word}"
+                counts[bigram] += 1
+                kinds.setdefault(bigram, "bigram")
+            previous = word
+    return {term: (kinds[term], count) for term, count in counts.items()}
+
+
+def bm25_idf(doc_freq, n_docs):
+    return math.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+def scored_jd_terms(terms):
+    """
+    (term, kind, count) for the extract_terms entries of a JD that are scored. Bigrams seen
+    once are dropped: they are mostly incidental word pairs, not phrases an ATS looks for.
+    """
+    return [(term, kind, count) for term, (kind, count) in terms.items() if kind != "bigram" or count >= 2]
+
+
+def term_weight(kind, count, idf=1.0, k1=BM25_K1):
+    """
+    BM25-saturated term frequency x IDF x term-kind boost.
+    """
+    return count * (k1 + 1) / (count + k1) * idf * _KIND_BOOST[kind]
+
+
+class KeywordScorer:
+    """
+    Scores a resume against a JD from their terms alone (no model call).
+
+    idf: optional {term: idf} learnt from a JD corpus (see fit); without it every
+    term has idf 1 and only term kind and frequency shape the weights.
+    """
+
+    def __init__(self, idf=None, k1=BM25_K1, max_keywords=15):
+        self.idf = idf or {}
+        self.k1 = k1
+        self.max_keywords = max_keywords
+
+    @classmethod
+    def fit(cls, documents, **kwargs):
+        doc_freq = Counter()
+        n_docs = 0
+        for doc in documents:
+            n_docs += 1
+            doc_freq.update(term for term, _, _ in scored_jd_terms(extract_terms(doc)))
+        return cls({term: bm25_idf(df, n_docs) for term, df in doc_freq.items()}, **kwargs)
+
+    def jd_terms(self, jd_text):
+        """
+        (terms, kinds, weights) for the JD.
+        """
+        terms = []
+        kinds = []
+        weights = []
+        for term, kind, count in scored_jd_terms(extract_terms(jd_text)):
+            terms.append(term)
+            kinds.append(kind)
+            weights.append(term_weight(kind, count, self.idf.get(term, 1.0), self.k1))
+        return terms, kinds, np.asarray(weights, dtype=np.float64)
+
+    def score(self, resume_text, jd_text):
+        """
+        {"match_score", "missing_keywords", "matching_keywords"} (the match_keywords
+        shape). Keywords are ordered by weight; skills come before other terms.
+        """
+        terms, kinds, weights = self.jd_terms(jd_text)
+        if not terms:
+            return {"match_score": 0, "missing_keywords": [], "matching_keywords": []}
+        resume_terms = extract_terms(resume_text)
+        present = np.fromiter((term in resume_terms for term in terms), dtype=np.float64, count=len(terms))
+        match_score = int(round(100 * float(weights @ present) / float(weights.sum())))
+
+        # Skills first, then by weight (descending), then alphabetically for stable output
+        order = sorted(range(len(terms)), key=lambda i: (kinds[i] != "skill", -weights[i], terms[i]))
+        matching = [terms[i] for i in order if present[i]]
+        missing = [terms[i] for i in order if not present[i]]
+        return {
+            "match_score": match_score,
+            "missing_keywords": missing[:self.max_keywords],
+            "matching_keywords": matching[:self.max_keywords],
+        }
+
+
+_default_scorer = KeywordScorer()
+
+
+def score_keywords(resume_text, jd_text):
+    """
+    Local match_keywords result with the default (corpus-free) weights.
+    """
+    return _default_scorer.score(resume_text, jd_text)
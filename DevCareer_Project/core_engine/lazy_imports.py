@@ -0,0 +1,59 @@
+# lazy_imports.py
+import importlib
+import threading
+
+_MISSING = object()
+
+
+class LazyImport:
+    """
+    Stand-in for a heavy optional dependency that is imported on first use.
+
+    Behaves like the module (or module attribute) it names: attribute access and
+    calls are forwarded, and it is falsy when the dependency is not installed, so
+    the existing `if not genai:` style checks keep working.
+    """
+
+    def __init__(self, module_name, attr=None):
+        object.__setattr__(self, "_module_name", module_name)
+        object.__setattr__(self, "_attr", attr)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self):
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    try:
+                        target = importlib.import_module(self._module_name)
+                        if self._attr:
+                            target = getattr(target, self._attr)
+                    except ImportError:
+                        target = _MISSING
+                    object.__setattr__(self, "_target", target)
+        return None if target is _MISSING else target
+
+    @property
+    def is_loaded(self):
+        return self._target is not None
+
+    def __bool__(self):
+        return self._load() is not None
+
+    def __getattr__(self, name):
+        target = self._load()
+        if target is None:
+            raise ImportError(f"{self._module_name} is not installed")
+        return getattr(target, name)
+
+    def __call__(self, *args, **kwargs):
+        target = self._load()
+        if target is None:
+            raise ImportError(f"{self._module_name} is not installed")
+        return target(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyImport {self._module_name}{'.' + self._attr if self._attr else ''} ({state})>"
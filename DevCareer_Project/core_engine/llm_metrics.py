@@ -0,0 +1,182 @@
+# llm_metrics.py
+import json
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0)
+TOKEN_BUCKETS = (64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+# name -> (type, help, buckets)
+METRIC_DEFINITIONS = {
+    "devcareer_llm_method_seconds": ("histogram", "Wall time of IntelligenceEngine methods.", LATENCY_BUCKETS),
+    "devcareer_llm_ttfb_seconds": ("histogram", "Time to first byte/token of model calls.", LATENCY_BUCKETS),
+    "devcareer_llm_prompt_tokens": ("histogram", "Prompt tokens per model call (usage metadata).", TOKEN_BUCKETS),
+    "devcareer_llm_output_tokens": ("histogram", "Output tokens per model call (usage metadata).", TOKEN_BUCKETS),
+    "devcareer_llm_calls_total": ("counter", "Upstream model calls.", None),
+    "devcareer_llm_errors_total": ("counter", "Upstream model calls that raised.", None),
+    "devcareer_llm_retries_total": ("counter", "Retried model calls.", None),
+    "devcareer_llm_cache_hits_total": ("counter", "Response cache hits.", None),
+    "devcareer_llm_cache_misses_total": ("counter", "Response cache misses.", None),
+    "devcareer_llm_parse_failures_total": ("counter", "Responses _extract_json could not parse.", None),
+    "devcareer_llm_coalesced_total": ("counter", "Calls that shared an identical in-flight upstream call.", None),
+    "devcareer_llm_schema_repairs_total": ("counter", "Structured responses that needed a re-ask for invalid fields.", None),
+    "devcareer_font_load_seconds": ("histogram", "Font file discovery and preload time at startup.", LATENCY_BUCKETS),
+    "devcareer_resume_local_fields_total": ("counter", "Resume builder fields filled by the local parser (no model call).", None),
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """
+        Upper bucket bound containing the q-quantile (what an SLO check needs).
+        """
+        if not self.count:
+            return None
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """
+    Per-method histograms and counters for the LLM layer.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+
+    def observe(self, name, method, value):
+        if value is None:
+            return
+        buckets = METRIC_DEFINITIONS[name][2]
+        with self._lock:
+            key = (name, method or "generate_content")
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def inc(self, name, method, amount=1):
+        if not amount:
+            return
+        with self._lock:
+            key = (name, method or "generate_content")
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def snapshot(self):
+        """
+        JSON-serialisable view: {method: {metric: value or histogram summary}}.
+        """
+        with self._lock:
+            result = {}
+            for (name, method), histogram in self._histograms.items():
+                result.setdefault(method, {})[name] = {
+                    "count": histogram.count,
+                    "sum": round(histogram.sum, 6),
+                    "avg": round(histogram.sum / histogram.count, 6) if histogram.count else None,
+                    "p50_le": histogram.quantile(0.5),
+                    "p95_le": histogram.quantile(0.95),
+                    "buckets": dict(zip([str(b) for b in histogram.buckets] + ["+Inf"], histogram.counts))
+                }
+            for (name, method), value in self._counters.items():
+                result.setdefault(method, {})[name] = value
+            return result
+
+    def snapshot_json(self):
+        return json.dumps(self.snapshot(), indent=2, default=str)
+
+    def to_prometheus(self):
+        """
+        Prometheus text exposition format (version 0.0.4).
+        """
+        with self._lock:
+            lines = []
+            for name, (kind, help_text, _) in METRIC_DEFINITIONS.items():
+                if kind == "histogram":
+                    series = [(m, h) for (n, m), h in sorted(self._histograms.items()) if n == name]
+                else:
+                    series = [(m, v) for (n, m), v in sorted(self._counters.items()) if n == name]
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for method, value in series:
+                    label = f'method="{method}"'
+                    if kind == "counter":
+                        lines.append(f"{name}{{{label}}} {value}")
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(value.buckets + (float("inf"),), value.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(float(bound))
+                        lines.append(f'{name}_bucket{{{label},le="{le}"}} {cumulative}')
+                    lines.append(f"{name}_sum{{{label}}} {value.sum}")
+                    lines.append(f"{name}_count{{{label}}} {value.count}")
+            return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=9464, registry=METRICS, host="127.0.0.1"):
+    """
+    Serves /metrics (Prometheus) and /metrics.json from a daemon thread. Safe to call on every rerun.
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/metrics.json"):
+                    body, content_type = registry.snapshot_json(), "application/json"
+                elif self.path.startswith("/metrics"):
+                    body, content_type = registry.to_prometheus(), "text/plain; version=0.0.4"
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            _server = ThreadingHTTPServer((host, port), _Handler)
+        except OSError as e:
+            print(f"Metrics server not started on port {port}: {e}")
+            return None
+        threading.Thread(target=_server.serve_forever, name="devcareer-metrics", daemon=True).start()
+        return _server
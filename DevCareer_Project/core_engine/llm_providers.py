@@ -0,0 +1,312 @@
+# llm_providers.py
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from types import SimpleNamespace
+
+from .lazy_imports import LazyImport
+from .response_cache import make_cache_key
+
+genai = LazyImport("google.generativeai")
+
+DEFAULT_FIXTURE_DIR = os.getenv(
+    "DEVCAREER_FIXTURE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "devcareer", "llm_fixtures")
+)
+
+# Every provider hands out objects with the slice of the GenerativeModel API the engines use:
+#   generate_content(prompt, generation_config=None, stream=False) -> response (.text, .usage_metadata)
+#   generate_content_async(prompt, generation_config=None) -> response
+# With stream=True the response is an iterable of chunks that each have .text.
+
+
+class GeminiProvider:
+    """
+    Live Gemini API.
+    """
+    name = "gemini"
+
+    def __init__(self, api_key=None):
+        self.api_key = api_key
+
+    @property
+    def available(self):
+        return bool(genai)
+
+    def create_model(self, model_name):
+        if not genai:
+            print("Warning: google-generativeai not installed.")
+            return None
+        if self.api_key:
+            genai.configure(api_key=self.api_key)
+        return genai.GenerativeModel(model_name)
+
+
+def fixture_key(model_name, prompt, generation_config=None):
+    """
+    Stable key for a model call. Image parts (PIL) are keyed by their pixels.
+    """
+    if isinstance(prompt, (list, tuple)):
+        parts = []
+        for part in prompt:
+            if hasattr(part, "tobytes"):
+                parts.append("image:" + hashlib.sha256(part.tobytes()).hexdigest())
+            else:
+                parts.append(str(part))
+        prompt = "\x00".join(parts)
+    return make_cache_key(model_name, generation_config or {}, prompt)
+
+
+class FixtureStore:
+    """
+    Recorded prompt/response pairs, one JSON object per line in <directory>/fixtures.jsonl.
+
+    Each record: {"key", "model", "prompt", "text", "chunks", "prompt_tokens", "output_tokens", "latency_s"}.
+    A later recording of the same key replaces the earlier one.
+    """
+
+    def __init__(self, directory=DEFAULT_FIXTURE_DIR):
+        self.directory = directory
+        self.path = os.path.join(directory, "fixtures.jsonl")
+        self._lock = threading.Lock()
+        self._records = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # a torn final line from an interrupted recording
+                    self._records[record["key"]] = record
+
+    def __len__(self):
+        return len(self._records)
+
+    def get(self, key):
+        return self._records.get(key)
+
+    def put(self, record):
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._records[record["key"]] = record
+
+
+def _token_count(usage, name):
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else None
+
+
+def _usage(prompt_tokens, output_tokens):
+    return SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=output_tokens)
+
+
+class ReplayResponse:
+    """
+    Stand-in for a Gemini response built from a fixture record.
+    """
+
+    def __init__(self, text, usage_metadata=None):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class RecordingModel:
+    """
+    Wraps a live model and appends every successful call to a FixtureStore.
+    """
+
+    def __init__(self, model, store, model_name):
+        self.model = model
+        self.store = store
+        self.model_name = model_name
+
+    def _record(self, prompt, generation_config, text, chunks, usage, latency_s):
+        self.store.put({
+            "key": fixture_key(self.model_name, prompt, generation_config),
+            "model": self.model_name,
+            "prompt": prompt if isinstance(prompt, str) else None,
+            "text": text,
+            "chunks": chunks,
+            "prompt_tokens": _token_count(usage, "prompt_token_count"),
+            "output_tokens": _token_count(usage, "candidates_token_count"),
+            "latency_s": round(latency_s, 4)
+        })
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        kwargs = {"generation_config": generation_config} if generation_config else {}
+        start = time.perf_counter()
+        if stream:
+            return self._record_stream(prompt, generation_config, start, self.model.generate_content(prompt, stream=True, **kwargs))
+        response = self.model.generate_content(prompt, **kwargs)
+        self._record(prompt, generation_config, response.text, None,
+                     getattr(response, "usage_metadata", None), time.perf_counter() - start)
+        return response
+
+    def _record_stream(self, prompt, generation_config, start, response):
+        chunks = []
+        last_chunk = None
+        for chunk in response:
+            last_chunk = chunk
+            chunks.append(chunk.text or "")
+            yield chunk
+        self._record(prompt, generation_config, "".join(chunks), chunks,
+                     getattr(last_chunk, "usage_metadata", None), time.perf_counter() - start)
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        kwargs = {"generation_config": generation_config} if generation_config else {}
+        start = time.perf_counter()
+        response = await self.model.generate_content_async(prompt, **kwargs)
+        self._record(prompt, generation_config, response.text, None,
+                     getattr(response, "usage_metadata", None), time.perf_counter() - start)
+        return response
+
+
+class RecordingProvider:
+    """
+    Passes calls through to another provider (Gemini by default) and records them.
+    """
+    name = "record"
+
+    def __init__(self, store=None, inner=None, api_key=None):
+        self.store = store if store is not None else FixtureStore()
+        self.inner = inner or GeminiProvider(api_key)
+
+    @property
+    def available(self):
+        return self.inner.available
+
+    def create_model(self, model_name):
+        model = self.inner.create_model(model_name)
+        return RecordingModel(model, self.store, model_name) if model is not None else None
+
+
+class ReplayError(Exception):
+    """
+    Synthetic upstream failure. The message mimics a 503 so retry logic treats it as transient.
+    """
+
+
+class FixtureMissingError(KeyError):
+    pass
+
+
+class ReplayModel:
+    def __init__(self, provider, model_name):
+        self.provider = provider
+        self.model_name = model_name
+
+    def _lookup(self, prompt, generation_config):
+        provider = self.provider
+        record = provider.store.get(fixture_key(self.model_name, prompt, generation_config))
+        if record is None:
+            if provider.fallback is None:
+                raise FixtureMissingError(f"No recorded response for this {self.model_name} prompt")
+            text = provider.fallback(prompt, generation_config)
+            record = {"text": text, "chunks": None, "prompt_tokens": None, "output_tokens": None, "latency_s": None}
+        return record
+
+    def _response(self, record):
+        return ReplayResponse(record["text"], _usage(record.get("prompt_tokens"), record.get("output_tokens")))
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        record = self._lookup(prompt, generation_config)
+        delay = self.provider.delay_for(record)
+        if stream:
+            return self._stream(record, delay)
+        time.sleep(delay)
+        self.provider.maybe_fail()
+        return self._response(record)
+
+    def _stream(self, record, delay):
+        chunks = record.get("chunks") or [record["text"]]
+        # First chunk after a third of the delay, the rest spread so the last lands at the full delay
+        first = delay / 3 if len(chunks) > 1 else delay
+        gap = (delay - first) / (len(chunks) - 1) if len(chunks) > 1 else 0.0
+        time.sleep(first)
+        self.provider.maybe_fail()
+        for i, text in enumerate(chunks):
+            if i:
+                time.sleep(gap)
+            last = i == len(chunks) - 1
+            usage = _usage(record.get("prompt_tokens"), record.get("output_tokens")) if last else None
+            yield ReplayResponse(text, usage)
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        record = self._lookup(prompt, generation_config)
+        await asyncio.sleep(self.provider.delay_for(record))
+        self.provider.maybe_fail()
+        return self._response(record)
+
+
+class ReplayProvider:
+    """
+    Serves recorded responses with synthetic latency and error rate, without network access.
+
+    latency_s / jitter_s: fixed delay plus uniform jitter per call.
+    use_recorded_latency: replay each fixture's recorded latency (times latency_scale) instead.
+    error_rate: probability that a call raises ReplayError.
+    fallback: callable(prompt, generation_config) -> text for prompts with no fixture;
+        without it a missing fixture raises FixtureMissingError.
+    """
+    name = "replay"
+
+    def __init__(self, store=None, latency_s=0.0, jitter_s=0.0, error_rate=0.0,
+                 use_recorded_latency=False, latency_scale=1.0, fallback=None, seed=None):
+        self.store = store if store is not None else FixtureStore()
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.error_rate = error_rate
+        self.use_recorded_latency = use_recorded_latency
+        self.latency_scale = latency_scale
+        self.fallback = fallback
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        return True
+
+    def create_model(self, model_name):
+        return ReplayModel(self, model_name)
+
+    def delay_for(self, record):
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_s) if self.jitter_s else 0.0
+        recorded = record.get("latency_s")
+        if self.use_recorded_latency and recorded is not None:
+            return recorded * self.latency_scale + jitter
+        return self.latency_s + jitter
+
+    def maybe_fail(self):
+        with self._lock:
+            failed = self.error_rate and self._random.random() < self.error_rate
+        if failed:
+            raise ReplayError("503 Service Unavailable (synthetic replay error)")
+
+
+def provider_from_env(api_key=None):
+    """
+    Provider selected by DEVCAREER_LLM_PROVIDER: "gemini" (default), "record" or "replay".
+
+    Replay reads DEVCAREER_REPLAY_LATENCY_MS, DEVCAREER_REPLAY_JITTER_MS and DEVCAREER_REPLAY_ERROR_RATE;
+    both record and replay use the fixture store in DEVCAREER_FIXTURE_DIR.
+    """
+    kind = os.getenv("DEVCAREER_LLM_PROVIDER", "gemini").lower()
+    if kind == "record":
+        return RecordingProvider(api_key=api_key)
+    if kind == "replay":
+        return ReplayProvider(
+            latency_s=float(os.getenv("DEVCAREER_REPLAY_LATENCY_MS", "0")) / 1000,
+            jitter_s=float(os.getenv("DEVCAREER_REPLAY_JITTER_MS", "0")) / 1000,
+            error_rate=float(os.getenv("DEVCAREER_REPLAY_ERROR_RATE", "0"))
+        )
+    return GeminiProvider(api_key)
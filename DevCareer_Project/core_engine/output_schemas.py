@@ -0,0 +1,219 @@
+# output_schemas.py
+import json
+
+# Response schemas for the engine methods that return JSON, in the OpenAPI subset Gemini
+# accepts as `response_schema`. `validate` coerces a decoded response to its schema and
+# reports the top-level fields it could not recover, so the engine can re-ask for just those.
+
+
+def _string():
+    return {"type": "string"}
+
+
+def _integer():
+    return {"type": "integer"}
+
+
+def _strings():
+    return {"type": "array", "items": {"type": "string"}}
+
+
+def _object(**properties):
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+def _array_of(**properties):
+    return {"type": "array", "items": _object(**properties)}
+
+
+ROLE_AND_STACK_SCHEMA = _object(
+    role=_string(),
+    stack=_string(),
+    linkedin_url=_string(),
+    location=_string(),
+    industry=_string()
+)
+
+RESUME_SCHEMA = _object(
+    contact=_object(
+        name=_string(), email=_string(), phone=_string(),
+        location=_string(), linkedin=_string(), portfolio=_string()
+    ),
+    summary=_string(),
+    experience=_array_of(
+        title=_string(), company=_string(), dates=_string(), location=_string(), description=_string()
+    ),
+    projects=_array_of(title=_string(), tech_stack=_string(), description=_string()),
+    education=_array_of(school=_string(), degree=_string(), dates=_string()),
+    skills=_string(),
+    certifications=_string(),
+    languages=_string()
+)
+
+KEYWORD_MATCH_SCHEMA = _object(
+    match_score=_integer(),
+    missing_keywords=_strings(),
+    matching_keywords=_strings()
+)
+
+SERVICE_PROPOSAL_SCHEMA = _object(
+    resume_audit=_object(failure_1=_string(), failure_2=_string()),
+    before_after_analysis=_object(current_state=_string(), future_state=_string()),
+    proposal_script=_string()
+)
+
+LINKEDIN_SEO_SCHEMA = _object(
+    seo_audit=_object(missing_keywords=_string(), primary_keyword_cluster=_string()),
+    headline_optimization=_object(strategy=_string(), options=_strings()),
+    about_section_seo=_string(),
+    experience_rewrites=_array_of(
+        instruction=_string(), original_role=_string(), optimized_bullet_points=_strings()
+    ),
+    skills_section_ordering=_object(
+        top_3_pinned=_string(), industry_knowledge=_string(), tools_technologies=_string()
+    ),
+    hidden_ranking_factors=_strings()
+)
+
+LINKEDIN_MASTER_SCHEMA = _object(
+    url_settings_audit=_object(
+        public_visibility=_string(),
+        url_optimization=_object(status=_string(), fix=_string())
+    ),
+    seo_strategy_audit=_object(
+        primary_keyword_cluster=_strings(),
+        keyword_gap_analysis=_strings(),
+        search_appearance_score=_string()
+    ),
+    text_optimization=_object(
+        headline_options=_strings(),
+        about_section=_object(hook=_string(), body=_string(), call_to_action=_string()),
+        experience_rewrites=_object(role=_string(), impact_statements=_strings())
+    ),
+    visual_audit=_object(
+        profile_photo_check=_object(technical_score=_string(), sixty_percent_rule=_string(), fix=_string()),
+        banner_image_check=_object(relevance=_string(), safe_zone=_string(), recommendation=_string())
+    )
+)
+
+RESUME_UNDERSTANDING_SCHEMA = _object(
+    role=_string(),
+    stack=_string(),
+    linkedin_url=_string(),
+    location=_string(),
+    industry=_string(),
+    custom_hook=_string(),
+    custom_tagline=_string(),
+    resume=RESUME_SCHEMA
+)
+
+# Engine method -> response schema
+OUTPUT_SCHEMAS = {
+    "extract_role_and_stack": ROLE_AND_STACK_SCHEMA,
+    "parse_resume_json": RESUME_SCHEMA,
+    "match_keywords": KEYWORD_MATCH_SCHEMA,
+    "generate_service_page_proposal": SERVICE_PROPOSAL_SCHEMA,
+    "generate_linkedin_seo_audit": LINKEDIN_SEO_SCHEMA,
+    "generate_linkedin_master_kit": LINKEDIN_MASTER_SCHEMA,
+    "understand_resume": RESUME_UNDERSTANDING_SCHEMA,
+}
+
+
+def json_generation_config(schema):
+    """
+    Gemini generation_config asking for bare JSON matching schema.
+    """
+    return {"response_mime_type": "application/json", "response_schema": schema}
+
+
+def empty_value(schema):
+    kind = schema["type"]
+    if kind == "object":
+        return {name: empty_value(sub) for name, sub in schema["properties"].items()}
+    if kind == "array":
+        return []
+    if kind == "integer":
+        return 0
+    return ""
+
+
+class _Invalid(Exception):
+    pass
+
+
+def _coerce(value, schema):
+    kind = schema["type"]
+    if kind == "object":
+        if not isinstance(value, dict):
+            raise _Invalid()
+        result = dict(value)
+        for name, sub in schema["properties"].items():
+            if name in value:
+                try:
+                    result[name] = _coerce(value[name], sub)
+                    continue
+                except _Invalid:
+                    pass
+            # Nested gaps are filled with empties; only top-level fields are re-asked
+            result[name] = empty_value(sub)
+        return result
+    if kind == "array":
+        if isinstance(value, str):
+            value = [part.strip() for part in value.split(",") if part.strip()]
+        if not isinstance(value, list):
+            raise _Invalid()
+        items = []
+        for item in value:
+            try:
+                items.append(_coerce(item, schema["items"]))
+            except _Invalid:
+                continue
+        return items
+    if kind == "integer":
+        if isinstance(value, bool):
+            raise _Invalid()
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, str):
+            digits = "".join(ch for ch in value.split("/")[0] if ch.isdigit() or ch == ".")
+            try:
+                return int(float(digits))
+            except ValueError:
+                raise _Invalid()
+        raise _Invalid()
+    # string
+    if value is None:
+        raise _Invalid()
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return str(value)
+
+
+def validate(data, schema):
+    """
+    Coerces data to schema. Returns (result, failing) where failing lists the
+    top-level fields that were missing or unrecoverable (all of them if data
+    is not an object); those fields hold empty values in result.
+    """
+    if not isinstance(data, dict):
+        return empty_value(schema), list(schema["properties"])
+    result = dict(data)
+    failing = []
+    for name, sub in schema["properties"].items():
+        try:
+            if name not in data:
+                raise _Invalid()
+            result[name] = _coerce(data[name], sub)
+        except _Invalid:
+            result[name] = empty_value(sub)
+            failing.append(name)
+    return result, failing
+
+
+def subschema(schema, fields):
+    """
+    Schema restricted to the given top-level fields (for re-asking only those).
+    """
+    return _object(**{name: schema["properties"][name] for name in fields})
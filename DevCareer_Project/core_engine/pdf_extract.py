@@ -0,0 +1,134 @@
+# pdf_extract.py
+import io
+import os
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from .lazy_imports import LazyImport
+from .response_cache import ResponseCache
+
+PdfReader = LazyImport("pypdf", "PdfReader")
+
+# Resumes rarely need more than ~8 pages; LinkedIn exports and portfolios can run to 60+
+DEFAULT_MAX_PAGES = int(os.getenv("DEVCAREER_PDF_MAX_PAGES", "8"))
+DEFAULT_MAX_CHARS = int(os.getenv("DEVCAREER_PDF_MAX_CHARS", "40000"))
+# Below this many pages to extract, a process pool costs more than it saves
+PARALLEL_MIN_PAGES = 16
+PAGES_PER_TASK = 4
+
+# Per-page text keyed on "<sha256 of file>:<page index>"; memory only, shared by every caller
+PAGE_CACHE = ResponseCache(max_memory_items=4096, ttl_seconds=None)
+
+_pool = None
+_pool_workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs Streamlit's threads is not safe
+            _pool = ProcessPoolExecutor(max_workers=_pool_workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def read_source(source):
+    """
+    Bytes of a PDF given as bytes, a path or a file-like object (e.g. a Streamlit upload).
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    data = source.read()
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return data
+
+
+_worker_reader = (None, None)  # (file hash, PdfReader) reused across tasks for the same file
+
+
+def _extract_page_range(file_hash, pdf_bytes, start, stop):
+    """
+    Process-pool task: text of pages [start, stop).
+    """
+    global _worker_reader
+    if _worker_reader[0] != file_hash:
+        _worker_reader = (file_hash, PdfReader(io.BytesIO(pdf_bytes)))
+    reader = _worker_reader[1]
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def iter_pdf_pages(source, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS,
+                   parallel=True, page_cache=PAGE_CACHE):
+    """
+    Yields the text of each page, in order, stopping once max_pages pages or
+    max_chars characters have been produced (None disables a limit).
+
+    Large extractions are spread across a process pool in small batches, so an early
+    cutoff stops scheduling further pages. Each page's text is cached under the file's
+    SHA-256 and the page index.
+    """
+    pdf_bytes = read_source(source)
+    file_hash = hashlib.sha256(pdf_bytes).hexdigest()
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    total = len(reader.pages)
+    limit = total if max_pages is None else min(total, max_pages)
+
+    pool = _get_pool() if parallel and limit >= PARALLEL_MIN_PAGES else None
+    pending = {}  # first page index of a batch -> future
+    ready = {}    # page index -> text from a finished batch
+    next_batch = 0
+    chars = 0
+
+    def _cached(index):
+        return page_cache.get(f"{file_hash}:{index}") if page_cache is not None else None
+
+    def _schedule():
+        nonlocal next_batch
+        # Keep a couple of batches per worker in flight ahead of the consumer
+        while next_batch < limit and len(pending) < _pool_workers * 2:
+            start, stop = next_batch, min(limit, next_batch + PAGES_PER_TASK)
+            if any(_cached(i) is None for i in range(start, stop)):
+                pending[start] = pool.submit(_extract_page_range, file_hash, pdf_bytes, start, stop)
+            next_batch = stop
+
+    try:
+        for index in range(limit):
+            if pool is not None:
+                _schedule()
+            text = ready.pop(index, None)
+            if text is None:
+                text = _cached(index)
+            if text is None:
+                batch_start = index - index % PAGES_PER_TASK
+                future = pending.pop(batch_start, None)
+                if future is not None:
+                    for offset, page_text in enumerate(future.result()):
+                        ready[batch_start + offset] = page_text
+                    text = ready.pop(index)
+                else:
+                    text = reader.pages[index].extract_text() or ""
+                if page_cache is not None:
+                    page_cache.set(f"{file_hash}:{index}", text)
+            yield text
+            chars += len(text)
+            if max_chars is not None and chars >= max_chars:
+                return
+    finally:
+        for future in pending.values():
+            future.cancel()
+
+
+def extract_pdf_text(source, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS, parallel=True):
+    """
+    Page texts joined with newlines (one trailing newline per page, as before).
+    """
+    return "".join(text + "\n" for text in iter_pdf_pages(source, max_pages, max_chars, parallel))
@@ -120,9 +120,39 @@ def get_linkedin_optimizer_prompt(resume_text, target_role="Software Engineer",
     Use clear headings and "Copy-Paste" blocks for the Headline and About section.
     """
 
-def get_ats_score_prompt(resume_text, jd_text, market):
+def get_ats_score_prompt(resume_text, jd_text, market, keyword_match=None):
     """
-    Returns the prompt to calculate ATS score.
+    Returns the prompt to calculate ATS score. With keyword_match (a match_keywords result)
+    the score and keyword lists are given and the model only writes the advice.
+    """
+    if keyword_match:
+        return f"""
+    You are an ATS (Applicant Tracking System) Expert and Technical Recruiter for the {market} market.
+    The Resume below was already scored against the Job Description by our ATS keyword engine.
+
+    Resume Content:
+    {resume_text}
+
+    Job Description:
+    {jd_text}
+
+    Keyword engine result (use these values exactly, do not re-score):
+    - Score: {keyword_match["match_score"]}/100
+    - Matching: {", ".join(keyword_match["matching_keywords"]) or "None"}
+    - Missing: {", ".join(keyword_match["missing_keywords"]) or "None"}
+
+    Output MUST be in the following format:
+    **ATS Score:** {keyword_match["match_score"]}/100
+
+    **Match Analysis:**
+    - ✅ **Matching Keywords:** [The matching keywords above]
+    - ❌ **Missing Keywords:** [The missing keywords above, most important first]
+
+    **Market Fit ({market}):**
+    - [Specific advice for {market} market, e.g., for India focus on scale/tools, for UAE focus on ROI/English]
+
+    **Improvement Plan:**
+    - [3 bullet points on how to work the missing keywords in truthfully and raise the score]
     """
     return f"""
     You are an ATS (Applicant Tracking System) Expert and Technical Recruiter for the {market} market.
@@ -433,6 +463,16 @@ def get_resume_parsing_prompt(resume_text):
     3. Ensure valid JSON.
     """
 
+def get_resume_sections_prompt(resume_text, fields):
+    """
+    Returns the builder extraction prompt restricted to the sections the local parser could not read reliably.
+    """
+    return f"""
+    {get_resume_parsing_prompt(resume_text)}
+
+    The other sections were already extracted. Return a JSON object containing ONLY these fields: {", ".join(fields)}.
+    """
+
 def get_cover_letter_prompt(resume_text, job_description, tone="Professional"):
     """
     Returns the prompt to generate a tailored cover letter.
@@ -982,3 +1022,46 @@ def get_linkedin_banner_content_extraction_prompt(linkedin_text, target_role):
     - Years of experience
     - Industry focus
     """
+
+def get_field_repair_prompt(original_prompt, fields):
+    """
+    Returns the prompt that re-asks only for the fields a previous JSON answer got wrong.
+    """
+    return f"""
+    {original_prompt}
+
+    A previous answer to the task above was missing or had invalid values for these fields: {", ".join(fields)}.
+    Return a JSON object containing ONLY these fields, following the same instructions.
+    """
+
+def get_resume_understanding_prompt(resume_text):
+    """
+    Returns the prompt that extracts everything the tabs need from an uploaded resume in one pass:
+    target role, stack, location, industry, LinkedIn URL, banner hook/tagline and the builder JSON.
+    """
+    return f"""
+    Act as an Elite Executive Resume Writer, Technical Recruiter and LinkedIn Personal Branding Expert.
+    Analyze the following resume (it may be a LinkedIn PDF export) once and return everything below in a single JSON object.
+
+    Resume Content:
+    {resume_text}
+
+    1. **Targeting**
+       - "role": the candidate's most likely Target Job Title (e.g. Senior Java Developer).
+       - "stack": top 5-7 tech skills, comma separated.
+       - "linkedin_url": LinkedIn URL if present (e.g. linkedin.com/in/...), else empty string.
+       - "location": City, Country (e.g. Dubai, UAE or Bangalore, India).
+       - "industry": most likely industry (Technology, Finance, Consulting, Healthcare, Retail).
+
+    2. **Banner Copy** (for the role above, based on the actual profile content)
+       - "custom_hook": 3-8 words, action-oriented and value-driven (e.g. "Building Scalable Cloud Solutions").
+       - "custom_tagline": 8-15 words expanding the hook with skills or measurable impact.
+
+    3. **Structured Resume** ("resume"): every section of the resume, polished:
+       - Fix capitalization (e.g. "python" -> "Python", "aws" -> "AWS") and standardize dates ("Jan 2023" or "2023").
+       - Write the summary in a professional, third-person executive voice.
+       - Format every experience/project "description" as HTML bullets: <ul><li>...</li></ul>.
+       - "skills" and "languages" comma separated; "certifications" newline separated.
+       - Use "" or [] for anything missing.
+    """
+
@@ -0,0 +1,87 @@
+# qr_cache.py
+import threading
+from collections import OrderedDict
+
+from .lazy_imports import LazyImport
+
+Image = LazyImport("PIL.Image")
+qrcode = LazyImport("qrcode")
+
+ERROR_CORRECTION = {"L": "ERROR_CORRECT_L", "M": "ERROR_CORRECT_M", "Q": "ERROR_CORRECT_Q", "H": "ERROR_CORRECT_H"}
+
+# Quiet zone in modules required around the code (ISO/IEC 18004)
+QUIET_ZONE = 4
+
+
+def render_qr(data, size, error_correction="M", fill=(0, 0, 0), back=(255, 255, 255)):
+    """
+    RGB image of exactly size x size pixels: each module is drawn at the largest whole
+    box size that fits with its quiet zone, and the remainder widens the margin.
+    """
+    qr = qrcode.QRCode(error_correction=getattr(qrcode.constants, ERROR_CORRECTION[error_correction]), border=0)
+    qr.add_data(data)
+    qr.make(fit=True)
+    modules = qr.modules_count
+    qr.box_size = max(1, size // (modules + 2 * QUIET_ZONE))
+    code = qr.make_image(fill_color=fill, back_color=back).get_image().convert("RGB")
+    if code.size[0] > size:
+        # Too many modules for the box even at one pixel each: an undersized code would not scan
+        print(f"Warning: QR code for {len(data)} characters needs more than {size}px")
+        return code
+    image = Image.new("RGB", (size, size), back)
+    offset = (size - code.size[0]) // 2
+    image.paste(code, (offset, offset))
+    return image
+
+
+class QRCache:
+    """
+    Rendered QR codes keyed on (data, size, error correction, colors), held in a memory LRU.
+
+    Returned images are shared between callers: paste them, do not draw on them.
+    """
+
+    def __init__(self, max_items=64):
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "renders": 0}
+
+    def get(self, data, size, error_correction="M", fill=(0, 0, 0), back=(255, 255, 255)):
+        key = (data, size, error_correction, tuple(fill), tuple(back))
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return image
+            # Rendered under the lock so concurrent banner variants build each code once
+            image = render_qr(data, size, error_correction, fill, back)
+            self.stats["renders"] += 1
+            self._memory[key] = image
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+            return image
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, memory_items=len(self._memory))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_qr_cache():
+    """
+    Process-wide cache shared by every VisualFactory.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = QRCache()
+        return _default
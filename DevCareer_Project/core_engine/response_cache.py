@@ -0,0 +1,166 @@
+# response_cache.py
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "DEVCAREER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "devcareer")
+)
+
+
+def make_cache_key(model_name, settings, prompt, image_bytes=None):
+    """
+    Builds a content-addressed key from everything that affects the model output.
+    """
+    hasher = hashlib.sha256()
+    header = json.dumps(
+        {"model": model_name, "settings": settings or {}},
+        sort_keys=True,
+        default=str
+    )
+    hasher.update(header.encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update(str(prompt).encode("utf-8"))
+    if image_bytes:
+        hasher.update(b"\x00")
+        hasher.update(image_bytes)
+    return hasher.hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier (memory LRU + SQLite) cache for LLM responses.
+    """
+
+    def __init__(self, disk_path=None, max_memory_items=256, max_disk_items=5000, ttl_seconds=7 * 24 * 3600):
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = disk_path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        self._conn = None
+        if disk_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(disk_path)), exist_ok=True)
+                self._conn = sqlite3.connect(disk_path, check_same_thread=False, timeout=5)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: response cache disk tier disabled ({e})")
+                self._conn = None
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key):
+        """
+        Returns the cached value for key, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self.stats["hits"] += 1
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        value, created_at = row
+                        if not self._expired(created_at, now):
+                            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                            self._conn.commit()
+                            self._remember(key, value, created_at)
+                            self.stats["hits"] += 1
+                            self.stats["disk_hits"] += 1
+                            return value
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"Response cache read error: {e}")
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key, value):
+        """
+        Stores value under key in both tiers.
+        """
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self.stats["writes"] += 1
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                        (key, value, now, now)
+                    )
+                    self._evict_disk(now)
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    print(f"Response cache write error: {e}")
+
+    def _remember(self, key, value, created_at):
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _evict_disk(self, now):
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        overflow = count - self.max_disk_items
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.stats["evictions"] += overflow
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["memory_items"] = len(self._memory)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+def default_response_cache():
+    """
+    Returns a cache with the on-disk tier stored under DEVCAREER_CACHE_DIR.
+    """
+    return ResponseCache(disk_path=os.path.join(DEFAULT_CACHE_DIR, "llm_responses.sqlite3"))
@@ -0,0 +1,229 @@
+# resume_context.py
+import re
+import hashlib
+import time
+import datetime
+import threading
+from collections import OrderedDict
+
+# Gemini only accepts cached contents above a minimum size; smaller resumes use the local digest
+PROVIDER_CACHE_MIN_TOKENS = 4096
+PROVIDER_CACHE_TTL_MINUTES = 60
+# Refresh a provider cache this long before it expires so an in-flight call never hits a dead cache
+PROVIDER_CACHE_REFRESH_MARGIN_SECONDS = 120
+
+_PAGE_MARKER = re.compile(r"^\s*(page\s*\d+(\s*(of|/)\s*\d+)?|\d+\s*/\s*\d+)\s*$", re.IGNORECASE)
+_BULLET_CHARS = re.compile(r"^[\s•●▪■‣⁃∙\-\*·]+")
+_SPACES = re.compile(r"[ \t\u00a0]+")
+
+
+def resume_fingerprint(resume_text):
+    return hashlib.sha256(str(resume_text).strip().encode("utf-8")).hexdigest()
+
+
+def file_fingerprint(file_bytes):
+    """
+    SHA-256 of an uploaded file's bytes: the same upload maps to the same key in every tab.
+    """
+    return hashlib.sha256(bytes(file_bytes)).hexdigest()
+
+
+# Lines at the top and bottom of a page where running headers/footers sit
+PAGE_EDGE_LINES = 2
+
+
+def _split_pages(resume_text):
+    # Page boundaries are form feeds or "Page 2 of 3"-style markers; text without them is one page
+    pages, current = [], []
+    for raw_line in str(resume_text).replace("\f", "\n\f\n").splitlines():
+        line = _SPACES.sub(" ", raw_line).strip()
+        if line == "\f" or _PAGE_MARKER.match(line):
+            pages.append(current)
+            current = []
+        elif line:
+            if _BULLET_CHARS.match(line):
+                line = "- " + _BULLET_CHARS.sub("", line).strip()
+            current.append(line)
+    pages.append(current)
+    return [page for page in pages if page]
+
+
+def _page_edges(page):
+    if len(page) <= 2 * PAGE_EDGE_LINES:
+        return set(range(len(page)))
+    return set(range(PAGE_EDGE_LINES)) | set(range(len(page) - PAGE_EDGE_LINES, len(page)))
+
+
+def build_resume_digest(resume_text):
+    """
+    Compacts extracted resume text without dropping content: collapses whitespace,
+    normalizes bullet glyphs, and removes page markers and the header/footer lines
+    repeated at page boundaries. Repeated titles and bullets inside a page are kept.
+    """
+    pages = _split_pages(resume_text)
+    edge_pages = {}
+    for number, page in enumerate(pages):
+        for index in _page_edges(page):
+            edge_pages.setdefault(page[index].lower(), set()).add(number)
+    running = {key for key, numbers in edge_pages.items() if len(numbers) > 1}
+
+    seen, lines = set(), []
+    for page in pages:
+        edges = _page_edges(page)
+        for index, line in enumerate(page):
+            key = line.lower()
+            if index in edges and key in running:
+                # PDF exports repeat the name/contact header on every page: keep the first copy
+                if key in seen:
+                    continue
+                seen.add(key)
+            lines.append(line)
+    return "\n".join(lines)
+
+
+class ResumeContext:
+    """
+    A resume uploaded once per session and referenced by every prompt built from it.
+
+    mode "provider": the resume lives in a Gemini cached content and prompts carry a short reference.
+    mode "digest": prompts inline the compact local digest instead of the raw text.
+    """
+
+    def __init__(self, resume_text, digest, mode="digest", cached_content=None, model=None,
+                 ttl_minutes=PROVIDER_CACHE_TTL_MINUTES, expires_at=None):
+        self.fingerprint = resume_fingerprint(resume_text)
+        self.digest = digest
+        self.mode = mode
+        self.cached_content = cached_content
+        self.model = model
+        self.raw_chars = len(str(resume_text))
+        self.ttl_minutes = ttl_minutes
+        # Wall-clock time the provider cache lapses; None for digest contexts
+        if mode == "provider" and expires_at is None:
+            expires_at = time.time() + ttl_minutes * 60
+        self.expires_at = expires_at
+        # Set when a provider cache could not be refreshed and the context fell back to its digest
+        self.degraded = False
+        self._lock = threading.Lock()
+
+    @property
+    def provider_reference(self):
+        """
+        Short pointer to the provider-cached resume, as embedded in prompts built in provider mode.
+        """
+        return (
+            f"[The candidate's full resume is provided in the cached context "
+            f"(resume id {self.fingerprint[:12]}). Use it as the resume content.]"
+        )
+
+    @property
+    def reference(self):
+        """
+        Text that prompt builders receive in place of the raw resume.
+        """
+        return self.provider_reference if self.mode == "provider" else self.digest
+
+    def expired(self, now=None):
+        if self.mode != "provider" or self.expires_at is None:
+            return False
+        now = time.time() if now is None else now
+        return now >= self.expires_at - PROVIDER_CACHE_REFRESH_MARGIN_SECONDS
+
+    def ensure_fresh(self):
+        """
+        Extends the provider cache's TTL when it is about to lapse. If that fails the context
+        falls back to digest mode. Returns True while the provider cache is usable.
+        """
+        with self._lock:
+            if self.expired():
+                try:
+                    self.cached_content.update(ttl=datetime.timedelta(minutes=self.ttl_minutes))
+                    self.expires_at = time.time() + self.ttl_minutes * 60
+                except Exception as e:
+                    print(f"Resume context cache expired and could not be refreshed, using local digest: {e}")
+                    self.mode = "digest"
+                    self.cached_content = None
+                    self.model = None
+                    self.expires_at = None
+                    self.degraded = True
+            return self.mode == "provider"
+
+    def stats(self):
+        return {
+            "mode": self.mode,
+            "raw_chars": self.raw_chars,
+            "prompt_chars": len(self.reference),
+            "saved_chars_per_prompt": self.raw_chars - len(self.reference),
+            "expires_at": self.expires_at
+        }
+
+
+def create_resume_context(resume_text, model_name, genai=None, ttl_minutes=PROVIDER_CACHE_TTL_MINUTES):
+    """
+    Builds a ResumeContext, using Gemini context caching when the API and resume size allow it.
+    """
+    digest = build_resume_digest(resume_text)
+    if genai and len(digest) // 4 >= PROVIDER_CACHE_MIN_TOKENS:
+        try:
+            from google.generativeai import caching
+            # Stamped before the create call so the recorded expiry never runs past the provider's
+            expires_at = time.time() + ttl_minutes * 60
+            cached_content = caching.CachedContent.create(
+                model=f"models/{model_name}",
+                display_name=f"resume-{resume_fingerprint(resume_text)[:12]}",
+                system_instruction="You are a career assistant. The candidate's resume follows.",
+                contents=[digest],
+                ttl=datetime.timedelta(minutes=ttl_minutes)
+            )
+            model = genai.GenerativeModel.from_cached_content(cached_content=cached_content)
+            return ResumeContext(resume_text, digest, mode="provider", cached_content=cached_content, model=model,
+                                 ttl_minutes=ttl_minutes, expires_at=expires_at)
+        except Exception as e:
+            print(f"Context caching unavailable, using local resume digest: {e}")
+    return ResumeContext(resume_text, digest)
+
+
+class ResumeContextStore:
+    """
+    Bounded LRU of ResumeContexts keyed by resume fingerprint.
+    """
+
+    def __init__(self, max_items=64):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, resume_text):
+        """
+        Returns the context for resume_text, refreshing a provider cache that is about to expire.
+        """
+        if not resume_text:
+            return None
+        fingerprint = resume_fingerprint(resume_text)
+        with self._lock:
+            context = self._items.get(fingerprint)
+            if context is not None:
+                self._items.move_to_end(fingerprint)
+        if context is not None:
+            context.ensure_fresh()
+        return context
+
+    def put(self, context):
+        with self._lock:
+            self._items[context.fingerprint] = context
+            self._items.move_to_end(context.fingerprint)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def find_by_reference(self, prompt):
+        """
+        Returns the context whose provider reference appears in prompt, if any. This includes
+        contexts that have since fallen back to digest mode, so callers can swap the reference out.
+        """
+        if not isinstance(prompt, str):
+            return None
+        with self._lock:
+            for context in self._items.values():
+                if (context.mode == "provider" or context.degraded) and context.provider_reference in prompt:
+                    return context
+        return None
@@ -0,0 +1,325 @@
+# resume_parser.py
+import re
+
+# Deterministic, millisecond fast path for the Resume Builder structure (see RESUME_SCHEMA).
+# parse_resume_local returns the builder dict plus a 0..1 confidence per top-level field;
+# the engine only sends fields below LOW_CONFIDENCE to the model.
+
+LOW_CONFIDENCE = 0.6
+
+SECTION_ALIASES = {
+    "contact": ["contact", "contact information", "contact details", "personal details"],
+    "summary": ["summary", "professional summary", "profile", "professional profile", "about", "about me",
+                "objective", "career objective", "career summary", "executive summary"],
+    "experience": ["experience", "work experience", "professional experience", "employment history",
+                   "work history", "employment", "career history", "relevant experience"],
+    "projects": ["projects", "personal projects", "key projects", "academic projects", "selected projects",
+                 "side projects"],
+    "education": ["education", "academic background", "academics", "educational qualifications",
+                  "education and training"],
+    "skills": ["skills", "technical skills", "top skills", "core competencies", "key skills", "technologies",
+               "tech stack", "core skills", "skills and tools", "areas of expertise"],
+    "certifications": ["certifications", "licenses and certifications", "certificates", "certification",
+                       "courses", "licenses"],
+    "languages": ["languages", "language"],
+}
+_HEADER_LOOKUP = {alias: field for field, aliases in SECTION_ALIASES.items() for alias in aliases}
+# A missing optional section usually means the resume has none, not that we failed to find it
+OPTIONAL_SECTIONS = {"projects", "certifications", "languages"}
+ABSENT_OPTIONAL_CONFIDENCE = 0.7
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s*['’]?\d{{2,4}}|\d{{1,2}}[/.-]\d{{2,4}}|(?:19|20)\d{{2}})"
+_DATE_RANGE = re.compile(
+    rf"({_DATE})\s*(?:-|–|—|to|until)\s*({_DATE}|present|current|now|till date|ongoing)",
+    re.IGNORECASE
+)
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE = re.compile(r"(?<![\w/])\+?\d[\d\s().-]{7,}\d(?![\w/])")
+_LINKEDIN = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/in/[\w-]+/?", re.IGNORECASE)
+_URL = re.compile(r"(?:https?://|www\.)\S+|\b[\w-]+\.(?:dev|io|me|com|net|org|app)(?:/\S*)?\b|github\.com/\S+",
+                  re.IGNORECASE)
+_BULLET = re.compile(r"^\s*(?:[•●▪■‣⁃∙\-\*·◦➢➤►✓]|\d+[.)])\s*")
+_SEPARATORS = re.compile(r"\s*(?:\||•|·|\t| {3,})\s*")
+_LIST_SPLIT = re.compile(r"\s*(?:,|;|\||•|·|\n|\t)\s*")
+_LOCATION = re.compile(r"^[A-Za-z .'-]+(?:,\s*[A-Za-z .'-]+){1,2}$")
+_LANGUAGE_LINE = re.compile(r"^[A-Za-z]+(?:\s*\([^)]*\))?(?:\s*[,|•]\s*[A-Za-z]+(?:\s*\([^)]*\))?)*$")
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)")
+_SCHOOL = re.compile(r"\b(university|college|institute|school|academy|polytechnic|iit|nit|bits)\b", re.IGNORECASE)
+_DEGREE = re.compile(
+    r"\b(bachelor|master|b\.?\s?tech|m\.?\s?tech|b\.?e\b|m\.?e\b|b\.?sc|m\.?sc|b\.?s\b|m\.?s\b|b\.?a\b|m\.?a\b|"
+    r"bca|mca|mba|ph\.?d|diploma|associate|high school|hsc|ssc|degree)",
+    re.IGNORECASE
+)
+_AT = re.compile(r"\s+(?:at|@)\s+", re.IGNORECASE)
+_DURATION = re.compile(r"\(?\b\d+\s*(?:yrs?|years?|mos?|months?)\b.*$", re.IGNORECASE)
+# LinkedIn "Save to PDF" exports list the company above the title
+_LINKEDIN_EXPORT = re.compile(r"^\s*top skills\s*$", re.IGNORECASE | re.MULTILINE)
+_TECH_PREFIX = re.compile(r"^(?:tech(?:nologies|nology| stack)?|stack|tools|built with)\s*[:\-–]\s*", re.IGNORECASE)
+
+
+def _clean(line):
+    return re.sub(r"\s+", " ", line).strip()
+
+
+def _is_bullet(line):
+    return bool(_BULLET.match(line))
+
+
+def _strip_bullet(line):
+    return _BULLET.sub("", line).strip()
+
+
+def _section_of(line):
+    """
+    Field name if line is a section header, else None.
+    """
+    if len(line) > 40:
+        return None
+    key = re.sub(r"[^a-z& ]", "", line.lower()).replace("&", "and").strip()
+    return _HEADER_LOOKUP.get(re.sub(r"\s+", " ", key))
+
+
+def split_sections(text):
+    """
+    (preamble lines, {field: [lines]}) with blank lines and page markers dropped.
+    A repeated header appends to the same section.
+    """
+    preamble = []
+    sections = {}
+    current = None
+    for raw in str(text).splitlines():
+        line = _clean(raw)
+        if not line or re.fullmatch(r"page \d+( of \d+)?", line, re.IGNORECASE):
+            continue
+        field = _section_of(line)
+        if field:
+            current = field
+            sections.setdefault(field, [])
+            continue
+        (sections[current] if current else preamble).append(line)
+    return preamble, sections
+
+
+def _html_list(items):
+    items = [item for item in items if item]
+    if not items:
+        return ""
+    return "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+
+
+def _bullet_items(lines):
+    """
+    Groups body lines into bullet items; wrapped continuation lines join the previous item.
+    """
+    items = []
+    for line in lines:
+        if _is_bullet(line) or not items:
+            items.append(_strip_bullet(line))
+        elif line[:1].islower() or not items[-1].endswith((".", "!", "?", ":")):
+            items[-1] = f"{items[-1]} {line}"
+        else:
+            items.append(line)
+    return items
+
+
+def _parse_contact(preamble):
+    contact = {"name": "", "email": "", "phone": "", "location": "", "linkedin": "", "portfolio": ""}
+    blob = "\n".join(preamble)
+    email = _EMAIL.search(blob)
+    linkedin = _LINKEDIN.search(blob)
+    contact["email"] = email.group(0) if email else ""
+    contact["linkedin"] = linkedin.group(0) if linkedin else ""
+    for line in preamble:
+        for part in _SEPARATORS.split(line):
+            part = part.strip(" ,")
+            if not part:
+                continue
+            if not contact["phone"]:
+                phone = _PHONE.search(part)
+                if phone and not _EMAIL.search(part) and not _YEAR.fullmatch(phone.group(0)):
+                    contact["phone"] = phone.group(0).strip()
+                    continue
+            if _EMAIL.search(part) or _LINKEDIN.search(part):
+                continue
+            url = _URL.search(part)
+            if url:
+                if not contact["portfolio"]:
+                    contact["portfolio"] = url.group(0)
+                continue
+            if not contact["location"] and _LOCATION.match(part) and len(part.split()) <= 5:
+                contact["location"] = part
+                continue
+            words = part.split()
+            if (not contact["name"] and 2 <= len(words) <= 4
+                    and all(w[:1].isupper() and w.replace(".", "").replace("-", "").isalpha() for w in words)):
+                contact["name"] = part
+    confidence = (0.5 if contact["name"] else 0.0) + (0.5 if contact["email"] or contact["phone"] else 0.0)
+    return contact, confidence
+
+
+def _split_title_company(parts, company_first=False):
+    parts = [p for p in parts if p]
+    if not parts:
+        return "", ""
+    if len(parts) == 1:
+        at = _AT.split(parts[0], maxsplit=1)
+        return (at[0], at[1]) if len(at) == 2 else (parts[0], "")
+    return (parts[1], parts[0]) if company_first else (parts[0], parts[1])
+
+
+def _parse_experience(lines, company_first=False):
+    entries = []
+    anchors = [i for i, line in enumerate(lines) if not _is_bullet(line) and _DATE_RANGE.search(line)]
+    body_start = 0
+    for i in anchors:
+        line = lines[i]
+        match = _DATE_RANGE.search(line)
+        dates = f"{match.group(1)} - {match.group(2)}"
+        rest = _DURATION.sub("", line[:match.start()] + " " + line[match.end():])
+        parts = [p.strip(" ,-–|") for p in _SEPARATORS.split(rest) if p.strip(" ,-–|")]
+
+        # Up to two short header lines directly above the date line (title, company)
+        header = []
+        j = i - 1
+        while j >= body_start and len(header) < 2 and not _is_bullet(lines[j]) \
+                and len(lines[j]) <= 80 and not lines[j].endswith("."):
+            header.insert(0, lines[j])
+            j -= 1
+        if entries:
+            # The previous entry's body ends where this entry's header begins
+            prev_end = j + 1
+            entries[-1]["_body"] = lines[body_start:prev_end]
+        title, company = _split_title_company(header + parts, company_first)
+
+        next_line = i + 1
+        location = ""
+        if next_line < len(lines) and _LOCATION.match(lines[next_line]) and len(lines[next_line]) <= 40:
+            location = lines[next_line]
+            next_line += 1
+        body_start = next_line
+        entries.append({"title": title, "company": company, "dates": dates, "location": location, "_body": []})
+    if entries:
+        entries[-1]["_body"] = lines[body_start:]
+
+    for entry in entries:
+        entry["description"] = _html_list(_bullet_items(entry.pop("_body")))
+    if not entries:
+        return [], (0.2 if lines else 0.0)
+    complete = sum(1 for e in entries if e["title"] and e["company"])
+    return entries, round(0.9 * complete / len(entries), 3)
+
+
+def _parse_projects(lines):
+    projects = []
+    for line in lines:
+        stack = _TECH_PREFIX.match(line)
+        if stack and projects:
+            projects[-1]["tech_stack"] = line[stack.end():].strip()
+        elif not _is_bullet(line) and len(line) <= 80 and not line.endswith(".") \
+                and (not projects or projects[-1]["_body"]):
+            title, _, tech = line.partition("|")
+            projects.append({"title": title.strip(" -–:"), "tech_stack": tech.strip(), "_body": []})
+        elif projects:
+            projects[-1]["_body"].append(line)
+    for project in projects:
+        project["description"] = _html_list(_bullet_items(project.pop("_body")))
+    if not projects:
+        return [], (0.2 if lines else 0.0)
+    described = sum(1 for p in projects if p["description"])
+    return projects, round(0.85 * described / len(projects), 3)
+
+
+def _parse_education(lines):
+    entries = []
+    for line in lines:
+        line = _strip_bullet(line)
+        years = _YEAR.findall(line)
+        text = _DATE_RANGE.sub("", line)
+        text = _YEAR.sub("", text).strip(" ,-–|()·")
+        is_school = bool(_SCHOOL.search(text))
+        is_degree = bool(_DEGREE.search(text))
+        if not entries or (is_school and entries[-1]["school"]) or (is_degree and not is_school and entries[-1]["degree"]):
+            entries.append({"school": "", "degree": "", "dates": ""})
+        entry = entries[-1]
+        if is_school and not entry["school"]:
+            pieces = re.split(r"\s*[|–]\s*|\s+-\s+", text, maxsplit=1)
+            entry["school"] = pieces[0]
+            if len(pieces) > 1 and _DEGREE.search(pieces[1]) and not entry["degree"]:
+                entry["degree"] = pieces[1]
+        elif text and not entry["degree"]:
+            entry["degree"] = text
+        if years and not entry["dates"]:
+            entry["dates"] = " - ".join(years[:2])
+    entries = [e for e in entries if e["school"] or e["degree"]]
+    if not entries:
+        return [], (0.2 if lines else 0.0)
+    complete = sum(1 for e in entries if e["school"] and e["degree"])
+    return entries, round(0.9 * complete / len(entries), 3)
+
+
+def _list_items(lines):
+    seen = set()
+    items = []
+    for item in _LIST_SPLIT.split("\n".join(_strip_bullet(line) for line in lines)):
+        item = item.strip(" .")
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            items.append(item)
+    return items
+
+
+def parse_resume_local(resume_text):
+    """
+    Splits resume text into the builder structure without a model call.
+
+    Returns (data, confidence): data has the RESUME_SCHEMA keys; confidence maps each
+    top-level field to 0..1, where values below LOW_CONFIDENCE mean the field should
+    be filled by the model instead.
+    """
+    preamble, sections = split_sections(resume_text)
+    data = {}
+    confidence = {}
+
+    # In sidebar layouts the name/headline block follows the last sidebar section (often Languages)
+    language_lines = sections.get("languages", [])
+    overflow = next((i for i, line in enumerate(language_lines) if not _LANGUAGE_LINE.match(line)), len(language_lines))
+    preamble = preamble + sections.pop("contact", []) + language_lines[overflow:]
+    language_lines = language_lines[:overflow]
+
+    data["contact"], confidence["contact"] = _parse_contact(preamble)
+    if not data["contact"]["linkedin"]:
+        linkedin = _LINKEDIN.search(str(resume_text))
+        data["contact"]["linkedin"] = linkedin.group(0) if linkedin else ""
+
+    summary = sections.get("summary", [])
+    data["summary"] = " ".join(_strip_bullet(line) for line in summary)
+    confidence["summary"] = 0.9 if len(data["summary"]) >= 40 else (0.3 if summary else 0.0)
+
+    data["experience"], confidence["experience"] = _parse_experience(
+        sections.get("experience", []), company_first=bool(_LINKEDIN_EXPORT.search(str(resume_text)))
+    )
+    data["projects"], confidence["projects"] = _parse_projects(sections.get("projects", []))
+    data["education"], confidence["education"] = _parse_education(sections.get("education", []))
+
+    skills = _list_items(sections.get("skills", []))
+    data["skills"] = ", ".join(skills)
+    confidence["skills"] = 0.9 if len(skills) >= 3 else (0.4 if skills else 0.0)
+
+    certifications = [_strip_bullet(line) for line in sections.get("certifications", [])]
+    data["certifications"] = "\n".join(certifications)
+    confidence["certifications"] = 0.9 if certifications else 0.0
+
+    languages = _list_items([_PARENTHETICAL.sub("", line) for line in language_lines])
+    data["languages"] = ", ".join(languages)
+    confidence["languages"] = 0.9 if languages else 0.0
+
+    for field in OPTIONAL_SECTIONS:
+        if field not in sections:
+            confidence[field] = ABSENT_OPTIONAL_CONFIDENCE
+    return data, confidence
+
+
+def low_confidence_fields(confidence, threshold=LOW_CONFIDENCE):
+    return [field for field, score in confidence.items() if score < threshold]
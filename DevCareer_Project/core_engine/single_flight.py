@@ -0,0 +1,111 @@
+# single_flight.py
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: cross-process coalescing is unavailable
+    fcntl = None
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key runs fn; callers arriving while it is in flight block
+    and receive the same result (or exception). With lock_dir set, the leader also
+    holds an flock on <lock_dir>/<key>.lock, and a process that finds the lock taken
+    waits for it and then tries lookup() (typically the shared disk cache) before
+    running fn itself.
+    """
+
+    def __init__(self, lock_dir=None):
+        self.lock_dir = lock_dir if fcntl else None
+        if lock_dir and not fcntl:
+            print("Warning: cross-process single-flight needs fcntl; coalescing in-process only.")
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.stats = {"leaders": 0, "coalesced": 0, "cross_process_coalesced": 0}
+
+    def do(self, key, fn, lookup=None):
+        """
+        Returns (result, shared): shared is True when another caller's execution was reused.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.stats["coalesced"] += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.stats["leaders"] += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        shared = False
+        try:
+            flight.result, shared = self._lead(key, fn, lookup)
+            return flight.result, shared
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _lead(self, key, fn, lookup):
+        if not self.lock_dir:
+            return fn(), False
+        os.makedirs(self.lock_dir, exist_ok=True)
+        with open(os.path.join(self.lock_dir, f"{key}.lock"), "a+") as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another process is already running this call: wait for it, then reuse its result
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                value = lookup() if lookup else None
+                if value is not None:
+                    with self._lock:
+                        self.stats["cross_process_coalesced"] += 1
+                    return value, True
+            try:
+                return fn(), False
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._flights)
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, in_flight=len(self._flights))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_single_flight():
+    """
+    Process-wide instance shared by every engine. DEVCAREER_SINGLE_FLIGHT_DIR enables
+    cross-process coalescing through lock files in that directory.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = SingleFlight(os.getenv("DEVCAREER_SINGLE_FLIGHT_DIR") or None)
+        return _default
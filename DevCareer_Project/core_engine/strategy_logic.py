@@ -1,32 +1,19 @@
-import google.generativeai as genai
 import os
-import json
-import ast
+from .json_extract import extract_json
+from .llm_providers import provider_from_env
 
-# Configure Gemini API (Assuming API key is set in environment or handled elsewhere, 
-# but for now we'll use a placeholder or expect it to be configured in main)
-# In a real app, ensure genai.configure(api_key=...) is called.
+# The provider (Gemini by default) configures the API key; see llm_providers.provider_from_env.
 
 class StrategyLogic:
-    def __init__(self, api_key=None):
-        if api_key:
-            genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+    def __init__(self, api_key=None, provider=None):
+        self.provider = provider or provider_from_env(api_key)
+        self.model = self.provider.create_model('gemini-2.0-flash-exp')
 
     def _clean_json_response(self, response_text):
         """
         Cleans and parses JSON response from Gemini.
         """
-        try:
-            # Remove markdown code blocks if present
-            cleaned_text = response_text.replace("```json", "").replace("```", "").strip()
-            return json.loads(cleaned_text)
-        except json.JSONDecodeError:
-            try:
-                # Fallback to ast.literal_eval if json fails (sometimes single quotes are used)
-                return ast.literal_eval(cleaned_text)
-            except:
-                return None
+        return extract_json(response_text, openers="{[")
 
     def golden_visa_gap_analysis(self, github_profile_summary):
         """
@@ -0,0 +1,113 @@
+# text_extraction.py
+import io
+import os
+import threading
+
+from .lazy_imports import LazyImport
+from .response_cache import ResponseCache, DEFAULT_CACHE_DIR
+from .resume_context import file_fingerprint
+from .single_flight import default_single_flight
+from .pdf_extract import read_source, extract_pdf_text, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS
+
+Document = LazyImport("docx", "Document")
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+# Bump when extraction output changes so stale disk entries are not served
+EXTRACTOR_VERSION = 1
+
+
+class UnsupportedFileError(ValueError):
+    pass
+
+
+def detect_kind(file_bytes, file_type=None, filename=None):
+    """
+    "pdf", "docx" or None, from the MIME type, the file extension or the leading bytes.
+    """
+    if file_type == PDF_TYPE:
+        return "pdf"
+    if file_type == DOCX_TYPE:
+        return "docx"
+    name = (filename or "").lower()
+    if name.endswith(".pdf"):
+        return "pdf"
+    if name.endswith(".docx"):
+        return "docx"
+    if file_bytes[:5] == b"%PDF-":
+        return "pdf"
+    if file_bytes[:2] == b"PK":
+        return "docx"
+    return None
+
+
+def _docx_text(file_bytes):
+    doc = Document(io.BytesIO(file_bytes))
+    return "".join(para.text + "\n" for para in doc.paragraphs)
+
+
+class TextExtractionService:
+    """
+    Text of uploaded PDF/DOCX files, keyed on the SHA-256 of their bytes.
+
+    Results live in a memory LRU backed by SQLite, so a file is parsed once per
+    deployment no matter which tab (or the engine) asks for it. Concurrent requests
+    for the same file are coalesced into one parse.
+    """
+
+    def __init__(self, cache=None, single_flight=None):
+        self.cache = cache if cache is not None else ResponseCache(max_memory_items=128, ttl_seconds=None)
+        self.single_flight = single_flight or default_single_flight()
+
+    def cache_key(self, fingerprint, kind, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+        limits = f"{max_pages}:{max_chars}" if kind == "pdf" else "-"
+        return f"extract-v{EXTRACTOR_VERSION}-{kind}-{limits}-{fingerprint}"
+
+    def extract(self, source, file_type=None, filename=None,
+                max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+        """
+        Returns the extracted text. Raises UnsupportedFileError (a ValueError) for anything
+        but PDF/DOCX; parser errors propagate and are never cached.
+        """
+        file_bytes = read_source(source)
+        kind = detect_kind(file_bytes, file_type, filename or getattr(source, "name", None))
+        if kind is None:
+            raise UnsupportedFileError(f"Unsupported file type: {file_type or filename or 'unknown'}")
+
+        key = self.cache_key(file_fingerprint(file_bytes), kind, max_pages, max_chars)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        def _parse():
+            if kind == "pdf":
+                text = extract_pdf_text(file_bytes, max_pages=max_pages, max_chars=max_chars)
+            else:
+                text = _docx_text(file_bytes)
+            self.cache.set(key, text)
+            return text
+
+        text, _ = self.single_flight.do(key, _parse, lookup=lambda: self.cache.get(key))
+        return text
+
+    def get_stats(self):
+        return self.cache.get_stats()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_extraction_service():
+    """
+    Process-wide service with its disk tier under DEVCAREER_CACHE_DIR.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TextExtractionService(ResponseCache(
+                disk_path=os.path.join(DEFAULT_CACHE_DIR, "extracted_text.sqlite3"),
+                max_memory_items=128,
+                ttl_seconds=None
+            ))
+        return _default
@@ -0,0 +1,122 @@
+# text_layout.py
+import threading
+import weakref
+from functools import lru_cache
+
+# Text wrapped by rendered pixel width instead of character count, with font sizes
+# auto-fitted to a box. Glyph advances are measured once per font and summed afterwards,
+# so laying out a banner with warm caches is a handful of dict lookups.
+
+ELLIPSIS = "…"
+
+_advances = weakref.WeakKeyDictionary()
+_advances_lock = threading.Lock()
+
+
+def _advance_table(font):
+    table = _advances.get(font)
+    if table is None:
+        with _advances_lock:
+            table = _advances.setdefault(font, {})
+    return table
+
+
+def text_width(text, font):
+    """
+    Pixel width of a single line, from the font's memoized per-glyph advances.
+    """
+    table = _advance_table(font)
+    width = 0.0
+    for char in text:
+        advance = table.get(char)
+        if advance is None:
+            advance = table[char] = font.getlength(char)
+        width += advance
+    return width
+
+
+def _split_word(word, font, max_width):
+    # A word wider than the box is broken between characters
+    pieces, current = [], ""
+    for char in word:
+        if current and text_width(current + char, font) > max_width:
+            pieces.append(current)
+            current = char
+        else:
+            current += char
+    return pieces + [current]
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text, font, max_width):
+    """
+    Greedy word wrap so no line is wider than max_width pixels. Explicit newlines are kept.
+    Returns a tuple of lines.
+    """
+    space = text_width(" ", font)
+    lines = []
+    for paragraph in str(text).split("\n"):
+        current, current_width = "", 0.0
+        for word in paragraph.split():
+            word_width = text_width(word, font)
+            if word_width > max_width:
+                pieces = _split_word(word, font, max_width)
+                word, word_width = pieces[-1], text_width(pieces[-1], font)
+                if current:
+                    lines.append(current)
+                lines.extend(pieces[:-1])
+                current, current_width = word, word_width
+            elif not current:
+                current, current_width = word, word_width
+            elif current_width + space + word_width <= max_width:
+                current, current_width = f"{current} {word}", current_width + space + word_width
+            else:
+                lines.append(current)
+                current, current_width = word, word_width
+        lines.append(current)
+    return tuple(lines)
+
+
+def _ellipsize(line, font, max_width):
+    while line and text_width(line + ELLIPSIS, font) > max_width:
+        line = line[:-1].rstrip()
+    return line + ELLIPSIS
+
+
+def fit_text(text, font_for_size, max_width, max_lines=None, max_height=None,
+             min_size=10, max_size=72, line_spacing=1.25):
+    """
+    Largest font size in [min_size, max_size] at which text wraps into max_width within
+    max_lines and max_height. font_for_size(size) returns a font (ideally cached).
+
+    Returns (font, lines, line_height). If even min_size overflows, the lines are cut to
+    max_lines and the last one ends with an ellipsis.
+    """
+    def layout(size):
+        font = font_for_size(size)
+        lines = wrap_text(text, font, max_width)
+        line_height = round(size * line_spacing)
+        fits = (max_lines is None or len(lines) <= max_lines) and \
+               (max_height is None or len(lines) * line_height <= max_height)
+        return fits, font, lines, line_height
+
+    low, high, best = min_size, max_size, None
+    while low <= high:
+        size = (low + high) // 2
+        fits, font, lines, line_height = layout(size)
+        if fits:
+            best = (font, lines, line_height)
+            low = size + 1
+        else:
+            high = size - 1
+    if best is not None:
+        return best
+
+    _, font, lines, line_height = layout(min_size)
+    limit = len(lines)
+    if max_lines is not None:
+        limit = min(limit, max_lines)
+    if max_height is not None:
+        limit = min(limit, max(1, max_height // line_height))
+    lines = lines[:limit - 1] + (_ellipsize(lines[limit - 1], font, max_width),)
+    return font, lines, line_height
@@ -1,8 +1,34 @@
+from __future__ import annotations
+
+import io
 import os
-import textwrap
-from typing import List, Tuple, Optional, Dict, Any, Union
-from PIL import Image, ImageDraw, ImageFont
-import qrcode
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional, Any, Union, BinaryIO
+
+from .lazy_imports import LazyImport
+from .banner_layers import default_background_cache
+from .font_registry import default_font_registry
+from .qr_cache import default_qr_cache
+from .text_layout import wrap_text, fit_text
+
+# Pillow loads on the first render, not when the dashboard imports this module
+Image = LazyImport("PIL.Image")
+ImageDraw = LazyImport("PIL.ImageDraw")
+ImageFont = LazyImport("PIL.ImageFont")
+
+# Banner variants render on threads: Pillow releases the GIL for most raster and PNG/zlib work
+_render_pool = None
+_render_workers = os.cpu_count() or 2
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ThreadPoolExecutor(max_workers=_render_workers, thread_name_prefix="banner")
+        return _render_pool
 
 class VisualFactory:
     # Theme Constants
@@ -114,41 +140,29 @@ class VisualFactory:
         }
     }
     
-    FONTS = {
-        'arial': "C:\\Windows\\Fonts\\arial.ttf",
-        'arial_bold': "C:\\Windows\\Fonts\\arialbd.ttf"
-    }
+    BANNER_SIZE = (1584, 396)
 
-    def __init__(self):
-        self._font_cache: Dict[Tuple[str, int], Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]] = {}
-        # Validate fonts exist, otherwise fallback logic will handle it in _get_font
-        self.has_custom_fonts = os.path.exists(self.FONTS['arial']) and os.path.exists(self.FONTS['arial_bold'])
+    def __init__(self, background_cache=None, font_registry=None, qr_cache=None):
+        # Shared across instances: template backgrounds are drawn once per process (or read from disk)
+        self.background_cache = background_cache or default_background_cache()
+        # Shared across instances and render threads: font files are found and loaded once per process
+        self.fonts = font_registry or default_font_registry()
+        # Shared too: a user's portfolio QR is built once for every banner and template variant
+        self.qr_cache = qr_cache or default_qr_cache()
 
-    def _get_font(self, size: int, bold: bool = False) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
-        key = ('bold' if bold else 'regular', size)
-        if key in self._font_cache:
-            return self._font_cache[key]
+    @property
+    def has_custom_fonts(self) -> bool:
+        return self.fonts.has_truetype
 
-        font = None
-        try:
-            if self.has_custom_fonts:
-                path = self.FONTS['arial_bold'] if bold else self.FONTS['arial']
-                font = ImageFont.truetype(path, size)
-            else:
-                # Fallback to default if custom fonts are missing
-                font = ImageFont.load_default()
-        except Exception:
-             font = ImageFont.load_default()
-        
-        self._font_cache[key] = font
-        return font
+    def _get_font(self, size: int, bold: bool = False) -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
+        return self.fonts.get(size, bold=bold)
 
     def _draw_multiline_text(self, draw: ImageDraw.ImageDraw, text: str, x: float, y: float, 
-                             font: Any, fill: Union[Tuple[int, int, int], str], width_chars: int, line_spacing: int = 50) -> int:
+                             font: Any, fill: Union[Tuple[int, int, int], str], max_width: float, line_spacing: int = 50) -> int:
         """
-        Draws wrapped text and returns the new Y position.
+        Draws text wrapped to max_width pixels and returns the new Y position.
         """
-        lines = textwrap.wrap(text, width=width_chars)
+        lines = wrap_text(text, font, max_width)
         current_y = y
         for line in lines:
             draw.text((x, current_y), line, fill=fill, font=font)
@@ -172,11 +186,11 @@ class VisualFactory:
         
         # Left Side (Problem)
         draw.text((50, 50), "BEFORE", fill=self.COLORS['text_red'], font=title_font)
-        self._draw_multiline_text(draw, problem, 50, 150, text_font, self.COLORS['text_gray'], 20)
+        self._draw_multiline_text(draw, problem, 50, 150, text_font, self.COLORS['text_gray'], width/2 - 100)
             
         # Right Side (Solution)
         draw.text((width/2 + 50, 50), "AFTER", fill=self.COLORS['text_green'], font=title_font)
-        self._draw_multiline_text(draw, solution, width/2 + 50, 150, text_font, self.COLORS['text_gray'], 20)
+        self._draw_multiline_text(draw, solution, width/2 + 50, 150, text_font, self.COLORS['text_gray'], width/2 - 100)
             
         img.save(output_path)
         return output_path
@@ -236,14 +250,14 @@ class VisualFactory:
         s1 = create_slide(self.COLORS['bg_navy'])
         d1 = ImageDraw.Draw(s1)
         d1.text((100, 400), "CASE STUDY:", fill=self.COLORS['text_cyan'], font=f_text)
-        self._draw_multiline_text(d1, title, 100, 500, f_title, self.COLORS['text_white'], 15, 100)
+        self._draw_multiline_text(d1, title, 100, 500, f_title, self.COLORS['text_white'], width - 200, 100)
         slides.append(s1)
         
         # Slide 2: The Challenge
         s2 = create_slide(self.COLORS['bg_light_gray'])
         d2 = ImageDraw.Draw(s2)
         d2.text((100, 100), "THE CHALLENGE", fill=self.COLORS['text_black'], font=f_header)
-        self._draw_multiline_text(d2, problem, 100, 300, f_title, self.COLORS['text_red'], 25, 90)
+        self._draw_multiline_text(d2, problem, 100, 300, f_title, self.COLORS['text_red'], width - 200, 90)
         slides.append(s2)
         
         # Slide 3: The Solution (Architecture)
@@ -328,9 +342,7 @@ class VisualFactory:
         draw.text((text_x, 180), tagline, fill=self.COLORS['text_cyan'], font=f_tag)
         
         # QR Code
-        qr = qrcode.make(portfolio_url)
-        qr = qr.resize((250, 250))
-        img.paste(qr, (1250, 70))
+        img.paste(self.qr_cache.get(portfolio_url, 250), (1250, 70))
         
         # CTA
         draw.text((1260, 330), "Scan for Portfolio", fill=self.COLORS['text_white'], font=self._get_font(20))
@@ -354,84 +366,139 @@ class VisualFactory:
             company_name: Company/brand name to display
             output_path: Output file path
         """
+        img = self._compose_banner(template_key, custom_hook, custom_tagline,
+                                   self._circular_photo(profile_photo_path, 280), portfolio_url, company_name)
+        img.save(output_path)
+        return output_path
+
+    def render_banner_variants(self, template_keys: List[str], as_bytes: bool = False,
+                               custom_hook: Optional[str] = None, custom_tagline: Optional[str] = None,
+                               profile_photo_path: Union[str, BinaryIO, None] = None, portfolio_url: str = "https://linkedin.com",
+                               company_name: Optional[str] = None) -> List[Union[Image.Image, bytes]]:
+        """
+        Renders the same content on several banner templates concurrently, for side-by-side comparison.
+        Returns PIL images (or PNG bytes with as_bytes) in the order of template_keys.
+        profile_photo_path may also be an open binary file, e.g. an upload's BytesIO.
+        """
+        # Shared by every variant: the photo is decoded and masked once (the QR comes from qr_cache)
+        photo = self._circular_photo(profile_photo_path, 280)
+
+        def render(template_key: str) -> Union[Image.Image, bytes]:
+            img = self._compose_banner(template_key, custom_hook, custom_tagline, photo, portfolio_url, company_name)
+            if not as_bytes:
+                return img
+            buffer = io.BytesIO()
+            img.save(buffer, format="PNG")
+            return buffer.getvalue()
+
+        if len(template_keys) <= 1 or _render_workers == 1:
+            return [render(template_key) for template_key in template_keys]
+        pool = _get_render_pool()
+        return [future.result() for future in [pool.submit(render, key) for key in template_keys]]
+
+    def _circular_photo(self, profile_photo_path: Union[str, BinaryIO, None], photo_size: int) -> Optional[Image.Image]:
+        """
+        The profile photo (a path or binary file) resized to photo_size and masked to a circle (RGBA), or None.
+        """
+        if not profile_photo_path:
+            return None
+        if isinstance(profile_photo_path, str) and not os.path.exists(profile_photo_path):
+            return None
+        try:
+            profile_photo = Image.open(profile_photo_path)
+            # Create circular mask
+            mask = Image.new('L', (photo_size, photo_size), 0)
+            mask_draw = ImageDraw.Draw(mask)
+            mask_draw.ellipse((0, 0, photo_size, photo_size), fill=255)
+            
+            # Resize to square
+            profile_photo = profile_photo.resize((photo_size, photo_size))
+            
+            # Apply circular mask
+            output_photo = Image.new('RGBA', (photo_size, photo_size))
+            output_photo.paste(profile_photo, (0, 0))
+            output_photo.putalpha(mask)
+            return output_photo
+        except Exception as e:
+            print(f"Error adding profile photo: {e}")
+            return None
+
+    def _compose_banner(self, template_key: str, custom_hook: Optional[str], custom_tagline: Optional[str],
+                        photo: Optional[Image.Image], portfolio_url: str, company_name: Optional[str]) -> Image.Image:
+        """
+        Draws a template banner in memory: cached background plus photo, text and QR code.
+        """
         if template_key not in self.BANNER_TEMPLATES:
             template_key = 'lead_generation'  # Default fallback
         
         template = self.BANNER_TEMPLATES[template_key]
-        width, height = 1584, 396
+        width, height = self.BANNER_SIZE
         
-        # Create base image with primary background
-        img = Image.new('RGB', (width, height), color=template['bg_primary'])
+        # Copy of the cached template background; only the dynamic layers are drawn below
+        img = self.background_cache.get(template_key, width, height, template, self._render_background)
         draw = ImageDraw.Draw(img)
         
-        # Add geometric patterns based on template
-        self._add_geometric_patterns(draw, template_key, width, height, template)
-        
-        # Add profile photo if provided
-        photo_size = 280
+        # Paste profile photo if provided
         photo_x = 950
-        if profile_photo_path and os.path.exists(profile_photo_path):
-            try:
-                profile_photo = Image.open(profile_photo_path)
-                # Create circular mask
-                mask = Image.new('L', (photo_size, photo_size), 0)
-                mask_draw = ImageDraw.Draw(mask)
-                mask_draw.ellipse((0, 0, photo_size, photo_size), fill=255)
-                
-                # Resize to square
-                profile_photo = profile_photo.resize((photo_size, photo_size))
-                
-                # Apply circular mask
-                output_photo = Image.new('RGBA', (photo_size, photo_size))
-                output_photo.paste(profile_photo, (0, 0))
-                output_photo.putalpha(mask)
-                
-                # Paste onto banner
-                img.paste(output_photo, (photo_x, 60), output_photo)
-            except Exception as e:
-                print(f"Error adding profile photo: {e}")
+        if photo is not None:
+            img.paste(photo, (photo_x, 60), photo)
         
         # Text content
         hook_text = custom_hook if custom_hook else template['hook']
         tagline_text = custom_tagline if custom_tagline else template['tagline']
         
         # Fonts
-        f_hook = self._get_font(48, bold=True)
-        f_tagline = self._get_font(28)
         f_company = self._get_font(20)
         
         # Draw hook (main headline)
         text_x = 50
         text_y = 80
+        # Text column ends before the photo; hook and tagline shrink to fit it in 2 lines each
+        column_width = photo_x - text_x - 30
         
-        # Wrap hook text if too long
-        wrapped_hook = textwrap.wrap(hook_text, width=30)
-        for line in wrapped_hook[:2]:  # Max 2 lines
+        f_hook, hook_lines, hook_line_height = fit_text(
+            hook_text, lambda size: self._get_font(size, bold=True), column_width, max_lines=2, min_size=32, max_size=48)
+        for line in hook_lines:
             draw.text((text_x, text_y), line, fill=template['text_primary'], font=f_hook)
-            text_y += 60
+            text_y += hook_line_height
         
         # Draw tagline
         text_y += 20
-        wrapped_tagline = textwrap.wrap(tagline_text, width=45)
-        for line in wrapped_tagline[:2]:  # Max 2 lines
+        f_tagline, tagline_lines, tagline_line_height = fit_text(
+            tagline_text, self._get_font, column_width, max_lines=2, min_size=20, max_size=28)
+        for line in tagline_lines:
             draw.text((text_x, text_y), line, fill=template['text_secondary'], font=f_tagline)
-            text_y += 35
+            text_y += tagline_line_height
         
         # Company name if provided
         if company_name:
             draw.text((text_x, height - 50), company_name, fill=template['accent'], font=f_company)
         
         # QR Code (smaller, positioned at bottom right)
-        qr = qrcode.make(portfolio_url)
-        qr = qr.resize((180, 180))
-        img.paste(qr, (width - 220, height - 200))
+        img.paste(self.qr_cache.get(portfolio_url, 180), (width - 220, height - 200))
         
         # CTA text near QR
         draw.text((width - 210, height - 25), "Scan to Connect", fill=template['text_primary'], font=self._get_font(16))
-        
-        img.save(output_path)
-        return output_path
+        return img
     
+    def _render_background(self, template_key: str, width: int, height: int) -> Image.Image:
+        """
+        Draws a template's static background: primary color plus geometric patterns.
+        """
+        template = self.BANNER_TEMPLATES[template_key]
+        img = Image.new('RGB', (width, height), color=template['bg_primary'])
+        self._add_geometric_patterns(ImageDraw.Draw(img), template_key, width, height, template)
+        return img
+
+    def warm_backgrounds(self, template_keys: Optional[List[str]] = None) -> None:
+        """
+        Loads (or renders) every template background into the layer cache, e.g. at startup.
+        """
+        width, height = self.BANNER_SIZE
+        for template_key in template_keys or self.BANNER_TEMPLATES:
+            template = self.BANNER_TEMPLATES[template_key]
+            self.background_cache.get(template_key, width, height, template, self._render_background)
+
     def _add_geometric_patterns(self, draw: ImageDraw.ImageDraw, template_key: str, 
                                 width: int, height: int, template: dict):
         """
@@ -1,12 +1,14 @@
 
 # doc_builder.py - Updated
 import os
-try:
-    from docx import Document
-    from docx.shared import Pt, RGBColor, Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except ImportError:
-    Document = None
+from core_engine.lazy_imports import LazyImport
+
+# python-docx, bs4 and fpdf load on first use (keeps dashboard cold start fast)
+Document = LazyImport("docx", "Document")
+Pt = LazyImport("docx.shared", "Pt")
+RGBColor = LazyImport("docx.shared", "RGBColor")
+Inches = LazyImport("docx.shared", "Inches")
+WD_ALIGN_PARAGRAPH = LazyImport("docx.enum.text", "WD_ALIGN_PARAGRAPH")
 
 class TemplateManager:
     def __init__(self):
@@ -182,10 +184,7 @@ def create_resume_docx(text, output_path, template_name="Standard ATS"):
         print(f"Error creating DOCX: {e}")
         return False
         
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
+BeautifulSoup = LazyImport("bs4", "BeautifulSoup")
 
 def create_resume_docx_from_html(html_content, output_path, template_name="Standard ATS"):
     """
@@ -577,10 +576,7 @@ def create_structured_resume_docx(data, output_path, template_name="Standard ATS
         print(f"Error creating structured DOCX: {e}")
         return False
 
-try:
-    from fpdf import FPDF
-except ImportError:
-    FPDF = None
+FPDF = LazyImport("fpdf", "FPDF")
 
 def create_cover_letter_pdf(text, output_path, design_config=None):
     """
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_metrics import METRICS
+from core_engine.single_flight import SingleFlight
+from core_engine.async_engine import AsyncIntelligenceEngine, run_concurrently
+
+
+def _slow_response(text, delay=0.2):
+    async def _respond(prompt, **kwargs):
+        await asyncio.sleep(delay)
+        response = MagicMock()
+        response.text = text
+        return response
+    return _respond
+
+
+class TestAsyncEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=False)
+        self.engine.model = MagicMock()
+        self.async_engine = AsyncIntelligenceEngine(self.engine)
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_independent_calls_overlap(self):
+        self.engine.model.generate_content_async = _slow_response('{"role": "SRE", "stack": "Go"}')
+        start = time.perf_counter()
+        role, ats = run_concurrently(
+            self.async_engine.extract_role_and_stack("resume"),
+            self.async_engine.simulate_ats_parsing("resume")
+        )
+        elapsed = time.perf_counter() - start
+        self.assertEqual(role["role"], "SRE")
+        self.assertEqual(ats["stack"], "Go")
+        self.assertLess(elapsed, 0.35)
+
+    def test_limit_bounds_concurrency(self):
+        self.engine.model.generate_content_async = _slow_response("report", delay=0.1)
+        start = time.perf_counter()
+        results = run_concurrently(
+            *(self.async_engine.audit_resume_formatting(f"resume {i}") for i in range(3)),
+            limit=1
+        )
+        self.assertEqual(results, ["report"] * 3)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+
+    def test_other_methods_fall_back_to_threads(self):
+        response = MagicMock()
+        response.text = "Dear Hiring Manager"
+        self.engine.model.generate_content.return_value = response
+        (letter,) = run_concurrently(self.async_engine.generate_cover_letter("resume", "jd"))
+        self.assertEqual(letter, "Dear Hiring Manager")
+
+    def test_identical_async_calls_share_one_upstream_call(self):
+        METRICS.reset()
+        engine = IntelligenceEngine("fake_key", cache=False, single_flight=SingleFlight())
+        engine.model = MagicMock()
+        engine.model.generate_content_async = MagicMock(side_effect=_slow_response('{"role": "SRE", "stack": "Go"}'))
+        async_engine = AsyncIntelligenceEngine(engine)
+        results = run_concurrently(*(async_engine.extract_role_and_stack("resume") for _ in range(3)))
+        self.assertEqual([r["role"] for r in results], ["SRE"] * 3)
+        self.assertEqual(engine.model.generate_content_async.call_count, 1)
+        self.assertEqual(METRICS.snapshot()["extract_role_and_stack"]["devcareer_llm_coalesced_total"], 2)
+        # Callers get independent copies
+        results[0]["role"] = "edited"
+        self.assertEqual(results[1]["role"], "SRE")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageChops
+
+from core_engine import banner_layers
+from core_engine.banner_layers import BackgroundLayerCache
+from core_engine import visual_factory
+from core_engine.visual_factory import VisualFactory
+
+
+class TestBackgroundLayerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def render_banner(self, vf, template_key, name):
+        path = os.path.join(self.tmp, name)
+        vf.generate_banner_with_template(template_key, custom_hook="Shipping Go at scale",
+                                         portfolio_url="https://example.com/me", company_name="Acme",
+                                         output_path=path)
+        return Image.open(path).convert("RGB")
+
+    def test_cached_banner_matches_fresh_render(self):
+        vf = VisualFactory(BackgroundLayerCache())
+        for template_key in vf.BANNER_TEMPLATES:
+            fresh = self.render_banner(vf, template_key, f"{template_key}-1.png")
+            cached = self.render_banner(vf, template_key, f"{template_key}-2.png")
+            self.assertIsNone(ImageChops.difference(fresh, cached).getbbox(), template_key)
+        stats = vf.background_cache.get_stats()
+        self.assertEqual((stats["renders"], stats["hits"]), (len(vf.BANNER_TEMPLATES), len(vf.BANNER_TEMPLATES)))
+
+    def test_disk_tier_is_shared_by_new_caches(self):
+        disk_dir = os.path.join(self.tmp, "layers")
+        VisualFactory(BackgroundLayerCache(disk_dir=disk_dir)).warm_backgrounds()
+        warm = VisualFactory(BackgroundLayerCache(disk_dir=disk_dir))
+        warm.warm_backgrounds(["tech_innovator"])
+        self.assertEqual(warm.background_cache.get_stats()["renders"], 0)
+        self.assertEqual(warm.background_cache.get_stats()["disk_hits"], 1)
+        width, height = VisualFactory.BANNER_SIZE
+        fresh = warm._render_background("tech_innovator", width, height)
+        loaded = warm.background_cache.get("tech_innovator", width, height, warm.BANNER_TEMPLATES["tech_innovator"],
+                                           warm._render_background)
+        self.assertIsNone(ImageChops.difference(fresh, loaded).getbbox())
+
+    def test_disk_tier_prunes_stale_versions(self):
+        disk_dir = os.path.join(self.tmp, "layers")
+        render = lambda key, width, height: Image.new("RGB", (width, height), (10, 20, 30))
+        BackgroundLayerCache(disk_dir=disk_dir).get("a", 4, 4, {"color": 1}, render)
+        BackgroundLayerCache(disk_dir=disk_dir).get("b", 4, 4, {"color": 1}, render)
+        BackgroundLayerCache(disk_dir=disk_dir).get("a", 4, 4, {"color": 2}, render)
+        files = sorted(os.listdir(disk_dir))
+        self.assertEqual([name.split("-")[0] for name in files], ["a", "b"])
+
+    def test_default_cache_is_memory_only(self):
+        with patch.object(banner_layers, "_default", None), patch.dict(os.environ):
+            os.environ.pop("DEVCAREER_BANNER_LAYER_DISK", None)
+            self.assertIsNone(banner_layers.default_background_cache().disk_dir)
+
+    def test_copies_are_independent_and_lru_is_bounded(self):
+        cache = BackgroundLayerCache(max_items=2)
+        render = lambda key, width, height: Image.new("RGB", (width, height), (10, 20, 30))
+        first = cache.get("a", 4, 4, {}, render)
+        first.putpixel((0, 0), (255, 255, 255))
+        self.assertEqual(cache.get("a", 4, 4, {}, render).getpixel((0, 0)), (10, 20, 30))
+        cache.get("b", 4, 4, {}, render)
+        cache.get("c", 4, 4, {}, render)
+        cache.get("a", 4, 4, {}, render)
+        self.assertEqual(cache.get_stats()["renders"], 4)
+        self.assertEqual(cache.get_stats()["memory_items"], 2)
+
+
+class TestBannerVariants(unittest.TestCase):
+
+    def test_variants_in_request_order_match_single_renders(self):
+        vf = VisualFactory(BackgroundLayerCache())
+        keys = ["elegant_rose", "tech_innovator", "lead_generation", "tech_innovator"]
+        content = {"custom_hook": "Data Platforms at Scale", "portfolio_url": "https://example.com/me"}
+        with patch.object(visual_factory, "_render_workers", 4):
+            images = vf.render_banner_variants(keys, **content)
+            pngs = vf.render_banner_variants(keys[:2], as_bytes=True, **content)
+        self.assertEqual([img.size for img in images], [VisualFactory.BANNER_SIZE] * 4)
+        tmp = tempfile.mkdtemp()
+        try:
+            for key, img in zip(keys, images):
+                path = os.path.join(tmp, f"{key}.png")
+                vf.generate_banner_with_template(key, output_path=path, **content)
+                self.assertIsNone(ImageChops.difference(Image.open(path).convert("RGB"), img).getbbox(), key)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.assertIsNone(ImageChops.difference(Image.open(io.BytesIO(pngs[0])).convert("RGB"), images[0]).getbbox())
+
+    def test_photo_from_memory_matches_photo_file(self):
+        vf = VisualFactory(BackgroundLayerCache())
+        buffer = io.BytesIO()
+        Image.new("RGB", (64, 48), (200, 120, 40)).save(buffer, format="PNG")
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "photo.png")
+            with open(path, "wb") as f:
+                f.write(buffer.getvalue())
+            from_file = vf.render_banner_variants(["tech_innovator"], profile_photo_path=path)[0]
+            from_memory = vf.render_banner_variants(["tech_innovator"], profile_photo_path=io.BytesIO(buffer.getvalue()))[0]
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.assertIsNone(ImageChops.difference(from_file, from_memory).getbbox())
+        self.assertIsNotNone(ImageChops.difference(from_file, vf.render_banner_variants(["tech_innovator"])[0]).getbbox())
+
+
+if __name__ == '__main__':
+    unittest.main()
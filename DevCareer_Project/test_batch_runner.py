@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import threading
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.batch_runner import TokenBucket, run_batch, is_retryable_error
+
+
+class ResourceExhausted(Exception):
+    pass
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    def test_results_keep_input_order(self):
+        def call(prompt):
+            time.sleep(0.05 if prompt == "slow" else 0)
+            return prompt.upper()
+        results = run_batch(call, ["slow", "a", "b"], max_concurrency=3)
+        self.assertEqual([r["text"] for r in results], ["SLOW", "A", "B"])
+        self.assertEqual([r["index"] for r in results], [0, 1, 2])
+
+    def test_retryable_errors_are_retried(self):
+        attempts = {"n": 0}
+
+        def flaky(prompt):
+            attempts["n"] += 1
+            if attempts["n"] < 3:
+                raise ResourceExhausted("429 Resource has been exhausted")
+            return "done"
+        (result,) = run_batch(flaky, ["p"], max_retries=4, base_delay=0.01)
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["attempts"], 3)
+
+    def test_non_retryable_errors_fail_fast(self):
+        def broken(prompt):
+            raise ValueError("API key not valid")
+        (result,) = run_batch(broken, ["p"], max_retries=4, base_delay=0.01)
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["attempts"], 1)
+        self.assertFalse(is_retryable_error(ValueError("API key not valid")))
+
+    def test_max_concurrency_is_respected(self):
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def call(prompt):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            return prompt
+        run_batch(call, [str(i) for i in range(8)], max_concurrency=2)
+        self.assertEqual(active["peak"], 2)
+
+    def test_token_bucket_throttles_after_burst(self):
+        bucket = TokenBucket(rate_per_minute=600, capacity=2)  # 10 tokens/s
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire(1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+
+class TestEngineBatchGenerate(unittest.TestCase):
+
+    def setUp(self):
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=False)
+        self.engine.model = MagicMock()
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_per_item_status(self):
+        def generate(prompt):
+            if prompt == "bad":
+                raise ValueError("blocked")
+            response = MagicMock()
+            response.text = f"answer to {prompt}"
+            return response
+        self.engine.model.generate_content.side_effect = generate
+        results = self.engine.batch_generate(["one", "bad", "two"], max_concurrency=2, rpm=600)
+        self.assertEqual([r["status"] for r in results], ["ok", "error", "ok"])
+        self.assertEqual(results[2]["text"], "answer to two")
+
+
+if __name__ == '__main__':
+    unittest.main()
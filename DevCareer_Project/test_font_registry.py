@@ -0,0 +1,95 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import ImageFont
+
+from core_engine.font_registry import FontRegistry, fontconfig_dirs
+from core_engine.llm_metrics import METRICS
+from core_engine.visual_factory import VisualFactory
+
+DEJAVU_DIR = "/usr/share/fonts/truetype/dejavu"
+
+
+class TestFontRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_fontconfig_dirs(self):
+        conf = os.path.join(self.tmp, "fonts.conf")
+        with open(conf, "w") as f:
+            f.write('<fontconfig>\n\t<dir>/opt/fonts</dir>\n\t<dir prefix="xdg">fonts</dir>\n</fontconfig>\n')
+        os.environ["XDG_DATA_HOME"] = "/data"
+        try:
+            self.assertEqual(fontconfig_dirs([conf, os.path.join(self.tmp, "missing.conf")]),
+                             ["/opt/fonts", os.path.join("/data", "fonts")])
+        finally:
+            del os.environ["XDG_DATA_HOME"]
+
+    @unittest.skipUnless(os.path.isdir(DEJAVU_DIR), "DejaVu fonts not installed")
+    def test_discovers_linux_fonts_and_shares_them(self):
+        nested = os.path.join(self.tmp, "truetype", "dejavu")
+        os.makedirs(nested)
+        for name in ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"):
+            shutil.copy(os.path.join(DEJAVU_DIR, name), nested)
+        registry = FontRegistry(font_dirs=[self.tmp])
+        self.assertTrue(registry.has_truetype)
+        self.assertEqual(registry.paths()["bold"], os.path.join(nested, "DejaVuSans-Bold.ttf"))
+
+        font = registry.get(48, bold=True)
+        self.assertIsInstance(font, ImageFont.FreeTypeFont)
+        self.assertEqual(font.size, 48)
+        first, second = VisualFactory(font_registry=registry), VisualFactory(font_registry=registry)
+        self.assertIs(first._get_font(48, bold=True), font)
+        self.assertIs(second._get_font(48, bold=True), font)
+        self.assertTrue(first.has_custom_fonts)
+
+    def test_missing_fonts_fall_back_to_scalable_default(self):
+        registry = FontRegistry(font_dirs=[self.tmp])
+        self.assertFalse(registry.has_truetype)
+        self.assertEqual(registry.get(40).size, 40)
+        self.assertEqual(registry.get_stats()["fallbacks"], 1)
+
+    def test_concurrent_first_use_loads_once(self):
+        registry = FontRegistry(font_dirs=[DEJAVU_DIR])
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(registry.get(28))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(font) for font in results}), 1)
+        self.assertEqual(registry.get_stats()["loads"], 1)
+
+    def test_preload_reports_load_time(self):
+        METRICS.reset()
+        registry = FontRegistry(font_dirs=[DEJAVU_DIR])
+        registry.preload({"regular": (20, 28), "bold": (48,)})
+        stats = registry.get_stats()
+        self.assertEqual((stats["loads"], stats["fonts"]), (3, 3))
+        snapshot = METRICS.snapshot()
+        self.assertEqual(snapshot["preload"]["devcareer_font_load_seconds"]["count"], 1)
+        self.assertEqual(snapshot["discover"]["devcareer_font_load_seconds"]["count"], 1)
+        self.assertIn("devcareer_font_load_seconds", METRICS.to_prometheus())
+        registry.get(28)
+        self.assertEqual(registry.get_stats()["hits"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import json
+import subprocess
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+HEAVY_MODULES = ["google.generativeai", "pypdf", "docx", "PIL", "qrcode", "fpdf", "bs4", "numpy"]
+
+# Generous enough for a cold CI box; eager imports of genai/PIL/docx alone blew well past it
+IMPORT_BUDGET_SECONDS = 2.0
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import core_engine.ai_logic
+import core_engine.async_engine
+import core_engine.visual_factory
+import file_factory.doc_builder
+import_seconds = time.perf_counter() - start
+
+from core_engine.ai_logic import IntelligenceEngine
+start = time.perf_counter()
+for _ in range(50):
+    IntelligenceEngine("fake_key", cache=False)
+construct_seconds = time.perf_counter() - start
+
+print(json.dumps({{
+    "import_seconds": import_seconds,
+    "construct_seconds": construct_seconds,
+    "loaded": [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+class TestImportBudget(unittest.TestCase):
+
+    def _probe(self):
+        code = PROBE.format(root=PROJECT_ROOT, heavy=HEAVY_MODULES)
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_engine_import_stays_light(self):
+        report = self._probe()
+        self.assertEqual(report["loaded"], [])
+        self.assertLess(report["import_seconds"], IMPORT_BUDGET_SECONDS)
+
+    def test_engine_construction_is_cheap(self):
+        # Construction must not configure the SDK or build a model; that happens on first call
+        report = self._probe()
+        self.assertLess(report["construct_seconds"], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import shutil
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.jd_corpus import JDCorpus
+from core_engine.keyword_scoring import KeywordScorer
+
+JDS = [
+    "Frontend Developer: React, TypeScript, CSS and Figma. Jest for unit testing.",
+    "Backend Engineer: Go, PostgreSQL, Kafka, Docker and Kubernetes on AWS. Terraform a plus.",
+    "Data Scientist: Python, Pandas, scikit-learn and SQL. Tableau dashboards.",
+    "Backend Engineer: Java, Spring Boot, MySQL and Redis. Docker.",
+    "",
+]
+RESUME = "Backend engineer. Go and Python services on Postgres and Kafka, deployed with Docker on Kubernetes (AWS)."
+
+
+class TestJDCorpus(unittest.TestCase):
+
+    def setUp(self):
+        self.corpus = JDCorpus.build(JDS, ids=["fe", "go", "ds", "java", "empty"])
+
+    def test_top_matches_ranked_with_skill_breakdown(self):
+        top = self.corpus.top_matches(RESUME, top_k=2)
+        self.assertEqual([m["id"] for m in top], ["go", "java"])
+        self.assertEqual(top[0]["missing_skills"], ["Terraform"])
+        self.assertEqual(set(top[0]["matching_skills"]), {"Go", "PostgreSQL", "Kafka", "Docker", "Kubernetes", "AWS"})
+        self.assertGreater(top[0]["match_score"], top[1]["match_score"])
+
+    def test_scores_match_single_pair_scorer_with_corpus_idf(self):
+        scorer = KeywordScorer.fit(JDS)
+        scores = self.corpus.scores(RESUME)
+        for i, jd in enumerate(JDS[:4]):
+            self.assertEqual(round(scores[i]), scorer.score(RESUME, jd)["match_score"])
+        self.assertEqual(scores[4], 0.0)
+
+    def test_top_k_larger_than_corpus_and_ties(self):
+        corpus = JDCorpus.build(["Go and Docker"] * 3)
+        self.assertEqual([m["index"] for m in corpus.top_matches(RESUME, top_k=10)], [0, 1, 2])
+        self.assertEqual(JDCorpus.build([]).top_matches(RESUME), [])
+
+    def test_save_and_memory_mapped_load(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            self.assertIsNone(JDCorpus.load(tmp))
+            self.corpus.save(tmp, stamp="v1")
+            loaded = JDCorpus.load(tmp)
+            self.assertEqual(loaded.stamp, "v1")
+            self.assertIsInstance(loaded.data.base, np.memmap)
+            self.assertEqual(loaded.top_matches(RESUME, top_k=2), self.corpus.top_matches(RESUME, top_k=2))
+            # Saving again replaces the arrays rather than accumulating them
+            loaded.save(tmp, stamp="v2")
+            self.assertEqual(len(os.listdir(tmp)), 6)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_save_keeps_files_of_a_writer_in_progress(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            self.corpus.save(tmp, stamp="v1")
+            # Another worker's arrays, written after the manifest this save replaces
+            in_progress = os.path.join(tmp, "jd_corpus-otherworker.data.npy")
+            with open(in_progress, "wb") as f:
+                f.write(b"partial")
+            manifest_mtime = os.stat(os.path.join(tmp, "jd_corpus.json")).st_mtime
+            os.utime(in_progress, (manifest_mtime + 5, manifest_mtime + 5))
+            self.corpus.save(tmp, stamp="v2")
+            self.assertTrue(os.path.exists(in_progress))
+            self.assertEqual(JDCorpus.load(tmp).stamp, "v2")
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_rows_map_ids(self):
+        self.assertEqual(self.corpus.rows["java"], 3)
+        self.assertEqual(self.corpus.ids[self.corpus.rows["go"]], "go")
+
+    def test_single_match_equals_top_matches_entry(self):
+        best = self.corpus.top_matches(RESUME, top_k=1)[0]
+        self.assertEqual(self.corpus.match(RESUME, best["index"]), best)
+
+    def test_engine_batch_api(self):
+        with patch.object(ai_logic, "genai", MagicMock()):
+            engine = IntelligenceEngine(api_key="fake", cache=False)
+            engine.model = MagicMock()
+            self.assertEqual(engine.match_keywords_batch(RESUME, self.corpus, top_k=1)[0]["id"], "go")
+            engine.model.generate_content.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
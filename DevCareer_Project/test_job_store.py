@@ -0,0 +1,168 @@
+import unittest
+import datetime
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import job_store
+from core_engine.job_store import JobStore, normalize_job, content_hash, iter_feed, job_matrix, parse_job_date
+
+NAUKRI = [
+    {"jobTitle": "Lead Java Developer", "companyName": "Flipkart", "location": ["Bengaluru", "India"],
+     "jobDescription": "<p>Java &amp; Spring experts for order processing.</p>", "postedDate": "2025-11-22"},
+    {"jobTitle": "SDE-II (Backend)", "companyName": "Swiggy", "location": "India",
+     "jobDescription": "Go and Python logistics services.", "postedDate": "Nov 20, 2025"},
+    {"jobTitle": "", "companyName": "No title"},
+]
+MONSTER_CSV = (
+    "Title,Company,Location,Description,Date Posted\n"
+    "Senior Python Developer,Automattic,Remote,\"Python backend systems, WordPress.\",2025-11-23\n"
+    "Data Scientist,Ola Electric,India,Python and Pandas for telemetry.,2025-11-18\n"
+)
+
+
+class TestJobStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.store = JobStore(os.path.join(self.tmp, "jobs.sqlite3"))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def write_jsonl(self, name, records, extra_lines=()):
+        path = os.path.join(self.tmp, name)
+        with gzip.open(path, "wt", encoding="utf-8") if name.endswith(".gz") else open(path, "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            for line in extra_lines:
+                f.write(line + "\n")
+        return path
+
+    def test_normalize_feed_record(self):
+        job = normalize_job(NAUKRI[0], source="Naukri.com")
+        self.assertEqual(job["title"], "Lead Java Developer")
+        self.assertEqual(job["location"], "Bengaluru, India")
+        self.assertEqual(job["desc"], "Java & Spring experts for order processing.")
+        self.assertEqual((job["source"], job["date"]), ("Naukri.com", "Nov 22, 2025"))
+        self.assertIsNone(normalize_job(NAUKRI[2]))
+        self.assertIsNone(normalize_job(None))
+
+    def test_parse_job_date(self):
+        self.assertEqual(parse_job_date("Nov 21, 2025"), datetime.date(2025, 11, 21))
+        self.assertEqual(parse_job_date("2025-11-21T10:00:00Z"), datetime.date(2025, 11, 21))
+        self.assertIsNone(parse_job_date("yesterday"))
+
+    def test_ingest_jsonl_and_csv_feeds(self):
+        stats = self.store.ingest_feed(self.write_jsonl("naukri.jsonl.gz", NAUKRI, ["{not json"]), source="Naukri.com")
+        self.assertEqual(stats, {"read": 4, "inserted": 2, "reposted": 0, "skipped": 2})
+        self.assertEqual(self.store.ingest_feed(self._csv(), source="Monster.com")["inserted"], 2)
+        self.assertEqual(len(self.store), 4)
+        self.assertTrue(self.store.has_jobs())
+        self.assertFalse(JobStore(":memory:").has_jobs())
+        self.assertEqual(self.store.facet_values("source"), ["Monster.com", "Naukri.com"])
+
+    def test_reposts_dedupe_and_refresh_date(self):
+        self.store.ingest(NAUKRI[:2], source="Naukri.com", batch_size=1)
+        repost = dict(NAUKRI[1], postedDate="2025-12-01")
+        stats = self.store.ingest([repost, dict(repost, source="Naukri Gulf")], source="Naukri.com")
+        self.assertEqual((stats["inserted"], stats["reposted"]), (0, 2))
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.search()["jobs"][0]["date"], "Dec 01, 2025")
+        self.assertEqual(content_hash(normalize_job(repost)), content_hash(normalize_job(NAUKRI[1])))
+
+    def test_search_ranking_facets_and_cursor(self):
+        self.store.ingest(NAUKRI, source="Naukri.com")
+        self.store.ingest(iter_feed(self._csv()), source="Monster.com")
+        result = self.store.search("python")
+        self.assertEqual(result["jobs"][0]["title"], "Senior Python Developer")
+        self.assertEqual(result["total"], 3)
+        self.assertEqual(result["facets"]["source"], {"Monster.com": 2, "Naukri.com": 1})
+
+        filtered = self.store.search("python", location="India")
+        self.assertEqual({job["title"] for job in filtered["jobs"]}, {"SDE-II (Backend)", "Data Scientist"})
+        self.assertEqual(filtered["facets"]["location"]["Remote"], 1)
+        self.assertEqual([job["title"] for job in self.store.search(date_to="2025-11-20")["jobs"]],
+                         ["SDE-II (Backend)", "Data Scientist"])
+
+        for query in ("", "python java"):
+            seen, cursor = [], None
+            while True:
+                page = self.store.search(query, limit=1, cursor=cursor)
+                seen.extend(job["id"] for job in page["jobs"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            self.assertEqual(seen, [job["id"] for job in self.store.search(query, limit=10)["jobs"]])
+            self.assertEqual(len(seen), page["total"])
+
+    def test_crosstab_cached_per_query_and_dates(self):
+        self.store.ingest(NAUKRI, source="Naukri.com")
+        statements = []
+        self.store._conn.set_trace_callback(statements.append)
+        first = self.store.search("python", limit=1)
+        self.store.search("python", location="India", limit=1, cursor=first["next_cursor"])
+        self.store.search("python", source="Monster.com", limit=1)
+        self.assertEqual(sum("GROUP BY" in sql for sql in statements), 1)
+
+        # A commit on this connection or on another one invalidates the cached counts
+        self.store.ingest(iter_feed(self._csv()), source="Monster.com")
+        self.assertEqual(self.store.search("python")["total"], 3)
+        other = JobStore(self.store.path)
+        other.ingest([{"title": "Python Engineer", "company": "Hooli", "location": "Remote", "date": "2025-11-24"}])
+        other.close()
+        self.assertEqual(self.store.search("python")["total"], 4)
+        self.assertEqual(sum("GROUP BY" in sql for sql in statements), 3)
+
+    def test_ranking_capped_to_newest_matches(self):
+        self.store.ingest(NAUKRI, source="Naukri.com")
+        self.store.ingest(iter_feed(self._csv()), source="Monster.com")
+        with patch.object(job_store, "RANK_CANDIDATES", 2):
+            result = self.store.search("python", limit=10)
+            self.assertEqual(result["total"], 3)
+            newest = [row[0] for row in self.store._conn.execute("SELECT id FROM jobs ORDER BY id DESC LIMIT 2")]
+            self.assertEqual({job["id"] for job in result["jobs"]}, set(newest))
+            page = self.store.search("python", limit=1)
+            self.assertEqual(self.store.search("python", limit=1, cursor=page["next_cursor"])["next_cursor"], None)
+
+    def test_incremental_update_keeps_fts_in_sync(self):
+        self.store.ingest(NAUKRI, source="Naukri.com")
+        self.assertEqual(self.store.search("telemetry")["total"], 0)
+        self.store.ingest(iter_feed(self._csv()), source="Monster.com")
+        self.assertEqual(self.store.search("telemetry")["jobs"][0]["company"], "Ola Electric")
+        # Raises sqlite3.DatabaseError if the FTS index drifted from the table
+        self.store._conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('integrity-check')")
+
+    def test_job_matrix_rebuilt_only_for_new_postings(self):
+        matrix_dir = os.path.join(self.tmp, "matrix")
+        self.store.ingest(NAUKRI, source="Naukri.com")
+        corpus = job_matrix(self.store, matrix_dir)
+        self.assertEqual(len(corpus), 2)
+        self.assertEqual(corpus.top_matches("Java and Spring developer", top_k=1)[0]["id"],
+                         self.store.search("java")["jobs"][0]["id"])
+
+        self.store.ingest([dict(NAUKRI[0], postedDate="2025-12-05")])  # repost: same matrix
+        self.assertEqual(job_matrix(self.store, matrix_dir).stamp, corpus.stamp)
+        self.store.ingest(iter_feed(self._csv()), source="Monster.com")
+        corpus = job_matrix(self.store, matrix_dir)
+        self.assertEqual(len(corpus), 4)
+        self.assertEqual([job["title"] for job in self.store.get_jobs(corpus.ids[-2:])],
+                         ["Senior Python Developer", "Data Scientist"])
+
+    def _csv(self):
+        path = os.path.join(self.tmp, "monster.csv")
+        with open(path, "w") as f:
+            f.write(MONSTER_CSV)
+        return path
+
+
+if __name__ == '__main__':
+    unittest.main()
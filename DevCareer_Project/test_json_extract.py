@@ -0,0 +1,49 @@
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine.json_extract import extract_json, find_json_spans, repair_json
+from core_engine.strategy_logic import StrategyLogic
+
+
+class TestJsonExtract(unittest.TestCase):
+
+    def test_prose_braces_do_not_hide_the_object(self):
+        text = 'Here is the kit for {your} profile:\n```json\n{"headline": "Go {Kafka}", "n": 2}\n```\nEdit any {section}.'
+        self.assertEqual(extract_json(text), {"headline": "Go {Kafka}", "n": 2})
+
+    def test_stray_opener_in_prose(self):
+        text = 'Note the { in my notes, don\'t worry. {"role": "SRE"}'
+        self.assertEqual(extract_json(text), {"role": "SRE"})
+
+    def test_repairs_single_quotes_trailing_commas_and_python_literals(self):
+        text = "Result: {'summary': 'don't stop', 'name': \"O'Brien\", 'skills': ['Go', 'AWS',], 'remote': True, 'visa': None,}"
+        self.assertEqual(extract_json(text), {
+            "summary": "don't stop", "name": "O'Brien", "skills": ["Go", "AWS"], "remote": True, "visa": None
+        })
+
+    def test_nested_single_quoted_object_returns_outer(self):
+        text = '{"a": {\'b\': 1}, "c": {"d": 2}}'
+        self.assertEqual(extract_json(text), {"a": {"b": 1}, "c": {"d": 2}})
+
+    def test_no_repair_mode_is_strict(self):
+        self.assertIsNone(extract_json("{'a': 1,}", repair=False))
+        self.assertIsNone(extract_json("no json here"))
+
+    def test_repair_json_keeps_double_quoted_content(self):
+        self.assertEqual(repair_json('{"t": "True, None,}"}'), '{"t": "True, None,}"}')
+
+    def test_spans_are_top_level_only(self):
+        text = 'x {"a": {"b": [1]}} y {"c": 1}'
+        self.assertEqual([text[s:e] for s, e in find_json_spans(text)], ['{"a": {"b": [1]}}', '{"c": 1}'])
+
+    def test_strategy_logic_accepts_arrays(self):
+        logic = StrategyLogic.__new__(StrategyLogic)
+        self.assertEqual(logic._clean_json_response("```json\n[{'a': 1},]\n```"), [{"a": 1}])
+
+
+if __name__ == '__main__':
+    unittest.main()
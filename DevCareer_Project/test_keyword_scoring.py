@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.keyword_scoring import KeywordScorer, extract_terms, score_keywords
+
+JD = """Senior Backend Engineer - Payments
+Requirements:
+- 5+ years of experience with Go or Java building microservices
+- Strong knowledge of PostgreSQL, Redis and Kafka
+- Experience with Kubernetes (k8s), Docker and AWS
+- CI/CD pipelines and Terraform; payment systems at scale
+- Payment systems experience is a plus
+"""
+
+RESUME = """Backend engineer. Built payment systems in Go and Python on Postgres and Kafka.
+Deployed with Docker on Kubernetes in AWS."""
+
+
+class TestKeywordScoring(unittest.TestCase):
+
+    def test_skill_phrases_and_aliases(self):
+        terms = extract_terms("Deployed to k8s with GitHub Actions; wrote Node.js and C++ services.")
+        for skill in ("Kubernetes", "GitHub Actions", "Node.js", "C++"):
+            self.assertEqual(terms[skill][0], "skill")
+        # Ambiguous short skills only count when capitalized
+        self.assertIn("Go", extract_terms("Services written in Go"))
+        self.assertNotIn("Go", extract_terms("ready to go live"))
+
+    def test_matched_and_missing(self):
+        result = score_keywords(RESUME, JD)
+        for skill in ("Go", "PostgreSQL", "Kafka", "Kubernetes", "Docker", "AWS"):
+            self.assertIn(skill, result["matching_keywords"])
+        for skill in ("Java", "Redis", "Terraform", "CI/CD", "Microservices"):
+            self.assertIn(skill, result["missing_keywords"])
+        self.assertIn("payment systems", result["matching_keywords"])
+        # Skills are listed before plain terms
+        kinds = [extract_terms(JD)[k][0] == "skill" for k in result["missing_keywords"]]
+        self.assertEqual(kinds, sorted(kinds, reverse=True))
+        self.assertTrue(0 < result["match_score"] < 100)
+
+    def test_deterministic_and_bounded(self):
+        self.assertEqual(score_keywords(RESUME, JD), score_keywords(RESUME, JD))
+        self.assertEqual(score_keywords(JD, JD)["match_score"], 100)
+        self.assertEqual(score_keywords("", JD)["match_score"], 0)
+        self.assertEqual(score_keywords(RESUME, ""), {"match_score": 0, "missing_keywords": [], "matching_keywords": []})
+
+    def test_idf_downweights_common_terms(self):
+        corpus = [JD] + [f"Backend engineer job {i} with Docker" for i in range(20)]
+        scorer = KeywordScorer.fit(corpus)
+        terms, _, weights = scorer.jd_terms(JD)
+        weight = dict(zip(terms, weights))
+        self.assertLess(weight["Docker"], weight["Terraform"])
+
+    def test_under_10ms(self):
+        resume, jd = RESUME * 20, JD * 5
+        start = time.perf_counter()
+        for i in range(20):
+            extract_terms.cache_clear()
+            score_keywords(resume, jd + str(i))
+        self.assertLess((time.perf_counter() - start) / 20, 0.01)
+
+
+class TestEngineScoring(unittest.TestCase):
+
+    def setUp(self):
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine(api_key="fake", cache=False)
+        self.engine.model = MagicMock()
+        self.engine.model.generate_content.return_value.text = "**ATS Score:** 50/100"
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_match_keywords_is_local(self):
+        self.assertEqual(self.engine.match_keywords(RESUME, JD), score_keywords(RESUME, JD))
+        self.engine.model.generate_content.assert_not_called()
+
+    def test_ats_advice_is_given_the_local_score(self):
+        self.engine.check_ats_score(RESUME, JD, "India")
+        prompt = self.engine.model.generate_content.call_args[0][0]
+        self.assertIn(f"**ATS Score:** {score_keywords(RESUME, JD)['match_score']}/100", prompt)
+        self.assertIn("do not re-score", prompt)
+
+
+if __name__ == '__main__':
+    unittest.main()
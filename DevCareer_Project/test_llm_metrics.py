@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_metrics import METRICS, MetricsRegistry
+from core_engine.response_cache import ResponseCache
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_prometheus_histogram_is_cumulative(self):
+        registry = MetricsRegistry()
+        for value in (0.02, 0.3, 3.0):
+            registry.observe("devcareer_llm_method_seconds", "check_ats_score", value)
+        registry.inc("devcareer_llm_cache_hits_total", "check_ats_score", 2)
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE devcareer_llm_method_seconds histogram', text)
+        self.assertIn('devcareer_llm_method_seconds_bucket{method="check_ats_score",le="0.5"} 2', text)
+        self.assertIn('devcareer_llm_method_seconds_bucket{method="check_ats_score",le="+Inf"} 3', text)
+        self.assertIn('devcareer_llm_method_seconds_count{method="check_ats_score"} 3', text)
+        self.assertIn('devcareer_llm_cache_hits_total{method="check_ats_score"} 2', text)
+
+    def test_snapshot_reports_quantile_bounds(self):
+        registry = MetricsRegistry()
+        for _ in range(19):
+            registry.observe("devcareer_llm_ttfb_seconds", "rewrite_resume", 0.2)
+        registry.observe("devcareer_llm_ttfb_seconds", "rewrite_resume", 8.0)
+        summary = registry.snapshot()["rewrite_resume"]["devcareer_llm_ttfb_seconds"]
+        self.assertEqual(summary["count"], 20)
+        self.assertEqual(summary["p50_le"], 0.25)
+        self.assertEqual(summary["p95_le"], 0.25)
+
+
+class TestEngineInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        METRICS.reset()
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=ResponseCache())
+        self.engine.model = MagicMock()
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_method_tokens_and_cache(self):
+        response = MagicMock()
+        response.text = '{"match_score": 80, "missing_keywords": ["Kafka"], "matching_keywords": ["Go"]}'
+        response.usage_metadata.prompt_token_count = 1200
+        response.usage_metadata.candidates_token_count = 80
+        self.engine.model.generate_content.return_value = response
+
+        self.engine.match_keywords("resume", "jd", use_llm=True)
+        self.engine.match_keywords("resume", "jd", use_llm=True)
+
+        stats = METRICS.snapshot()["match_keywords"]
+        self.assertEqual(stats["devcareer_llm_method_seconds"]["count"], 2)
+        self.assertEqual(stats["devcareer_llm_calls_total"], 1)
+        self.assertEqual(stats["devcareer_llm_cache_misses_total"], 1)
+        self.assertEqual(stats["devcareer_llm_cache_hits_total"], 1)
+        self.assertEqual(stats["devcareer_llm_prompt_tokens"]["sum"], 1200)
+        self.assertEqual(stats["devcareer_llm_output_tokens"]["sum"], 80)
+
+    def test_parse_failures_are_counted(self):
+        response = MagicMock()
+        response.text = "not json at all"
+        self.engine.model.generate_content.return_value = response
+
+        self.engine.extract_banner_content("profile", "SRE")
+        self.engine.extract_banner_content("profile", "SRE")
+
+        stats = METRICS.snapshot()["extract_banner_content"]
+        self.assertEqual(stats["devcareer_llm_parse_failures_total"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
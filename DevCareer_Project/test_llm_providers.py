@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import MagicMock
+import os
+import sys
+import time
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_providers import (
+    FixtureStore, RecordingProvider, ReplayProvider, FixtureMissingError
+)
+from core_engine.strategy_logic import StrategyLogic
+
+
+class _FakeLiveProvider:
+    """
+    Plays the live API for the recorder.
+    """
+    available = True
+
+    def create_model(self, model_name):
+        model = MagicMock()
+
+        def _respond(prompt, **kwargs):
+            if kwargs.get("stream"):
+                return iter([MagicMock(text="Dear ", usage_metadata=None), MagicMock(text="Hiring Manager")])
+            response = MagicMock()
+            response.text = f"live answer to: {prompt[:20]}"
+            response.usage_metadata.prompt_token_count = 120
+            response.usage_metadata.candidates_token_count = 30
+            return response
+        model.generate_content.side_effect = _respond
+        return model
+
+
+class TestRecordReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _record(self):
+        recorder = IntelligenceEngine("fake_key", cache=False,
+                                      provider=RecordingProvider(FixtureStore(self.tmp.name), inner=_FakeLiveProvider()))
+        live_bullets = recorder.generate_bullets("SRE", "Acme", "kept things up")
+        live_letter = "".join(recorder.generate_cover_letter("resume", "jd", stream=True))
+        return live_bullets, live_letter
+
+    def test_replay_serves_recorded_responses_offline(self):
+        live_bullets, live_letter = self._record()
+        self.assertEqual(len(FixtureStore(self.tmp.name)), 2)
+
+        replay = IntelligenceEngine("fake_key", cache=False, provider=ReplayProvider(FixtureStore(self.tmp.name)))
+        self.assertEqual(replay.generate_bullets("SRE", "Acme", "kept things up"), live_bullets)
+        chunks = list(replay.generate_cover_letter("resume", "jd", stream=True))
+        self.assertEqual(chunks, ["Dear ", "Hiring Manager"])
+        self.assertEqual("".join(chunks), live_letter)
+
+    def test_synthetic_latency_and_errors(self):
+        self._record()
+        store = FixtureStore(self.tmp.name)
+        slow = IntelligenceEngine("fake_key", cache=False, provider=ReplayProvider(store, latency_s=0.05))
+        start = time.perf_counter()
+        slow.generate_bullets("SRE", "Acme", "kept things up")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+        failing = IntelligenceEngine("fake_key", cache=False, provider=ReplayProvider(store, error_rate=1.0))
+        self.assertTrue(failing.generate_bullets("SRE", "Acme", "kept things up").startswith("Error generating content"))
+
+    def test_missing_fixture_raises_or_uses_fallback(self):
+        model = ReplayProvider(FixtureStore(self.tmp.name)).create_model("m")
+        with self.assertRaises(FixtureMissingError):
+            model.generate_content("never recorded")
+
+        fallback = ReplayProvider(FixtureStore(self.tmp.name), fallback=lambda prompt, config: "{}")
+        self.assertEqual(fallback.create_model("m").generate_content("never recorded").text, "{}")
+
+    def test_strategy_logic_uses_provider(self):
+        provider = ReplayProvider(FixtureStore(self.tmp.name), fallback=lambda prompt, config: '{"score": 90}')
+        logic = StrategyLogic(provider=provider)
+        self.assertEqual(logic.western_compatibility_score("repo summary"), {"score": 90})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import json
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_metrics import METRICS
+from core_engine.output_schemas import KEYWORD_MATCH_SCHEMA, RESUME_SCHEMA, validate
+from core_engine.response_cache import ResponseCache
+
+
+def _response(payload):
+    response = MagicMock()
+    response.text = payload if isinstance(payload, str) else json.dumps(payload)
+    return response
+
+
+class TestValidate(unittest.TestCase):
+
+    def test_coerces_types_and_fills_nested_gaps(self):
+        data, failing = validate(
+            {"match_score": "85/100", "missing_keywords": "Kafka, Terraform", "matching_keywords": ["Go"]},
+            KEYWORD_MATCH_SCHEMA
+        )
+        self.assertEqual(failing, [])
+        self.assertEqual(data["match_score"], 85)
+        self.assertEqual(data["missing_keywords"], ["Kafka", "Terraform"])
+
+        data, failing = validate({"contact": {"name": "Jane"}, "experience": [{"title": "SRE"}, "junk"]}, RESUME_SCHEMA)
+        self.assertEqual(data["contact"]["email"], "")
+        self.assertEqual(data["experience"], [{"title": "SRE", "company": "", "dates": "", "location": "", "description": ""}])
+        self.assertEqual(failing, ["summary", "projects", "education", "skills", "certifications", "languages"])
+
+    def test_non_object_fails_every_field(self):
+        data, failing = validate(None, KEYWORD_MATCH_SCHEMA)
+        self.assertEqual(failing, ["match_score", "missing_keywords", "matching_keywords"])
+        self.assertEqual(data["missing_keywords"], [])
+
+
+class TestStructuredEngineCalls(unittest.TestCase):
+
+    def setUp(self):
+        METRICS.reset()
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=ResponseCache())
+        self.engine.model = MagicMock()
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_requests_json_mode_with_schema(self):
+        self.engine.model.generate_content.return_value = _response(
+            {"match_score": 72, "missing_keywords": ["Kafka"], "matching_keywords": ["Go"]}
+        )
+        result = self.engine.match_keywords("resume", "jd", use_llm=True)
+        self.assertEqual(result["match_score"], 72)
+        config = self.engine.model.generate_content.call_args.kwargs["generation_config"]
+        self.assertEqual(config["response_mime_type"], "application/json")
+        self.assertEqual(config["response_schema"], KEYWORD_MATCH_SCHEMA)
+
+        # Validated results are cached
+        self.engine.match_keywords("resume", "jd", use_llm=True)
+        self.assertEqual(self.engine.model.generate_content.call_count, 1)
+
+    def test_reasks_only_failing_fields(self):
+        self.engine.model.generate_content.side_effect = [
+            _response({"match_score": "n/a", "missing_keywords": ["Kafka"], "matching_keywords": ["Go"]}),
+            _response({"match_score": 64})
+        ]
+        result = self.engine.match_keywords("resume", "jd", use_llm=True)
+        self.assertEqual(result, {"match_score": 64, "missing_keywords": ["Kafka"], "matching_keywords": ["Go"]})
+
+        repair_prompt = self.engine.model.generate_content.call_args_list[1][0][0]
+        repair_schema = self.engine.model.generate_content.call_args_list[1].kwargs["generation_config"]["response_schema"]
+        self.assertIn("match_score", repair_prompt)
+        self.assertEqual(list(repair_schema["properties"]), ["match_score"])
+        self.assertEqual(METRICS.snapshot()["match_keywords"]["devcareer_llm_schema_repairs_total"], 1)
+
+    def test_unusable_response_returns_none_and_is_not_cached(self):
+        self.engine.model.generate_content.return_value = _response("I cannot help with that.")
+        self.assertIsNone(self.engine.match_keywords("resume", "jd", use_llm=True))
+        self.assertIsNone(self.engine.match_keywords("resume", "jd", use_llm=True))
+        self.assertEqual(self.engine.model.generate_content.call_count, 4)
+
+    def test_role_and_stack_keeps_regex_linkedin_fallback(self):
+        self.engine.model.generate_content.return_value = _response(
+            {"role": "SRE", "stack": "Go", "linkedin_url": "", "location": "Pune, India", "industry": "Technology"}
+        )
+        result = self.engine.extract_role_and_stack("Jane Doe linkedin.com/in/jane-doe")
+        self.assertEqual(result["role"], "SRE")
+        self.assertEqual(result["linkedin_url"], "linkedin.com/in/jane-doe")
+
+
+class TestResumeUnderstanding(unittest.TestCase):
+
+    def setUp(self):
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.cache = ResponseCache()
+        self.engine = IntelligenceEngine("fake_key", cache=self.cache)
+        self.engine.model = MagicMock()
+        self.engine.model.generate_content.return_value = _response({
+            "role": "SRE", "stack": "Go, Kafka", "linkedin_url": "", "location": "Pune, India",
+            "industry": "Technology", "custom_hook": "Keeping Payments Online",
+            "custom_tagline": "99.99% uptime for 20M users with Go & Kafka",
+            "resume": {"contact": {"name": "Jane Doe"}, "summary": "SRE", "experience": [], "projects": [],
+                       "education": [], "skills": "Go, Kafka", "certifications": "", "languages": "English"}
+        })
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_one_call_per_file_across_tabs(self):
+        file_bytes = b"%PDF-1.4 resume bytes"
+        first = self.engine.understand_resume("Jane Doe linkedin.com/in/jane", file_bytes)
+        again = self.engine.understand_resume("Jane Doe linkedin.com/in/jane", file_bytes)
+        self.assertEqual(first["role"], "SRE")
+        self.assertEqual(first["linkedin_url"], "linkedin.com/in/jane")
+        self.assertEqual(first["resume"]["contact"]["name"], "Jane Doe")
+        self.assertEqual(again, first)
+        # Each caller gets its own copy: edits in one session never reach the next
+        first["resume"]["summary"] = "EDITED BY USER"
+        self.assertEqual(self.engine.understand_resume("Jane Doe linkedin.com/in/jane", file_bytes)["resume"]["summary"], "SRE")
+
+        # A fresh engine sharing the cache (another session) reuses the stored result too
+        other = IntelligenceEngine("fake_key", cache=self.cache)
+        other.model = MagicMock()
+        self.assertEqual(other.understand_resume("re-extracted text", file_bytes)["custom_hook"], "Keeping Payments Online")
+        other.model.generate_content.assert_not_called()
+        self.assertEqual(self.engine.model.generate_content.call_count, 1)
+
+    def test_cached_lookup_never_calls_the_model(self):
+        file_bytes = b"%PDF-1.4 resume bytes"
+        self.assertIsNone(self.engine.cached_resume_understanding("Jane Doe", file_bytes))
+        self.engine.model.generate_content.assert_not_called()
+        self.engine.understand_resume("Jane Doe", file_bytes)
+        cached = self.engine.cached_resume_understanding("text re-extracted elsewhere", file_bytes)
+        self.assertEqual(cached["resume"]["contact"]["name"], "Jane Doe")
+        self.assertEqual(self.engine.model.generate_content.call_count, 1)
+
+    def test_failed_call_falls_back_to_regex_and_is_not_stored(self):
+        self.engine.model.generate_content.return_value = _response("I cannot help with that.")
+        result = self.engine.understand_resume("Jane Doe linkedin.com/in/jane-doe", b"other file")
+        self.assertEqual(result["linkedin_url"], "linkedin.com/in/jane-doe")
+        self.assertEqual(result["industry"], "Technology")
+        self.assertNotIn("resume", result)
+        calls = self.engine.model.generate_content.call_count
+        self.engine.understand_resume("Jane Doe linkedin.com/in/jane-doe", b"other file")
+        self.assertGreater(self.engine.model.generate_content.call_count, calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import io
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fpdf import FPDF
+from core_engine import pdf_extract
+from core_engine.pdf_extract import iter_pdf_pages, extract_pdf_text
+from core_engine.response_cache import ResponseCache
+
+
+def _make_pdf(pages, filler=0):
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=10)
+    for i in range(pages):
+        pdf.add_page()
+        pdf.multi_cell(0, 5, f"Page marker {i}. " + "word " * filler)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+class TestPdfExtract(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_memory_items=256, ttl_seconds=None)
+
+    def test_pages_in_order_with_page_cutoff(self):
+        pages = list(iter_pdf_pages(_make_pdf(6), max_pages=4, max_chars=None, page_cache=self.cache))
+        self.assertEqual(len(pages), 4)
+        for i, text in enumerate(pages):
+            self.assertIn(f"Page marker {i}", text)
+
+    def test_char_cutoff_stops_early(self):
+        pdf_bytes = _make_pdf(10, filler=100)
+        pages = list(iter_pdf_pages(pdf_bytes, max_pages=None, max_chars=1000, page_cache=self.cache))
+        self.assertLess(len(pages), 10)
+        self.assertGreaterEqual(sum(len(p) for p in pages), 1000)
+
+    def test_page_cache_keyed_by_hash_and_index(self):
+        pdf_bytes = _make_pdf(3)
+        first = extract_pdf_text(pdf_bytes, max_pages=None, max_chars=None)
+        list(iter_pdf_pages(pdf_bytes, max_pages=None, max_chars=None, page_cache=self.cache))
+        # Second pass must be served entirely from the cache
+        reader = MagicMock()
+        reader.pages = [MagicMock()] * 3
+        with patch.object(pdf_extract, "PdfReader", return_value=reader):
+            again = list(iter_pdf_pages(pdf_bytes, max_pages=None, max_chars=None, page_cache=self.cache))
+        reader.pages[0].extract_text.assert_not_called()
+        self.assertEqual("".join(p + "\n" for p in again), first)
+        self.assertEqual(self.cache.get_stats()["memory_hits"], 3)
+
+    def test_accepts_path_and_file_like(self):
+        pdf_bytes = _make_pdf(2)
+        expected = extract_pdf_text(pdf_bytes)
+        self.assertEqual(extract_pdf_text(io.BytesIO(pdf_bytes)), expected)
+
+    def test_parallel_matches_serial(self):
+        pdf_bytes = _make_pdf(24)
+        serial = list(iter_pdf_pages(pdf_bytes, max_pages=None, max_chars=None,
+                                     parallel=False, page_cache=None))
+        parallel = list(iter_pdf_pages(pdf_bytes, max_pages=None, max_chars=None,
+                                       parallel=True, page_cache=None))
+        self.assertEqual(parallel, serial)
+        self.assertEqual(len(parallel), 24)
+
+    def test_parse_pdf_uses_budget(self):
+        from core_engine.ai_logic import IntelligenceEngine
+        engine = IntelligenceEngine(api_key="fake")
+        text = engine.parse_pdf(io.BytesIO(_make_pdf(5)), max_pages=2)
+        self.assertIn("Page marker 1", text)
+        self.assertNotIn("Page marker 2", text)
+        self.assertTrue(engine.parse_pdf(b"not a pdf").startswith("Error reading PDF:"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import qrcode
+
+from core_engine.qr_cache import QRCache, render_qr, QUIET_ZONE
+from core_engine.visual_factory import VisualFactory
+
+URL = "https://github.com/janedoe/portfolio"
+
+
+class TestQRCache(unittest.TestCase):
+
+    def test_renders_whole_modules_at_target_size(self):
+        matrix = qrcode.QRCode(border=0)
+        matrix.add_data(URL)
+        matrix.make(fit=True)
+        modules = matrix.get_matrix()
+        for size in (180, 250):
+            image = render_qr(URL, size, fill=(10, 25, 47))
+            self.assertEqual((image.size, image.mode), ((size, size), "RGB"))
+            box = size // (len(modules) + 2 * QUIET_ZONE)
+            offset = (size - box * len(modules)) // 2
+            # Every pixel of every module is the flat fill or background color: nothing was resampled
+            self.assertEqual({color for _, color in image.getcolors()}, {(10, 25, 47), (255, 255, 255)})
+            for row in range(len(modules)):
+                for col in range(len(modules)):
+                    for dx, dy in ((0, 0), (box - 1, box - 1)):
+                        pixel = image.getpixel((offset + col * box + dx, offset + row * box + dy))
+                        self.assertEqual(pixel == (10, 25, 47), modules[row][col])
+            self.assertEqual(image.getpixel((offset - 1, offset - 1)), (255, 255, 255))
+
+    def test_cache_key_covers_size_level_and_colors(self):
+        cache = QRCache(max_items=3)
+        first = cache.get(URL, 180)
+        self.assertIs(cache.get(URL, 180, "M", [0, 0, 0], (255, 255, 255)), first)
+        self.assertIsNot(cache.get(URL, 250), first)
+        self.assertIsNot(cache.get(URL, 180, error_correction="H"), first)
+        self.assertIsNot(cache.get(URL, 180, fill=(0, 0, 255)), first)
+        self.assertEqual(cache.get_stats(), {"hits": 1, "renders": 4, "memory_items": 3})
+
+    def test_banner_variants_build_qr_once(self):
+        cache = QRCache()
+        vf = VisualFactory(qr_cache=cache)
+        keys = list(VisualFactory.BANNER_TEMPLATES)[:4]
+        images = vf.render_banner_variants(keys, portfolio_url=URL)
+        self.assertEqual(len(images), 4)
+        self.assertEqual(cache.get_stats()["renders"], 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            vf.generate_linkedin_banner("Jane Doe", "Backend Engineer", URL, output_path=os.path.join(tmp, "banner.png"))
+        self.assertEqual(cache.get_stats()["renders"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
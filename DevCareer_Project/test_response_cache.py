@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine.response_cache import ResponseCache, make_cache_key
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_key_depends_on_model_settings_prompt_and_image(self):
+        base = make_cache_key("m1", {"temperature": 0.2}, "prompt")
+        self.assertEqual(base, make_cache_key("m1", {"temperature": 0.2}, "prompt"))
+        self.assertNotEqual(base, make_cache_key("m2", {"temperature": 0.2}, "prompt"))
+        self.assertNotEqual(base, make_cache_key("m1", {"temperature": 0.9}, "prompt"))
+        self.assertNotEqual(base, make_cache_key("m1", {"temperature": 0.2}, "prompt!"))
+        self.assertNotEqual(base, make_cache_key("m1", {"temperature": 0.2}, "prompt", b"\x89PNG"))
+
+    def test_memory_lru_eviction(self):
+        cache = ResponseCache(max_memory_items=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+        self.assertEqual(cache.get("c"), "3")
+
+    def test_disk_tier_survives_new_instance(self):
+        ResponseCache(disk_path=self.db_path).set("k", "value")
+        cache = ResponseCache(disk_path=self.db_path)
+        self.assertEqual(cache.get("k"), "value")
+        self.assertEqual(cache.get_stats()["disk_hits"], 1)
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(disk_path=self.db_path, ttl_seconds=10)
+        with patch("core_engine.response_cache.time.time", return_value=1000.0):
+            cache.set("k", "value")
+        with patch("core_engine.response_cache.time.time", return_value=1011.0):
+            self.assertIsNone(cache.get("k"))
+
+    def test_disk_size_eviction(self):
+        cache = ResponseCache(disk_path=self.db_path, max_memory_items=1, max_disk_items=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), "c")
+
+
+class TestEngineCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=ResponseCache())
+        self.engine.model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = "Cover letter body"
+        self.engine.model.generate_content.return_value = mock_response
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_repeated_call_is_served_from_cache(self):
+        first = self.engine.generate_cover_letter("Resume", "JD")
+        second = self.engine.generate_cover_letter("Resume", "JD")
+        self.assertEqual(first, second)
+        self.assertEqual(self.engine.model.generate_content.call_count, 1)
+        stats = self.engine.cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_opted_out_method_bypasses_cache(self):
+        self.engine.improve_content("Did things")
+        self.engine.improve_content("Did things")
+        self.assertEqual(self.engine.model.generate_content.call_count, 2)
+
+    def test_stream_yields_chunks_and_fills_cache(self):
+        chunks = []
+        for text in ("Dear ", "Hiring ", "Manager"):
+            chunk = MagicMock()
+            chunk.text = text
+            chunks.append(chunk)
+        self.engine.model.generate_content.return_value = iter(chunks)
+
+        streamed = list(self.engine.generate_cover_letter("Resume", "JD", stream=True))
+        self.assertEqual(streamed, ["Dear ", "Hiring ", "Manager"])
+        timings = self.engine.last_call_timings
+        self.assertEqual(timings["method"], "generate_cover_letter")
+        self.assertTrue(timings["streamed"])
+        self.assertLessEqual(timings["ttft_s"], timings["total_s"])
+
+        # The collected answer is cached for both streaming and non-streaming callers
+        self.assertEqual(self.engine.generate_cover_letter("Resume", "JD"), "Dear Hiring Manager")
+        self.assertEqual(self.engine.model.generate_content.call_count, 1)
+
+    def test_errors_are_not_cached(self):
+        self.engine.model.generate_content.side_effect = RuntimeError("429 quota")
+        result = self.engine.generate_cover_letter("Resume", "JD")
+        self.assertTrue(result.startswith("Error generating content"))
+        self.assertEqual(self.engine.cache_stats()["writes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
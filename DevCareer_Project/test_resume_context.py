@@ -0,0 +1,119 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.resume_context import build_resume_digest, ResumeContext
+
+RAW_RESUME = """JANE DOE
+jane@example.com | +91 98765 43210
+Page 1 of 2
+
+EXPERIENCE
+•   Built    payment   services  in Go
+JANE DOE
+jane@example.com | +91 98765 43210
+Page 2 of 2
+SKILLS
+Go, Kafka, AWS
+"""
+
+
+class TestResumeContext(unittest.TestCase):
+
+    def setUp(self):
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=False)
+        self.engine.model = MagicMock()
+        response = MagicMock()
+        response.text = "ok"
+        self.engine.model.generate_content.return_value = response
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_digest_drops_page_markers_and_repeated_headers(self):
+        digest = build_resume_digest(RAW_RESUME)
+        self.assertNotIn("Page 1", digest)
+        self.assertEqual(digest.count("JANE DOE"), 1)
+        self.assertIn("- Built payment services in Go", digest)
+        self.assertLess(len(digest), len(RAW_RESUME))
+
+    def test_digest_keeps_repeated_titles_and_bullets(self):
+        resume = RAW_RESUME.replace("EXPERIENCE\n", "EXPERIENCE\nSoftware Engineer\nAcme\n- Improved test coverage\n"
+                                    "Software Engineer\nGlobex\n• Improved test coverage\n")
+        digest = build_resume_digest(resume)
+        self.assertEqual(digest.count("Software Engineer"), 2)
+        self.assertEqual(digest.count("- Improved test coverage"), 2)
+        self.assertEqual(digest.count("JANE DOE"), 1)
+        single_page = "Software Engineer\nAcme\nSoftware Engineer\nGlobex"
+        self.assertEqual(build_resume_digest(single_page), single_page)
+
+    def test_prompts_use_session_digest(self):
+        self.engine.start_resume_session(RAW_RESUME)
+        self.engine.generate_cover_letter(RAW_RESUME, "Backend JD")
+        prompt = self.engine.model.generate_content.call_args[0][0]
+        self.assertNotIn("Page 2 of 2", prompt)
+        self.assertIn("Built payment services in Go", prompt)
+
+    def test_unregistered_text_is_inlined_unchanged(self):
+        self.engine.generate_cover_letter(RAW_RESUME, "Backend JD")
+        prompt = self.engine.model.generate_content.call_args[0][0]
+        self.assertIn("Page 2 of 2", prompt)
+
+    def test_provider_context_routes_to_cached_model(self):
+        cached_model = MagicMock()
+        cached_model.generate_content.return_value = self.engine.model.generate_content.return_value
+        context = ResumeContext(RAW_RESUME, build_resume_digest(RAW_RESUME), mode="provider", model=cached_model)
+        self.engine.resume_contexts.put(context)
+
+        self.engine.optimize_naukri_profile(RAW_RESUME, "Backend Engineer")
+        prompt = cached_model.generate_content.call_args[0][0]
+        self.assertIn(context.reference, prompt)
+        self.assertNotIn("Built payment services", prompt)
+        self.engine.model.generate_content.assert_not_called()
+
+    def test_expired_provider_context_is_refreshed(self):
+        cached_model = MagicMock()
+        cached_model.generate_content.return_value = self.engine.model.generate_content.return_value
+        context = ResumeContext(RAW_RESUME, build_resume_digest(RAW_RESUME), mode="provider",
+                                cached_content=MagicMock(), model=cached_model, expires_at=time.time() - 1)
+        self.engine.resume_contexts.put(context)
+
+        self.assertIs(self.engine.start_resume_session(RAW_RESUME), context)
+        context.cached_content.update.assert_called_once()
+        self.assertGreater(context.expires_at, time.time() + 30 * 60)
+        self.engine.optimize_naukri_profile(RAW_RESUME, "Backend Engineer")
+        self.assertIn(context.reference, cached_model.generate_content.call_args[0][0])
+
+    def test_expired_provider_context_falls_back_to_digest(self):
+        cached_model = MagicMock()
+        context = ResumeContext(RAW_RESUME, build_resume_digest(RAW_RESUME), mode="provider",
+                                cached_content=MagicMock(), model=cached_model)
+        context.cached_content.update.side_effect = RuntimeError("CachedContent not found")
+        self.engine.resume_contexts.put(context)
+        # A prompt built while the cache was live, sent after it lapsed
+        prompt_ref = self.engine._resume_ref(RAW_RESUME)
+        context.expires_at = time.time() - 1
+
+        with patch("builtins.print"):
+            self.engine.generate_content(f"Rewrite this resume: {prompt_ref}")
+        prompt = self.engine.model.generate_content.call_args[0][0]
+        self.assertIn("Built payment services in Go", prompt)
+        self.assertNotIn(context.provider_reference, prompt)
+        cached_model.generate_content.assert_not_called()
+        self.assertEqual((context.mode, context.degraded), ("digest", True))
+
+        # The next session start rebuilds rather than keeping the degraded context
+        self.assertIsNot(self.engine.start_resume_session(RAW_RESUME), context)
+
+
+if __name__ == '__main__':
+    unittest.main()
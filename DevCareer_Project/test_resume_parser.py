@@ -0,0 +1,158 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_metrics import METRICS
+from core_engine.output_schemas import RESUME_SCHEMA, validate
+from core_engine.resume_parser import parse_resume_local, low_confidence_fields, split_sections
+
+SAMPLE_RESUME = """Jane Doe
+Bangalore, India | jane.doe@example.com | +91 98765 43210
+linkedin.com/in/janedoe | janedoe.dev
+
+SUMMARY
+Backend engineer with 6 years of experience building distributed payment systems in Go and Python.
+
+WORK EXPERIENCE
+Senior Software Engineer
+Acme Payments
+Jan 2021 - Present
+Bangalore, India
+• Led migration of the ledger service to Go, cutting p99 latency by 40%.
+• Built an event pipeline on Kafka processing 2M
+events per day.
+Software Engineer at Initech | Jun 2018 – Dec 2020
+- Maintained the billing API.
+
+PROJECTS
+Ledger Viz | React, D3
+- Visualizes double-entry ledgers.
+
+EDUCATION
+Indian Institute of Technology Delhi
+B.Tech in Computer Science, 2014 - 2018
+
+TECHNICAL SKILLS
+Go, Python, Kafka, PostgreSQL
+Docker | Kubernetes
+
+Languages
+English, Hindi
+"""
+
+
+def _response(payload):
+    response = MagicMock()
+    response.text = json.dumps(payload)
+    return response
+
+
+class TestLocalResumeParser(unittest.TestCase):
+
+    def test_sections_and_fields(self):
+        data, confidence = parse_resume_local(SAMPLE_RESUME)
+        self.assertEqual(validate(data, RESUME_SCHEMA)[1], [])
+        self.assertEqual(data["contact"]["name"], "Jane Doe")
+        self.assertEqual(data["contact"]["email"], "jane.doe@example.com")
+        self.assertEqual(data["contact"]["phone"], "+91 98765 43210")
+        self.assertEqual(data["contact"]["location"], "Bangalore, India")
+        self.assertEqual(data["contact"]["linkedin"], "linkedin.com/in/janedoe")
+
+        first, second = data["experience"]
+        self.assertEqual((first["title"], first["company"], first["dates"]),
+                         ("Senior Software Engineer", "Acme Payments", "Jan 2021 - Present"))
+        self.assertEqual(first["location"], "Bangalore, India")
+        # Wrapped bullet lines are joined back together
+        self.assertIn("<li>Built an event pipeline on Kafka processing 2M events per day.</li>", first["description"])
+        self.assertEqual((second["title"], second["company"], second["dates"]),
+                         ("Software Engineer", "Initech", "Jun 2018 - Dec 2020"))
+
+        self.assertEqual(data["projects"][0]["tech_stack"], "React, D3")
+        self.assertEqual(data["education"], [{
+            "school": "Indian Institute of Technology Delhi", "degree": "B.Tech in Computer Science", "dates": "2014 - 2018"
+        }])
+        self.assertEqual(data["skills"], "Go, Python, Kafka, PostgreSQL, Docker, Kubernetes")
+        self.assertEqual(data["languages"], "English, Hindi")
+        self.assertEqual(low_confidence_fields(confidence), [])
+
+    def test_linkedin_export_layout(self):
+        export = (
+            "Contact\njane.doe@example.com\nwww.linkedin.com/in/janedoe (LinkedIn)\n"
+            "Top Skills\nGo\nKafka\nPostgreSQL\nLanguages\nEnglish (Native or Bilingual)\n"
+            "Jane Doe\nSenior Backend Engineer at Acme\nBangalore, Karnataka, India\n"
+            "Summary\nBackend engineer with 6 years of experience building payment systems.\n"
+            "Experience\nAcme Payments\nSenior Software Engineer\n"
+            "January 2021 - Present (3 years 2 months)\nBangalore, Karnataka, India\nLed the ledger migration.\n"
+            "Page 1 of 2\n"
+        )
+        data, confidence = parse_resume_local(export)
+        self.assertEqual(data["contact"]["name"], "Jane Doe")
+        self.assertEqual(data["contact"]["location"], "Bangalore, Karnataka, India")
+        self.assertEqual(data["languages"], "English")
+        job = data["experience"][0]
+        self.assertEqual((job["title"], job["company"]), ("Senior Software Engineer", "Acme Payments"))
+        self.assertEqual(job["description"], "<ul><li>Led the ledger migration.</li></ul>")
+
+    def test_missing_core_sections_are_low_confidence(self):
+        data, confidence = parse_resume_local("Jane Doe\njane@example.com\n\nSkills\nGo")
+        self.assertEqual(sorted(low_confidence_fields(confidence)), ["education", "experience", "skills", "summary"])
+        # Absent optional sections are trusted to be empty
+        self.assertGreaterEqual(confidence["certifications"], 0.6)
+
+    def test_header_aliases(self):
+        _, sections = split_sections("Professional Experience:\nx\nLicenses & Certifications\ny\nTop Skills\nz")
+        self.assertEqual(list(sections), ["experience", "certifications", "skills"])
+
+    def test_is_fast(self):
+        text = SAMPLE_RESUME * 5
+        start = time.perf_counter()
+        for _ in range(20):
+            parse_resume_local(text)
+        self.assertLess((time.perf_counter() - start) / 20, 0.05)
+
+
+class TestParseResumeJson(unittest.TestCase):
+
+    def setUp(self):
+        METRICS.reset()
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine(api_key="fake", cache=False)
+        self.engine.model = MagicMock()
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_confident_resume_needs_no_model_call(self):
+        data = self.engine.parse_resume_json(SAMPLE_RESUME)
+        self.engine.model.generate_content.assert_not_called()
+        self.assertEqual(data["contact"]["name"], "Jane Doe")
+        self.assertEqual(METRICS.snapshot()["parse_resume_json"]["devcareer_resume_local_fields_total"], 8)
+
+    def test_only_low_confidence_fields_are_requested(self):
+        resume = SAMPLE_RESUME.replace("SUMMARY\nBackend engineer", "Backend engineer")
+        self.engine.model.generate_content.return_value = _response({"summary": "Polished summary."})
+        data = self.engine.parse_resume_json(resume)
+
+        config = self.engine.model.generate_content.call_args.kwargs["generation_config"]
+        self.assertEqual(list(config["response_schema"]["properties"]), ["summary"])
+        self.assertIn("ONLY these fields: summary", self.engine.model.generate_content.call_args[0][0])
+        self.assertEqual(data["summary"], "Polished summary.")
+        self.assertEqual(data["experience"][0]["company"], "Acme Payments")
+
+    def test_model_failure_keeps_local_result(self):
+        self.engine.model.generate_content.return_value = _response("no json here")
+        data = self.engine.parse_resume_json("Jane Doe\njane@example.com")
+        self.assertEqual(data["contact"]["email"], "jane@example.com")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import time
+import tempfile
+import threading
+import subprocess
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core_engine import ai_logic
+from core_engine.ai_logic import IntelligenceEngine
+from core_engine.llm_metrics import METRICS
+from core_engine.response_cache import ResponseCache
+from core_engine.single_flight import SingleFlight, fcntl
+
+
+def _run_together(fn, count):
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def _worker(i):
+        barrier.wait()
+        results[i] = fn()
+    threads = [threading.Thread(target=_worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+
+        def _slow():
+            calls.append(1)
+            time.sleep(0.1)
+            return "answer"
+        results = _run_together(lambda: flight.do("k", _slow), 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r[0] for r in results], ["answer"] * 5)
+        self.assertEqual(sum(shared for _, shared in results), 4)
+        self.assertEqual(flight.get_stats()["coalesced"], 4)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_errors_reach_every_waiter_and_are_not_remembered(self):
+        flight = SingleFlight()
+
+        def _fail():
+            time.sleep(0.05)
+            raise TimeoutError("upstream timed out")
+        errors = []
+
+        def _call():
+            try:
+                flight.do("k", _fail)
+            except TimeoutError as e:
+                errors.append(e)
+        _run_together(_call, 3)
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(flight.do("k", lambda: "recovered"), ("recovered", False))
+
+    @unittest.skipIf(fcntl is None, "cross-process coalescing needs fcntl")
+    def test_cross_process_waiter_reuses_cached_result(self):
+        lock_dir = tempfile.mkdtemp()
+        holder = subprocess.Popen([sys.executable, "-c", (
+            "import fcntl, sys, time, os\n"
+            f"h = open(os.path.join({lock_dir!r}, 'k.lock'), 'a+')\n"
+            "fcntl.flock(h, fcntl.LOCK_EX)\n"
+            "print('locked', flush=True)\n"
+            "time.sleep(0.3)\n"
+        )], stdout=subprocess.PIPE, text=True)
+        self.assertEqual(holder.stdout.readline().strip(), "locked")
+        flight = SingleFlight(lock_dir)
+        result = flight.do("k", lambda: "own call", lookup=lambda: "from other process")
+        holder.wait()
+        self.assertEqual(result, ("from other process", True))
+        self.assertEqual(flight.get_stats()["cross_process_coalesced"], 1)
+
+
+class TestEngineCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        METRICS.reset()
+        self.genai_patch = patch.object(ai_logic, "genai", MagicMock())
+        self.genai_patch.start()
+        self.engine = IntelligenceEngine("fake_key", cache=ResponseCache(), single_flight=SingleFlight())
+        self.engine.model = MagicMock()
+
+        def _slow(prompt, **kwargs):
+            time.sleep(0.1)
+            response = MagicMock()
+            response.text = "Hire this person"
+            return response
+        self.engine.model.generate_content.side_effect = _slow
+
+    def tearDown(self):
+        self.genai_patch.stop()
+
+    def test_double_click_makes_one_upstream_call(self):
+        results = _run_together(lambda: self.engine.check_ats_score("resume", "jd", "India"), 4)
+        self.assertEqual(results, ["Hire this person"] * 4)
+        self.assertEqual(self.engine.model.generate_content.call_count, 1)
+        self.assertEqual(METRICS.snapshot()["check_ats_score"]["devcareer_llm_coalesced_total"], 3)
+
+    def test_duplicate_prompts_in_a_batch_share_a_call(self):
+        results = self.engine.batch_generate(["same prompt"] * 3 + ["other prompt"], max_concurrency=4, rpm=600)
+        self.assertTrue(all(r["status"] == "ok" for r in results))
+        self.assertEqual(self.engine.model.generate_content.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
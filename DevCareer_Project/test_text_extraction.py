@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import io
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fpdf import FPDF
+from docx import Document
+from core_engine import text_extraction
+from core_engine.text_extraction import TextExtractionService, UnsupportedFileError, detect_kind, PDF_TYPE, DOCX_TYPE
+from core_engine.response_cache import ResponseCache
+from core_engine.single_flight import SingleFlight
+
+
+def _make_pdf(text):
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=10)
+    pdf.add_page()
+    pdf.multi_cell(0, 5, text)
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def _make_docx(*paragraphs):
+    doc = Document()
+    for para in paragraphs:
+        doc.add_paragraph(para)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class TestTextExtraction(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.disk_path = os.path.join(self.tmp.name, "text.sqlite3")
+        self.service = self._service()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _service(self):
+        return TextExtractionService(ResponseCache(disk_path=self.disk_path, ttl_seconds=None), SingleFlight())
+
+    def test_detect_kind(self):
+        pdf, docx = _make_pdf("x"), _make_docx("x")
+        self.assertEqual(detect_kind(pdf, PDF_TYPE), "pdf")
+        self.assertEqual(detect_kind(docx, DOCX_TYPE), "docx")
+        self.assertEqual(detect_kind(pdf, "application/octet-stream"), "pdf")
+        self.assertEqual(detect_kind(b"hello", filename="cv.docx"), "docx")
+        self.assertIsNone(detect_kind(b"hello", "text/plain"))
+
+    def test_pdf_and_docx_text(self):
+        self.assertIn("Senior Engineer", self.service.extract(_make_pdf("Senior Engineer"), PDF_TYPE))
+        self.assertEqual(self.service.extract(_make_docx("Line one", "Line two"), DOCX_TYPE), "Line one\nLine two\n")
+        with self.assertRaises(UnsupportedFileError):
+            self.service.extract(b"plain text", "text/plain")
+
+    def test_parsed_once_across_callers_and_restarts(self):
+        pdf_bytes = _make_pdf("Cached resume")
+        with patch.object(text_extraction, "extract_pdf_text", wraps=text_extraction.extract_pdf_text) as parse:
+            first = self.service.extract(pdf_bytes, PDF_TYPE)
+            # Same bytes through a different path (file-like upload) hit memory
+            self.assertEqual(self.service.extract(io.BytesIO(pdf_bytes), PDF_TYPE), first)
+            # A fresh process (new service, same disk tier) hits disk
+            restarted = self._service()
+            self.assertEqual(restarted.extract(pdf_bytes, PDF_TYPE), first)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(restarted.get_stats()["disk_hits"], 1)
+
+    def test_concurrent_requests_parse_once(self):
+        docx_bytes = _make_docx("Concurrent")
+        barrier = threading.Barrier(8)
+        results = []
+
+        def _worker():
+            barrier.wait()
+            results.append(self.service.extract(docx_bytes, DOCX_TYPE))
+        with patch.object(text_extraction, "_docx_text", wraps=text_extraction._docx_text) as parse:
+            threads = [threading.Thread(target=_worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(results, ["Concurrent\n"] * 8)
+        self.assertLessEqual(parse.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(Exception):
+            self.service.extract(b"%PDF-1.4 broken", PDF_TYPE)
+        self.assertEqual(self.service.get_stats()["writes"], 0)
+
+    def test_file_processor_and_engine_share_service(self):
+        from utils.file_processor import extract_text_from_file
+        from core_engine.ai_logic import IntelligenceEngine
+        pdf_bytes = _make_pdf("Shared upload")
+        with patch.object(text_extraction, "_default", self.service):
+            tab_text = extract_text_from_file(pdf_bytes, PDF_TYPE)
+            engine = IntelligenceEngine(api_key="fake", cache=False)
+            self.assertEqual(engine.parse_pdf(io.BytesIO(pdf_bytes)), tab_text)
+            self.assertEqual(extract_text_from_file(b"notes", "text/plain"), "")
+        self.assertEqual(self.service.get_stats()["memory_hits"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
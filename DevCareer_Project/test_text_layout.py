@@ -0,0 +1,71 @@
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import ImageFont
+
+from core_engine.text_layout import ELLIPSIS, text_width, wrap_text, fit_text
+
+FONTS = {}
+
+
+def font(size):
+    if size not in FONTS:
+        FONTS[size] = ImageFont.load_default(size)
+    return FONTS[size]
+
+
+HOOK = "Senior Backend Engineer building payment rails that settle millions of transactions a day"
+
+
+class TestTextLayout(unittest.TestCase):
+
+    def test_text_width_matches_font(self):
+        f = font(28)
+        for text in ("Hello", "Distributed Systems", "iiiiWWWW"):
+            self.assertAlmostEqual(text_width(text, f), f.getlength(text), delta=len(text))
+
+    def test_wrap_fits_width_and_keeps_words(self):
+        f = font(28)
+        lines = wrap_text(HOOK, f, 400)
+        self.assertGreater(len(lines), 1)
+        for line in lines:
+            self.assertLessEqual(f.getlength(line), 400 + len(line))
+        self.assertEqual(" ".join(lines).split(), HOOK.split())
+        # Proportional glyphs: narrow letters pack more characters per line than wide ones
+        self.assertGreater(len(wrap_text("ill " * 40, f, 400)[0]), len(wrap_text("WWW " * 40, f, 400)[0]))
+
+    def test_wrap_keeps_newlines_and_splits_long_words(self):
+        f = font(20)
+        self.assertEqual(wrap_text("Before\nAfter", f, 500), ("Before", "After"))
+        lines = wrap_text("x " + "A" * 80, f, 200)
+        self.assertEqual(lines[0], "x")
+        self.assertEqual("".join(lines[1:]), "A" * 80)
+        self.assertTrue(all(text_width(line, f) <= 200 for line in lines))
+
+    def test_fit_text_picks_largest_fitting_size(self):
+        f, lines, line_height = fit_text(HOOK, font, 870, max_lines=2, min_size=10, max_size=48)
+        size = f.size
+        self.assertLessEqual(len(lines), 2)
+        self.assertEqual(line_height, round(size * 1.25))
+        if size < 48:
+            self.assertGreater(len(wrap_text(HOOK, font(size + 1), 870)), 2)
+        short, lines, _ = fit_text("Hi", font, 870, max_lines=2, min_size=10, max_size=48)
+        self.assertEqual((short.size, lines), (48, ("Hi",)))
+
+    def test_fit_text_ellipsizes_when_nothing_fits(self):
+        f, lines, _ = fit_text(HOOK * 3, font, 300, max_lines=2, min_size=20, max_size=28)
+        self.assertEqual(f.size, 20)
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[-1].endswith(ELLIPSIS))
+        self.assertLessEqual(text_width(lines[-1], f), 300)
+
+        _, lines, line_height = fit_text(HOOK * 3, font, 300, max_height=100, min_size=20, max_size=28)
+        self.assertLessEqual(len(lines) * line_height, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,14 @@
-import streamlit as st
-from pypdf import PdfReader
-from docx import Document
-import io
+from core_engine.text_extraction import default_extraction_service, UnsupportedFileError
+
 
-@st.cache_data
 def extract_text_from_file(file_bytes, file_type):
-    text = ""
+    """
+    Text of an uploaded PDF/DOCX. Parsed once per file (by content hash) for every tab;
+    see core_engine.text_extraction.
+    """
     try:
-        if file_type == "application/pdf":
-            reader = PdfReader(io.BytesIO(file_bytes))
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-        elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            doc = Document(io.BytesIO(file_bytes))
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+        return default_extraction_service().extract(file_bytes, file_type)
+    except UnsupportedFileError:
+        return ""
     except Exception as e:
         return f"Error reading file: {e}"
-    return text